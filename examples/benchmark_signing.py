@@ -0,0 +1,70 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: benchmark_signing.py
+"""
+Microbenchmark of proxy relay request signing.
+
+Compares the per-call path (hex round trips + new eth_keys key per signature)
+with the cached ``Signer`` on each available backend. Install coincurve
+(``pip install poly-web3[fast]``) to get the libsecp256k1 backend.
+
+    python examples/benchmark_signing.py [iterations]
+"""
+import sys
+import timeit
+
+from eth_utils import to_bytes
+
+from poly_web3.signature import secp256k1
+from poly_web3.signature.build import create_struct_hash
+from poly_web3.signature.hash_message import hash_message
+
+PRIVATE_KEY = "0x" + "4c" * 32
+STRUCT_ARGS = (
+    "0x" + "11" * 20,
+    "0x" + "22" * 20,
+    "0x" + "ab" * 196,
+    "0",
+    "30000000000",
+    "250000",
+    "7",
+    "0x" + "33" * 20,
+    "0x" + "44" * 20,
+)
+
+
+def sign_per_call() -> str:
+    tx_hash = create_struct_hash(*STRUCT_ARGS)
+    message = {"raw": list(to_bytes(hexstr=tx_hash))}
+    r, s, recovery = secp256k1.sign(hash_message(message)[2:], PRIVATE_KEY)
+    return secp256k1.serialize_signature(
+        r=secp256k1.int_to_hex(r, 32),
+        s=secp256k1.int_to_hex(s, 32),
+        v=28 if recovery else 27,
+        yParity=recovery,
+    )
+
+
+def signer_fn(signer: secp256k1.Signer):
+    def sign_cached() -> str:
+        return signer.sign_message(create_struct_hash(*STRUCT_ARGS, output="bytes"))
+
+    return sign_cached
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    cases = {"per-call eth_keys": sign_per_call}
+    backends = ["eth_keys"] + (["coincurve"] if secp256k1.coincurve is not None else [])
+    for backend in backends:
+        cases[f"cached {backend}"] = signer_fn(secp256k1.Signer(PRIVATE_KEY, backend=backend))
+
+    expected = sign_per_call()
+    baseline = None
+    for name, fn in cases.items():
+        assert fn() == expected, f"{name} produced a different signature"
+        seconds = min(timeit.repeat(fn, number=iterations, repeat=3))
+        per_call_us = seconds / iterations * 1e6
+        baseline = baseline or per_call_us
+        print(f"{name:<20} {per_call_us:9.1f} us/sign  {baseline / per_call_us:5.1f}x")
@@ -4,35 +4,97 @@
 # @Site:
 # @File: __init__.py.py
 # @Software: PyCharm
-from typing import Any, Union
-
-from py_builder_relayer_client.client import RelayClient
-
-from poly_web3.clob_compat import get_clob_signature_type
-from poly_web3.const import RELAYER_URL
-from poly_web3.web3_service.base import BaseWeb3Service
-from poly_web3.schema import (
-    MergeAllResult,
-    MergeErrorItem,
-    MergePlanItem,
-    MergeSuccessItem,
-    RedeemErrorItem,
-    RedeemResult,
-    WalletType,
-)
-from poly_web3.web3_service import (
-    DepositWalletWeb3Service,
-    EOAWeb3Service,
-    ProxyWeb3Service,
-    SafeWeb3Service,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Union
+
+if TYPE_CHECKING:
+    from py_builder_relayer_client.client import RelayClient
+
+    from poly_web3.web3_service import (
+        DepositWalletWeb3Service,
+        EOAWeb3Service,
+        ProxyWeb3Service,
+        SafeWeb3Service,
+    )
+    from poly_web3.web3_service.gas_batcher import GasModel
+    from poly_web3.web3_service.relayer_quota import RelayerQuotaTracker
+    from poly_web3.web3_service.relayer_status import RelayerStatusTracker
+    from poly_web3.web3_service.resolution_cache import ResolutionCache
+    from poly_web3.web3_service.transport import HttpTransport
+
+# Public names are imported on first access, so ``import poly_web3`` does not
+# pull in web3, pydantic or the relayer client until something needs them.
+_LAZY_ATTRS = {
+    "RELAYER_URL": "poly_web3.const",
+    "BaseWeb3Service": "poly_web3.web3_service.base",
+    "DryRunResult": "poly_web3.schema",
+    "FleetMergeAllResult": "poly_web3.schema",
+    "FleetRedeemResult": "poly_web3.schema",
+    "MergeAllResult": "poly_web3.schema",
+    "ScheduledSubmitResult": "poly_web3.schema",
+    "TransactionPlanResult": "poly_web3.schema",
+    "MergeErrorItem": "poly_web3.schema",
+    "MergePlanItem": "poly_web3.schema",
+    "MergeSuccessItem": "poly_web3.schema",
+    "RedeemErrorItem": "poly_web3.schema",
+    "RedeemResult": "poly_web3.schema",
+    "WalletType": "poly_web3.schema",
+    "DepositWalletWeb3Service": "poly_web3.web3_service",
+    "EOAWeb3Service": "poly_web3.web3_service",
+    "FleetWeb3Service": "poly_web3.web3_service",
+    "ProxyWeb3Service": "poly_web3.web3_service",
+    "SafeWeb3Service": "poly_web3.web3_service",
+    "GasModel": "poly_web3.web3_service.gas_batcher",
+    "PositionIndex": "poly_web3.web3_service.position_index",
+    "RelayerQuotaTracker": "poly_web3.web3_service.relayer_quota",
+    "RelayerStatusTracker": "poly_web3.web3_service.relayer_status",
+    "ResolutionCache": "poly_web3.web3_service.resolution_cache",
+    "ResolutionWatcher": "poly_web3.web3_service.resolution_watcher",
+    "RpcEndpointPool": "poly_web3.web3_service.rpc_pool",
+    "SubmissionScheduler": "poly_web3.web3_service.submit_scheduler",
+    "SubmissionHandle": "poly_web3.web3_service.submission",
+    "TransactionPlan": "poly_web3.web3_service.transaction_plan",
+    "HttpTransport": "poly_web3.web3_service.transport",
+}
+
+__all__ = ["PolyWeb3Service", *_LAZY_ATTRS]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 
 def PolyWeb3Service(
     clob_client: Any,
-    relayer_client: RelayClient = None,
-    rpc_url: str | None = None,
-) -> Union[SafeWeb3Service, EOAWeb3Service, ProxyWeb3Service, DepositWalletWeb3Service]:  # noqa
+    relayer_client: "RelayClient" = None,
+    rpc_url: str | list[str] | None = None,
+    resolution_cache: "ResolutionCache | None" = None,
+    pipeline_depth: int = 1,
+    quota_tracker: "RelayerQuotaTracker | None" = None,
+    batch_gas_limit: int | None = None,
+    gas_model: "GasModel | None" = None,
+    isolate_failed_batches: bool = False,
+    transport: "HttpTransport | None" = None,
+    status_tracker: "RelayerStatusTracker | None" = None,
+) -> Union["SafeWeb3Service", "EOAWeb3Service", "ProxyWeb3Service", "DepositWalletWeb3Service"]:  # noqa
+    from poly_web3.clob_compat import get_clob_signature_type
+    from poly_web3.schema import WalletType
+    from poly_web3.web3_service import (
+        DepositWalletWeb3Service,
+        EOAWeb3Service,
+        ProxyWeb3Service,
+        SafeWeb3Service,
+    )
+
     services = {
         WalletType.EOA: EOAWeb3Service,
         WalletType.PROXY: ProxyWeb3Service,
@@ -42,6 +104,18 @@ def PolyWeb3Service(
 
     wallet_type = WalletType.get_with_code(get_clob_signature_type(clob_client))
     if service := services.get(wallet_type):
-        return service(clob_client, relayer_client, rpc_url=rpc_url)
+        return service(
+            clob_client,
+            relayer_client,
+            rpc_url=rpc_url,
+            resolution_cache=resolution_cache,
+            pipeline_depth=pipeline_depth,
+            quota_tracker=quota_tracker,
+            batch_gas_limit=batch_gas_limit,
+            gas_model=gas_model,
+            isolate_failed_batches=isolate_failed_batches,
+            transport=transport,
+            status_tracker=status_tracker,
+        )
     else:
         raise Exception(f"Unknown wallet type: {wallet_type}")
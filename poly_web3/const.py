@@ -4,8 +4,6 @@
 # @Site:
 # @File: const.py
 # @Software: PyCharm
-from eth_utils import to_checksum_address
-
 GET_NONCE = "/nonce"
 GET_RELAY_PAYLOAD = "/relay-payload"
 GET_TRANSACTION = "/transaction"
@@ -18,6 +16,7 @@ DATA_API_POSITIONS_URL = f"{DATA_API_URL}{DATA_API_POSITIONS_PATH}"
 GAMMA_API_URL = "https://gamma-api.polymarket.com"
 GAMMA_MARKETS_PATH = "/markets"
 GAMMA_MARKETS_URL = f"{GAMMA_API_URL}{GAMMA_MARKETS_PATH}"
+GAMMA_MAX_CONDITION_IDS_PER_REQUEST = 50
 RPC_URL = "https://polygon-bor.publicnode.com"  # "https://polygon-rpc.com"
 RELAYER_URL = "https://relayer-v2.polymarket.com"
 HTTP_REQUEST_TIMEOUT_SECONDS = 10
@@ -29,33 +28,23 @@ STATE_INVALID = "STATE_INVALID"
 STATE_CONFIRMED = "STATE_CONFIRMED"
 STATE_FAILED = "STATE_FAILED"
 
-# address
-CTF_ADDRESS = to_checksum_address("0x4d97dcd97ec945f40cf65f87097ace5ea0476045")
-USDC_POLYGON = to_checksum_address("0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174")
-PUSD_POLYGON = to_checksum_address("0xC011a7E12a19f7B1f670d46F03B03f3342E82DFB")
+# address (EIP-55 checksummed literals, so importing const needs no eth_utils)
+CTF_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"
+USDC_POLYGON = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
+PUSD_POLYGON = "0xC011a7E12a19f7B1f670d46F03B03f3342E82DFB"
 EXCHANGE_COLLATERAL_TOKEN = PUSD_POLYGON
 CTF_COLLATERAL_TOKEN = USDC_POLYGON
 DEFAULT_COLLATERAL_TOKEN = EXCHANGE_COLLATERAL_TOKEN
-EXCHANGE_V2_ADDRESS = to_checksum_address("0xE111180000d2663C0091e4f400237545B87B996B")
-NEG_RISK_EXCHANGE_V2_ADDRESS = to_checksum_address(
-    "0xe2222d279d744050d28e00520010520000310F59"
-)
-CTF_COLLATERAL_ADAPTER_ADDRESS = to_checksum_address(
-    "0xada100874d00e3331d00f2007a9c336a65009718"
-)
-NEG_RISK_CTF_COLLATERAL_ADAPTER_ADDRESS = to_checksum_address(
-    "0xada200001000ef00d07553cee7006808f895c6f1"
-)
-PUSD_WRAPPER_ADDRESS = to_checksum_address(
-    "0x93070a847efef7f70739046a929d47a521f5b8ee"
-)
-NEG_RISK_ADAPTER_ADDRESS = to_checksum_address(
-    "0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296"
-)
+EXCHANGE_V2_ADDRESS = "0xE111180000d2663C0091e4f400237545B87B996B"
+NEG_RISK_EXCHANGE_V2_ADDRESS = "0xe2222d279d744050d28e00520010520000310F59"
+CTF_COLLATERAL_ADAPTER_ADDRESS = "0xADa100874d00e3331D00F2007a9c336a65009718"
+NEG_RISK_CTF_COLLATERAL_ADAPTER_ADDRESS = "0xAdA200001000ef00D07553cEE7006808F895c6F1"
+PUSD_WRAPPER_ADDRESS = "0x93070a847efEf7F70739046A929D47a521F5B8ee"
+NEG_RISK_ADAPTER_ADDRESS = "0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296"
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_MAX_CALLS_PER_REQUEST = 200
 ZERO_BYTES32 = "0x" + "00" * 32
-proxy_factory_address = to_checksum_address(
-    "0xaB45c5A4B0c941a2F231C04C3f49182e1A254052"
-)
+proxy_factory_address = "0xaB45c5A4B0c941a2F231C04C3f49182e1A254052"
 SAFE_INIT_CODE_HASH = (
     "0x2bce2127ff07fb632d16c8347c4ebf501f4841168bed00d9e6ef715ddb6fcecf"
 )
@@ -87,6 +76,10 @@ POL = {
 }
 
 # abi
+# The write-call ABIs (CTF/NegRisk redeem, split and merge, ERC20 approve, pUSD
+# wrap, ProxyFactory proxy) are no longer used to encode txs: calldata.py does
+# that with precomputed selectors. They are kept for backwards compatibility
+# and as the reference the encoding tests compare against.
 CTF_ABI_REDEEM = [
     {
         "name": "redeemPositions",
@@ -290,6 +283,35 @@ CTF_ABI_PAYOUT = [
     },
 ]
 
+MULTICALL3_ABI_AGGREGATE3 = [
+    {
+        "name": "aggregate3",
+        "type": "function",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+    }
+]
+
 ERC20_ABI_BALANCE = [
     {
         "name": "balanceOf",
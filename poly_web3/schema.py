@@ -52,6 +52,41 @@ class RedeemResult(BaseModel):
         return condition_ids
 
 
+class ConditionPayoutState(BaseModel):
+    condition_id: str
+    payout_denominator: int = 0
+    payout_numerators: list[int] = Field(default_factory=list)
+    balances: dict[int, int] = Field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def resolved(self) -> bool:
+        return self.payout_denominator > 0
+
+    @property
+    def winning_indexes(self) -> list[int]:
+        if not self.resolved:
+            return []
+        return [i for i, numerator in enumerate(self.payout_numerators) if numerator > 0]
+
+    @property
+    def redeemable_index_and_balance(self) -> list[tuple]:
+        return [
+            (index, self.balances[index] / 1000000)
+            for index in self.winning_indexes
+            if self.balances.get(index, 0) > 0
+        ]
+
+    @property
+    def payout_amount(self) -> int:
+        if not self.resolved:
+            return 0
+        return sum(
+            self.balances.get(index, 0) * self.payout_numerators[index] // self.payout_denominator
+            for index in self.winning_indexes
+        )
+
+
 class BatchBinaryOperationItem(BaseModel):
     condition_id: str
     amount: int | float | str | Decimal
@@ -115,3 +150,86 @@ class MergeAllResult(BaseModel):
             seen.add(item.condition_id)
             condition_ids.append(item.condition_id)
         return condition_ids
+
+
+class DryRunBatchItem(BaseModel):
+    action: str
+    condition_ids: list[str]
+    success: bool
+    gas: int | None = None
+    error: str | None = None
+
+
+class DryRunConditionItem(BaseModel):
+    condition_id: str
+    action: str
+    success: bool
+    # gas of this condition's txs simulated on their own
+    gas: int | None = None
+    error: str | None = None
+
+
+class DryRunResult(BaseModel):
+    batch_list: list[DryRunBatchItem] = Field(default_factory=list)
+    condition_list: list[DryRunConditionItem] = Field(default_factory=list)
+
+    @computed_field
+    @property
+    def total_gas(self) -> int:
+        return sum(item.gas or 0 for item in self.batch_list if item.success)
+
+    @computed_field
+    @property
+    def error_condition_ids(self) -> list[str]:
+        return list(dict.fromkeys(
+            item.condition_id for item in self.condition_list if not item.success
+        ))
+
+
+class FleetRedeemResult(BaseModel):
+    results: dict[str, RedeemResult | DryRunResult] = Field(default_factory=dict)
+    # wallet -> error for wallets that failed or were skipped as a whole
+    error_wallets: dict[str, str] = Field(default_factory=dict)
+
+
+class FleetMergeAllResult(BaseModel):
+    results: dict[str, MergeAllResult | DryRunResult] = Field(default_factory=dict)
+    error_wallets: dict[str, str] = Field(default_factory=dict)
+
+
+class TransactionBundleSuccessItem(BaseModel):
+    actions: list[str]
+    condition_ids: list[str]
+    result: dict[str, Any]
+
+
+class TransactionBundleErrorItem(BaseModel):
+    actions: list[str]
+    condition_ids: list[str]
+    error: str
+
+
+class TransactionPlanResult(BaseModel):
+    success_list: list[TransactionBundleSuccessItem] = Field(default_factory=list)
+    error_list: list[TransactionBundleErrorItem] = Field(default_factory=list)
+
+    @computed_field
+    @property
+    def error_condition_ids(self) -> list[str]:
+        condition_ids: list[str] = []
+        seen: set[str] = set()
+        for item in self.error_list:
+            for condition_id in item.condition_ids:
+                if condition_id in seen:
+                    continue
+                seen.add(condition_id)
+                condition_ids.append(condition_id)
+        return condition_ids
+
+
+class ScheduledSubmitResult(TransactionPlanResult):
+    # relayer submissions sent by this flush
+    submitted_count: int = 0
+    # queued items left for a later flush (partial bundle or no quota left)
+    deferred_count: int = 0
+
@@ -72,7 +72,8 @@ def create_struct_hash(
     nonce: HexLike,
     relay_hub_address: str,
     relay_address: str,
-) -> str:
+    output: str = "hex",
+) -> str | bytes:
     def to_bytes(hex_like: HexLike, size: int | None = None) -> bytes:
         if isinstance(hex_like, int):
             length = (
@@ -110,4 +111,7 @@ def create_struct_hash(
             to_bytes(relay_address),
         ]
     )
-    return "0x" + keccak256(data_to_hash).hex()
+    digest = keccak256(data_to_hash)
+    if output == "bytes":
+        return digest
+    return "0x" + digest.hex()
@@ -0,0 +1,156 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @Site:
+# @File: ctf_ids.py
+# @Software: PyCharm
+"""
+Local derivation of Conditional Tokens collection and position IDs.
+
+Mirrors ``CTHelpers.getCollectionId`` / ``getPositionId`` from the Gnosis CTF
+contract: a collection ID is a compressed alt_bn128 point derived from
+``keccak256(conditionId, indexSet)`` (added to the parent collection point when
+the parent is non-zero), and a position ID is ``keccak256(collateral, collectionId)``.
+"""
+from functools import lru_cache
+
+from poly_web3.signature.build import keccak256
+
+# alt_bn128 field modulus and curve constant (y^2 = x^3 + 3)
+ALT_BN128_P = 0x30644E72E131A029B85045B68181585D97816A916871CA8D3C208C16D87CFD47
+ALT_BN128_B = 3
+_SQRT_EXPONENT = (ALT_BN128_P + 1) // 4
+_ODD_FLAG = 1 << 254
+_X_MASK = _ODD_FLAG - 1
+_CACHE_SIZE = 65536
+
+
+def _to_bytes(value: str | bytes, size: int) -> bytes:
+    if isinstance(value, bytes):
+        raw = value
+    else:
+        raw = bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    if len(raw) != size:
+        raise ValueError(f"expected {size} bytes, got {len(raw)}")
+    return raw
+
+
+def _normalize_hex(value: str | bytes, size: int) -> str:
+    return "0x" + _to_bytes(value, size).hex()
+
+
+def _ec_add(p1: tuple[int, int], p2: tuple[int, int]) -> tuple[int, int]:
+    # Affine addition matching the ecAdd precompile; (0, 0) is the point at infinity.
+    if p1 == (0, 0):
+        return p2
+    if p2 == (0, 0):
+        return p1
+    x1, y1 = p1
+    x2, y2 = p2
+    if x1 == x2:
+        if (y1 + y2) % ALT_BN128_P == 0:
+            return 0, 0
+        slope = 3 * x1 * x1 * pow(2 * y1, -1, ALT_BN128_P) % ALT_BN128_P
+    else:
+        slope = (y2 - y1) * pow(x2 - x1, -1, ALT_BN128_P) % ALT_BN128_P
+    x3 = (slope * slope - x1 - x2) % ALT_BN128_P
+    y3 = (slope * (x1 - x3) - y1) % ALT_BN128_P
+    return x3, y3
+
+
+def _curve_rhs(x: int) -> int:
+    return (x * x * x + ALT_BN128_B) % ALT_BN128_P
+
+
+def _select_y(y: int, odd: bool) -> int:
+    if odd != bool(y % 2):
+        return ALT_BN128_P - y
+    return y
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _collection_id(parent_collection_id: str, condition_id: str, index_set: int) -> str:
+    x1 = int.from_bytes(
+        keccak256(_to_bytes(condition_id, 32) + index_set.to_bytes(32, "big")),
+        "big",
+    )
+    odd = x1 >> 255 != 0
+    while True:
+        x1 = (x1 + 1) % ALT_BN128_P
+        yy = _curve_rhs(x1)
+        y1 = pow(yy, _SQRT_EXPONENT, ALT_BN128_P)
+        if y1 * y1 % ALT_BN128_P == yy:
+            break
+    y1 = _select_y(y1, odd)
+
+    x2 = int.from_bytes(_to_bytes(parent_collection_id, 32), "big")
+    if x2 != 0:
+        odd = x2 >> 254 != 0
+        x2 &= _X_MASK
+        yy = _curve_rhs(x2)
+        y2 = _select_y(pow(yy, _SQRT_EXPONENT, ALT_BN128_P), odd)
+        if y2 * y2 % ALT_BN128_P != yy:
+            raise ValueError("invalid parent collection ID")
+        x1, y1 = _ec_add((x1, y1), (x2, y2))
+
+    if y1 % 2 == 1:
+        x1 ^= _ODD_FLAG
+    return "0x" + x1.to_bytes(32, "big").hex()
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _position_id(collateral_token: str, collection_id: str) -> int:
+    return int.from_bytes(
+        keccak256(_to_bytes(collateral_token, 20) + _to_bytes(collection_id, 32)),
+        "big",
+    )
+
+
+def get_collection_id(
+    parent_collection_id: str | bytes, condition_id: str | bytes, index_set: int
+) -> str:
+    """Equivalent of ``ConditionalTokens.getCollectionId``; returns 0x-prefixed bytes32 hex."""
+    return _collection_id(
+        _normalize_hex(parent_collection_id, 32),
+        _normalize_hex(condition_id, 32),
+        int(index_set),
+    )
+
+
+def get_position_id(collateral_token: str | bytes, collection_id: str | bytes) -> int:
+    """Equivalent of ``ConditionalTokens.getPositionId``."""
+    return _position_id(
+        _normalize_hex(collateral_token, 20),
+        _normalize_hex(collection_id, 32),
+    )
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _outcome_position_id(
+    collateral_token: str,
+    parent_collection_id: str,
+    condition_id: str,
+    index_set: int,
+) -> int:
+    return _position_id(
+        collateral_token,
+        _collection_id(parent_collection_id, condition_id, index_set),
+    )
+
+
+def get_outcome_position_id(
+    collateral_token: str | bytes,
+    parent_collection_id: str | bytes,
+    condition_id: str | bytes,
+    index_set: int,
+) -> int:
+    """
+    ERC1155 token ID for one outcome slot, memoized on
+    ``(collateral, parent, condition, indexSet)``.
+    """
+    return _outcome_position_id(
+        _normalize_hex(collateral_token, 20),
+        _normalize_hex(parent_collection_id, 32),
+        _normalize_hex(condition_id, 32),
+        int(index_set),
+    )
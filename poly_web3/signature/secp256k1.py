@@ -7,6 +7,13 @@
 from eth_keys import keys
 from eth_utils import decode_hex
 
+from poly_web3.signature.hash_message import hash_message
+
+try:  # optional libsecp256k1 backend, much faster than eth_keys' pure Python one
+    import coincurve
+except ImportError:
+    coincurve = None
+
 SECP256K1_N = int(
     "0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141", 16
 )
@@ -27,6 +34,49 @@ def sign(hash_hex: str, priv_hex: str):
     return r, s, v
 
 
+class Signer:
+    """
+    Reusable signer that parses the private key once.
+
+    Hashes and signs raw bytes without hex round trips and uses coincurve when
+    it is installed, falling back to eth_keys. Signatures match ``sign`` +
+    ``serialize_signature``.
+    """
+
+    def __init__(self, priv_hex: str, backend: str | None = None):
+        if backend is None:
+            backend = "coincurve" if coincurve is not None else "eth_keys"
+        if backend not in ("coincurve", "eth_keys"):
+            raise ValueError(f"Unsupported signer backend: {backend}")
+        self.backend = backend
+        secret = decode_hex(priv_hex)
+        if backend == "coincurve":
+            self._key = coincurve.PrivateKey(secret)
+        else:
+            self._key = keys.PrivateKey(secret)
+
+    def sign_hash(self, msg_hash: bytes) -> tuple[int, int, int]:
+        """Sign a 32 byte digest and return low-s ``(r, s, recovery)``."""
+        if self.backend == "coincurve":
+            raw = self._key.sign_recoverable(msg_hash, hasher=None)
+            r, s, v = int.from_bytes(raw[:32], "big"), int.from_bytes(raw[32:64], "big"), raw[64]
+        else:
+            sig = self._key.sign_msg_hash(msg_hash)
+            r, s, v = sig.r, sig.s, sig.v
+        if s > HALF_N:
+            s = SECP256K1_N - s
+            v ^= 1
+        return r, s, v
+
+    def sign_message(self, message: bytes, to: str = "hex"):
+        """EIP-191 personal-sign ``message`` and return the 65 byte signature."""
+        r, s, recovery = self.sign_hash(hash_message({"raw": message}, to="bytes"))
+        signature = r.to_bytes(32, "big") + s.to_bytes(32, "big") + (b"\x1c" if recovery else b"\x1b")
+        if to == "hex":
+            return "0x" + signature.hex()
+        return signature
+
+
 def int_to_hex(n: int, size: int = 32) -> str:
     # size 是字节数，32 字节 -> 64 个 hex 字符
     return "0x" + n.to_bytes(size, "big").hex()
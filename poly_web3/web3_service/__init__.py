@@ -4,7 +4,28 @@
 # @Site:
 # @File: __init__.py
 # @Software: PyCharm
-from poly_web3.web3_service.eoa_service import EOAWeb3Service
-from poly_web3.web3_service.proxy_service import ProxyWeb3Service
-from poly_web3.web3_service.safe_service import SafeWeb3Service
-from poly_web3.web3_service.deposit_wallet_service import DepositWalletWeb3Service
\ No newline at end of file
+from importlib import import_module
+from typing import Any
+
+_LAZY_ATTRS = {
+    "EOAWeb3Service": "poly_web3.web3_service.eoa_service",
+    "ProxyWeb3Service": "poly_web3.web3_service.proxy_service",
+    "SafeWeb3Service": "poly_web3.web3_service.safe_service",
+    "DepositWalletWeb3Service": "poly_web3.web3_service.deposit_wallet_service",
+    "FleetWeb3Service": "poly_web3.web3_service.fleet_service",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -2,14 +2,19 @@
 # @Time: 2026-03-25
 # @Author: Codex
 # @File: api_client.py
-from typing import Any
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator
 
 import requests
 
 from poly_web3.const import (
     DATA_API_POSITIONS_URL,
     GAMMA_MARKETS_URL,
+    GAMMA_MAX_CONDITION_IDS_PER_REQUEST,
     GET_RELAY_PAYLOAD,
+    GET_TRANSACTION,
+    GET_TRANSACTIONS,
     HTTP_REQUEST_TIMEOUT_SECONDS,
     RELAYER_URL,
     RPC_URL,
@@ -17,20 +22,57 @@ from poly_web3.const import (
 )
 from poly_web3.log import logger
 from poly_web3.schema import WalletType
+from poly_web3.web3_service.market_cache import MarketCache
+from poly_web3.web3_service.rpc_pool import RpcEndpointPool, normalize_rpc_urls
+from poly_web3.web3_service.transport import HttpTransport
 
 
 class PolymarketAPIClient:
+    POSITIONS_PAGE_LIMIT = 500
+    # Most public RPC nodes cap JSON-RPC batch arrays at 50-100 calls.
+    RPC_MAX_BATCH_SIZE = 50
+
     def __init__(
             self,
-            rpc_url: str | None = None,
+            rpc_url: str | list[str] | None = None,
             relayer_url: str = RELAYER_URL,
-            timeout: int = HTTP_REQUEST_TIMEOUT_SECONDS,
+            timeout: int | None = None,
             session: requests.Session | None = None,
+            market_cache: MarketCache | None = None,
+            page_fetch_workers: int = 1,
+            rpc_pool: RpcEndpointPool | None = None,
+            transport: HttpTransport | None = None,
     ):
-        self.rpc_url = rpc_url or RPC_URL
+        if page_fetch_workers <= 0:
+            raise Exception("page_fetch_workers must be greater than 0")
+        rpc_urls = normalize_rpc_urls(rpc_url or RPC_URL)
+        self.rpc_url = rpc_urls[0]
         self.relayer_url = relayer_url.rstrip("/")
-        self.timeout = timeout
-        self.session = session or requests.Session()
+        # An explicit session keeps its own settings; otherwise share the
+        # process-wide transport so clients reuse warm connections.
+        if transport is None and session is None:
+            transport = HttpTransport.default()
+        self.transport = transport
+        self.session = session or transport.session
+        self.timeout = timeout or HTTP_REQUEST_TIMEOUT_SECONDS
+        # An explicit timeout applies to every endpoint class.
+        self.timeouts = (
+            dict(transport.timeouts) if transport is not None and timeout is None else {}
+        )
+        # Several RPC URLs get a failover pool; a single URL is posted to
+        # directly and retried by the transport instead.
+        if transport is not None and rpc_pool is None and len(rpc_urls) == 1:
+            transport.mount_rpc_url(self.rpc_url)
+        if rpc_pool is None and len(rpc_urls) > 1:
+            rpc_pool = RpcEndpointPool(
+                rpc_urls, session=self.session, timeout=self._timeout("rpc")
+            )
+        self.rpc_pool = rpc_pool
+        self.market_cache = market_cache or MarketCache()
+        self.page_fetch_workers = page_fetch_workers
+
+    def _timeout(self, endpoint_class: str) -> float:
+        return self.timeouts.get(endpoint_class, self.timeout)
 
     def fetch_redeemable_positions(self, user_address: str) -> list[dict]:
         params = {
@@ -45,7 +87,7 @@ class PolymarketAPIClient:
             response = self.session.get(
                 DATA_API_POSITIONS_URL,
                 params=params,
-                timeout=self.timeout,
+                timeout=self._timeout("data_api"),
             )
             response.raise_for_status()
             positions = response.json()
@@ -68,7 +110,7 @@ class PolymarketAPIClient:
             response = self.session.get(
                 DATA_API_POSITIONS_URL,
                 params=params,
-                timeout=self.timeout,
+                timeout=self._timeout("data_api"),
             )
             response.raise_for_status()
             positions = response.json()
@@ -89,32 +131,57 @@ class PolymarketAPIClient:
             extra_params={"mergeable": True},
         )
 
+    def iter_position_pages(
+            self, user_address: str, **filters: Any
+    ) -> Iterator[list[dict]]:
+        """
+        Lazily walk ``/positions`` and yield one page at a time, so callers
+        never hold the full position list. Extra ``filters`` (for example
+        ``mergeable=True``) are passed through as query parameters. A page
+        that fails to load raises, so a truncated stream is never mistaken
+        for the whole wallet.
+        """
+        limit = self.POSITIONS_PAGE_LIMIT
+        offset = 0
+        while True:
+            try:
+                page = self._fetch_positions_page(user_address, limit, offset, filters)
+            except Exception as exc:
+                logger.error(f"Failed to fetch positions page from API, offset={offset}: {exc}")
+                raise
+            if not page:
+                return
+            yield page
+            if len(page) < limit:
+                return
+            offset += limit
+
+    def iter_positions(self, user_address: str, **filters: Any) -> Iterator[dict]:
+        for page in self.iter_position_pages(user_address, **filters):
+            yield from page
+
     def _fetch_all_positions(
             self, user_address: str, extra_params: dict[str, Any]
     ) -> list[dict]:
-        limit = 500
-        offset = 0
-        positions: list[dict] = []
-
+        limit = self.POSITIONS_PAGE_LIMIT
         try:
-            while True:
-                params = {
-                    "user": user_address,
-                    "sizeThreshold": 1,
-                    "limit": limit,
-                    "offset": offset,
-                    "sortBy": "TOKENS",
-                    "sortDirection": "DESC",
-                }
-                params.update(extra_params)
-                response = self.session.get(
-                    DATA_API_POSITIONS_URL,
-                    params=params,
-                    timeout=self.timeout,
+            first_page = self._fetch_positions_page(user_address, limit, 0, extra_params)
+            if not first_page:
+                return []
+            positions: list[dict] = list(first_page)
+            if len(first_page) < limit:
+                return positions
+            if self.page_fetch_workers > 1:
+                positions.extend(
+                    self._fetch_remaining_pages_concurrently(
+                        user_address, limit, extra_params
+                    )
                 )
-                response.raise_for_status()
-                page = response.json()
-                if not isinstance(page, list) or not page:
+                return positions
+            offset = limit
+            while True:
+                page = self._fetch_positions_page(user_address, limit, offset, extra_params)
+                if not page:
                     break
                 positions.extend(page)
                 if len(page) < limit:
@@ -125,40 +192,224 @@ class PolymarketAPIClient:
             logger.error(f"Failed to fetch all positions from API: {exc}")
             return []
 
+    def _fetch_remaining_pages_concurrently(
+            self,
+            user_address: str,
+            limit: int,
+            extra_params: dict[str, Any],
+    ) -> list[dict]:
+        """
+        Speculatively request the next ``page_fetch_workers`` offsets at once,
+        then keep pages in offset order up to the first short or empty page.
+        """
+        positions: list[dict] = []
+        offset = limit
+        executor = ThreadPoolExecutor(max_workers=self.page_fetch_workers)
+        try:
+            while True:
+                offsets = [
+                    offset + i * limit for i in range(self.page_fetch_workers)
+                ]
+                futures = [
+                    executor.submit(
+                        self._fetch_positions_page,
+                        user_address,
+                        limit,
+                        page_offset,
+                        extra_params,
+                    )
+                    for page_offset in offsets
+                ]
+                for future in futures:
+                    page = future.result()
+                    if not page:
+                        return positions
+                    positions.extend(page)
+                    if len(page) < limit:
+                        return positions
+                offset = offsets[-1] + limit
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_positions_page(
+            self,
+            user_address: str,
+            limit: int,
+            offset: int,
+            extra_params: dict[str, Any],
+    ) -> list[dict]:
+        response = self.session.get(
+            DATA_API_POSITIONS_URL,
+            params=self._positions_page_params(user_address, limit, offset, extra_params),
+            timeout=self._timeout("data_api"),
+        )
+        response.raise_for_status()
+        page = response.json()
+        if not isinstance(page, list):
+            return []
+        return page
+
+    @staticmethod
+    def _positions_page_params(
+            user_address: str,
+            limit: int,
+            offset: int,
+            extra_params: dict[str, Any],
+    ) -> dict[str, Any]:
+        params = {
+            "user": user_address,
+            "sizeThreshold": 1,
+            "limit": limit,
+            "offset": offset,
+            "sortBy": "TOKENS",
+            "sortDirection": "DESC",
+        }
+        params.update(extra_params)
+        return params
+
     def get_market_by_condition_id(self, condition_id: str) -> dict | None:
         if not condition_id:
             return None
-        try:
-            response = self.session.get(
-                GAMMA_MARKETS_URL,
-                params={"condition_ids": condition_id, "limit": 1},
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            markets = response.json()
-            if isinstance(markets, list) and markets:
-                return markets[0]
-        except Exception as exc:
-            logger.warning(
-                f"failed to fetch market metadata for condition_id={condition_id}: {exc}"
-            )
-        return None
+        return self.get_markets_by_condition_ids([condition_id]).get(condition_id)
+
+    def get_markets_by_condition_ids(
+            self, condition_ids: list[str]
+    ) -> dict[str, dict | None]:
+        """
+        Look up Gamma markets for many condition IDs, serving cached entries and
+        sending the rest in chunks of ``GAMMA_MAX_CONDITION_IDS_PER_REQUEST``.
+        Conditions whose request failed are left out of the result.
+        """
+        markets, missing = self._lookup_cached_markets(
+            self.market_cache, condition_ids
+        )
+        for i in range(0, len(missing), GAMMA_MAX_CONDITION_IDS_PER_REQUEST):
+            chunk = missing[i: i + GAMMA_MAX_CONDITION_IDS_PER_REQUEST]
+            try:
+                response = self.session.get(
+                    GAMMA_MARKETS_URL,
+                    params={"condition_ids": chunk, "limit": len(chunk)},
+                    timeout=self._timeout("gamma"),
+                )
+                response.raise_for_status()
+                page = response.json()
+            except Exception as exc:
+                logger.warning(
+                    f"failed to fetch market metadata for condition_ids={chunk}: {exc}"
+                )
+                continue
+            markets.update(self._cache_market_page(self.market_cache, chunk, page))
+        return markets
+
+    def get_markets_by_token_ids(self, token_ids: list[str]) -> dict[str, dict]:
+        """
+        Look up Gamma markets by CLOB (ERC1155 position) token ID. Tokens with
+        no market, or whose request failed, are left out of the result.
+        """
+        markets: dict[str, dict] = {}
+        token_ids = list(dict.fromkeys(str(token_id) for token_id in token_ids))
+        for i in range(0, len(token_ids), GAMMA_MAX_CONDITION_IDS_PER_REQUEST):
+            chunk = token_ids[i: i + GAMMA_MAX_CONDITION_IDS_PER_REQUEST]
+            try:
+                response = self.session.get(
+                    GAMMA_MARKETS_URL,
+                    params={"clob_token_ids": chunk, "limit": len(chunk)},
+                    timeout=self._timeout("gamma"),
+                )
+                response.raise_for_status()
+                page = response.json()
+            except Exception as exc:
+                logger.warning(f"failed to fetch market metadata for token_ids={chunk}: {exc}")
+                continue
+            for market in page if isinstance(page, list) else []:
+                if not isinstance(market, dict):
+                    continue
+                if market.get("conditionId"):
+                    self.market_cache.set(market["conditionId"], market)
+                for token_id in self.parse_clob_token_ids(market):
+                    if token_id in chunk:
+                        markets[token_id] = market
+        return markets
+
+    @staticmethod
+    def parse_clob_token_ids(market: dict) -> list[str]:
+        """Gamma returns ``clobTokenIds`` as a JSON-encoded list, in outcome order."""
+        token_ids = market.get("clobTokenIds") or []
+        if isinstance(token_ids, str):
+            try:
+                token_ids = json.loads(token_ids)
+            except ValueError:
+                return []
+        return [str(token_id) for token_id in token_ids]
+
+    @staticmethod
+    def _cache_market_page(
+            market_cache: MarketCache, condition_ids: list[str], page: Any
+    ) -> dict[str, dict | None]:
+        found: dict[str, dict] = {}
+        if isinstance(page, list):
+            for market in page:
+                if isinstance(market, dict) and market.get("conditionId"):
+                    found[market["conditionId"].lower()] = market
+        markets: dict[str, dict | None] = {}
+        for condition_id in condition_ids:
+            market = found.get(condition_id.lower())
+            market_cache.set(condition_id, market)
+            markets[condition_id] = market
+        return markets
+
+    @staticmethod
+    def _lookup_cached_markets(
+            market_cache: MarketCache, condition_ids: list[str]
+    ) -> tuple[dict[str, dict | None], list[str]]:
+        markets: dict[str, dict | None] = {}
+        missing: list[str] = []
+        for condition_id in dict.fromkeys(filter(None, condition_ids)):
+            hit, market = market_cache.lookup(condition_id)
+            if hit:
+                markets[condition_id] = market
+            else:
+                missing.append(condition_id)
+        return markets, missing
 
     def get_relay_payload(self, address: str, wallet_type: WalletType) -> dict:
         response = self.session.get(
             f"{self.relayer_url}{GET_RELAY_PAYLOAD}",
             params={"address": address, "type": wallet_type.value},
-            timeout=self.timeout,
+            timeout=self._timeout("relayer"),
         )
         response.raise_for_status()
         return response.json()
 
+    def get_relayer_transaction(
+            self, transaction_id: str, relayer_url: str | None = None
+    ) -> list[dict]:
+        response = self.session.get(
+            f"{(relayer_url or self.relayer_url).rstrip('/')}{GET_TRANSACTION}",
+            params={"id": transaction_id},
+            timeout=self._timeout("relayer"),
+        )
+        response.raise_for_status()
+        return response.json() or []
+
+    def get_relayer_transactions(
+            self, headers: dict | None = None, relayer_url: str | None = None
+    ) -> list[dict]:
+        """Recent relayer transactions of the builder the ``headers`` authenticate."""
+        response = self.session.get(
+            f"{(relayer_url or self.relayer_url).rstrip('/')}{GET_TRANSACTIONS}",
+            headers=headers,
+            timeout=self._timeout("relayer"),
+        )
+        response.raise_for_status()
+        return response.json() or []
+
     def submit_relayer_transaction(self, req: dict, headers: dict) -> dict:
         response = self.session.post(
             f"{self.relayer_url}{SUBMIT_TRANSACTION}",
             json=req,
             headers=headers,
-            timeout=self.timeout,
+            timeout=self._timeout("relayer"),
         )
         response.raise_for_status()
         return response.json()
@@ -170,17 +421,79 @@ class PolymarketAPIClient:
             "params": [tx],
             "id": 1,
         }
+        return self._parse_estimate_gas_result(self._post_rpc(payload).json())
+
+    def _post_rpc(self, payload: Any) -> requests.Response:
+        if self.rpc_pool is not None:
+            return self.rpc_pool.request(payload)
         response = self.session.post(
             self.rpc_url,
             json=payload,
-            timeout=self.timeout,
+            timeout=self._timeout("rpc"),
         )
         response.raise_for_status()
-        result = response.json()
+        return response
+
+    @staticmethod
+    def _parse_estimate_gas_result(result: dict) -> str:
         if "result" not in result:
             raise Exception("Estimate gas error: " + str(result))
         return str(int(result["result"], 16))
 
+    def batch_rpc(
+            self,
+            calls: list[tuple[str, list[Any]]],
+            max_batch_size: int | None = None,
+    ) -> list[Any]:
+        """
+        Send ``(method, params)`` calls as JSON-RPC batch arrays of at most
+        ``max_batch_size`` calls each. Results are matched back by id and
+        returned in call order; a call the node rejected gets an ``Exception``
+        in its slot instead of failing the whole batch.
+        """
+        max_batch_size = max_batch_size or self.RPC_MAX_BATCH_SIZE
+        if max_batch_size <= 0:
+            raise Exception("max_batch_size must be greater than 0")
+        results: list[Any] = []
+        for start in range(0, len(calls), max_batch_size):
+            chunk = calls[start: start + max_batch_size]
+            payload = [
+                {"jsonrpc": "2.0", "method": method, "params": params, "id": call_id}
+                for call_id, (method, params) in enumerate(chunk)
+            ]
+            response = self._post_rpc(payload)
+            results.extend(self._map_batch_response(response.json(), len(chunk)))
+        return results
+
+    @staticmethod
+    def _map_batch_response(body: Any, size: int) -> list[Any]:
+        if not isinstance(body, list):
+            # Nodes without batch support answer with a single error object.
+            error = Exception(f"JSON-RPC batch error: {body}")
+            return [error] * size
+        items_by_id = {item.get("id"): item for item in body if isinstance(item, dict)}
+        results: list[Any] = []
+        for call_id in range(size):
+            item = items_by_id.get(call_id)
+            if item is None:
+                results.append(Exception(f"JSON-RPC batch response missing id {call_id}"))
+            elif "result" not in item:
+                results.append(Exception(f"JSON-RPC error: {item.get('error', item)}"))
+            else:
+                results.append(item["result"])
+        return results
+
+    def batch_eth_call(
+            self, calls: list[dict[str, Any]], block: str = "latest"
+    ) -> list[str | Exception]:
+        return self.batch_rpc([("eth_call", [call, block]) for call in calls])
+
+    def batch_estimate_gas(self, txs: list[dict[str, Any]]) -> list[str | Exception]:
+        return [
+            result if isinstance(result, Exception) else str(int(result, 16))
+            for result in self.batch_rpc([("eth_estimateGas", [tx]) for tx in txs])
+        ]
+
     @staticmethod
     def _is_positive_percent_pnl(position: dict) -> bool:
         try:
@@ -189,4 +502,14 @@ class PolymarketAPIClient:
             return False
 
 
-DEFAULT_POLYMARKET_API_CLIENT = PolymarketAPIClient()
+_default_client: PolymarketAPIClient | None = None
+
+
+def __getattr__(name: str) -> Any:
+    # Built on first use, so importing this module opens no HTTP session.
+    global _default_client
+    if name == "DEFAULT_POLYMARKET_API_CLIENT":
+        if _default_client is None:
+            _default_client = PolymarketAPIClient()
+        return _default_client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
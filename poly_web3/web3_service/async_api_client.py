@@ -0,0 +1,277 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: async_api_client.py
+import asyncio
+from typing import Any
+
+try:  # optional: pip install poly-web3[async]
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from poly_web3.const import (
+    DATA_API_POSITIONS_URL,
+    GAMMA_MARKETS_URL,
+    GAMMA_MAX_CONDITION_IDS_PER_REQUEST,
+    GET_RELAY_PAYLOAD,
+    HTTP_REQUEST_TIMEOUT_SECONDS,
+    RELAYER_URL,
+    RPC_URL,
+    SUBMIT_TRANSACTION,
+)
+from poly_web3.log import logger
+from poly_web3.schema import WalletType
+from poly_web3.web3_service.api_client import PolymarketAPIClient
+from poly_web3.web3_service.market_cache import MarketCache
+
+
+class AsyncPolymarketAPIClient:
+    """
+    asyncio counterpart of ``PolymarketAPIClient`` for event-loop based callers.
+
+    All requests share one ``aiohttp.ClientSession`` (and its connection pool)
+    and are bounded by ``max_concurrency`` in-flight requests, so lookups for
+    many wallets can be gathered without opening unbounded sockets.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 16
+    DEFAULT_POOL_SIZE = 100
+
+    def __init__(
+            self,
+            rpc_url: str | None = None,
+            relayer_url: str = RELAYER_URL,
+            timeout: int = HTTP_REQUEST_TIMEOUT_SECONDS,
+            session: "aiohttp.ClientSession | None" = None,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            pool_size: int = DEFAULT_POOL_SIZE,
+            market_cache: MarketCache | None = None,
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncPolymarketAPIClient requires aiohttp, "
+                "install it with: pip install \"poly-web3[async]\""
+            )
+        if max_concurrency <= 0:
+            raise Exception("max_concurrency must be greater than 0")
+        self.rpc_url = rpc_url or RPC_URL
+        self.relayer_url = relayer_url.rstrip("/")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.market_cache = market_cache or MarketCache()
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self) -> "AsyncPolymarketAPIClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._owns_session = True
+        return self._session
+
+    @staticmethod
+    def _to_query(params: dict[str, Any]) -> list[tuple[str, str]]:
+        # aiohttp rejects bool and list values; expand them the same way requests does.
+        query: list[tuple[str, str]] = []
+        for key, value in params.items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            for item in values:
+                if isinstance(item, bool):
+                    item = "true" if item else "false"
+                query.append((key, str(item)))
+        return query
+
+    async def _request_json(
+            self,
+            method: str,
+            url: str,
+            params: dict[str, Any] | None = None,
+            **kwargs: Any,
+    ) -> Any:
+        session = self._get_session()
+        async with self._semaphore:
+            async with session.request(
+                method,
+                url,
+                params=self._to_query(params) if params else None,
+                **kwargs,
+            ) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+
+    async def fetch_redeemable_positions(self, user_address: str) -> list[dict]:
+        params = {
+            "user": user_address,
+            "sizeThreshold": 1,
+            "limit": 100,
+            "redeemable": True,
+            "sortBy": "RESOLVING",
+            "sortDirection": "DESC",
+        }
+        try:
+            positions = await self._request_json("GET", DATA_API_POSITIONS_URL, params=params)
+            return [
+                item for item in positions
+                if PolymarketAPIClient._is_positive_percent_pnl(item)
+            ]
+        except Exception as exc:
+            logger.error(f"Failed to fetch positions from API: {exc}")
+            return []
+
+    async def fetch_positions_by_condition_ids(
+            self, user_address: str, condition_ids: list[str]
+    ) -> list[dict]:
+        if not condition_ids:
+            return []
+        params = {
+            "user": user_address,
+            "market": ",".join(condition_ids),
+            "sizeThreshold": 1,
+        }
+        try:
+            positions = await self._request_json("GET", DATA_API_POSITIONS_URL, params=params)
+            return [
+                item for item in positions
+                if PolymarketAPIClient._is_positive_percent_pnl(item)
+            ]
+        except Exception as exc:
+            logger.error(f"Failed to fetch positions from API: {exc}")
+            return []
+
+    async def fetch_all_positions(self, user_address: str) -> list[dict]:
+        return await self._fetch_all_positions(
+            user_address=user_address,
+            extra_params={},
+        )
+
+    async def fetch_all_mergeable_positions(self, user_address: str) -> list[dict]:
+        return await self._fetch_all_positions(
+            user_address=user_address,
+            extra_params={"mergeable": True},
+        )
+
+    async def fetch_all_positions_for_users(
+            self,
+            user_addresses: list[str],
+            mergeable: bool = False,
+    ) -> dict[str, list[dict]]:
+        """
+        Fetch all positions for many wallets concurrently, keyed by address.
+        """
+        extra_params = {"mergeable": True} if mergeable else {}
+        results = await asyncio.gather(
+            *(
+                self._fetch_all_positions(user_address, extra_params)
+                for user_address in user_addresses
+            )
+        )
+        return dict(zip(user_addresses, results))
+
+    async def _fetch_all_positions(
+            self, user_address: str, extra_params: dict[str, Any]
+    ) -> list[dict]:
+        limit = PolymarketAPIClient.POSITIONS_PAGE_LIMIT
+        offset = 0
+        positions: list[dict] = []
+
+        try:
+            while True:
+                page = await self._request_json(
+                    "GET",
+                    DATA_API_POSITIONS_URL,
+                    params=PolymarketAPIClient._positions_page_params(
+                        user_address, limit, offset, extra_params
+                    ),
+                )
+                if not isinstance(page, list) or not page:
+                    break
+                positions.extend(page)
+                if len(page) < limit:
+                    break
+                offset += limit
+            return positions
+        except Exception as exc:
+            logger.error(f"Failed to fetch all positions from API: {exc}")
+            return []
+
+    async def get_market_by_condition_id(self, condition_id: str) -> dict | None:
+        if not condition_id:
+            return None
+        markets = await self.get_markets_by_condition_ids([condition_id])
+        return markets.get(condition_id)
+
+    async def get_markets_by_condition_ids(
+            self, condition_ids: list[str]
+    ) -> dict[str, dict | None]:
+        """
+        Async ``PolymarketAPIClient.get_markets_by_condition_ids``; uncached
+        chunks are requested concurrently.
+        """
+        markets, missing = PolymarketAPIClient._lookup_cached_markets(
+            self.market_cache, condition_ids
+        )
+        chunks = [
+            missing[i: i + GAMMA_MAX_CONDITION_IDS_PER_REQUEST]
+            for i in range(0, len(missing), GAMMA_MAX_CONDITION_IDS_PER_REQUEST)
+        ]
+        pages = await asyncio.gather(
+            *(
+                self._request_json(
+                    "GET",
+                    GAMMA_MARKETS_URL,
+                    params={"condition_ids": chunk, "limit": len(chunk)},
+                )
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+        for chunk, page in zip(chunks, pages):
+            if isinstance(page, Exception):
+                logger.warning(
+                    f"failed to fetch market metadata for condition_ids={chunk}: {page}"
+                )
+                continue
+            markets.update(PolymarketAPIClient._cache_market_page(
+                self.market_cache, chunk, page
+            ))
+        return markets
+
+    async def get_relay_payload(self, address: str, wallet_type: WalletType) -> dict:
+        return await self._request_json(
+            "GET",
+            f"{self.relayer_url}{GET_RELAY_PAYLOAD}",
+            params={"address": address, "type": wallet_type.value},
+        )
+
+    async def submit_relayer_transaction(self, req: dict, headers: dict) -> dict:
+        return await self._request_json(
+            "POST",
+            f"{self.relayer_url}{SUBMIT_TRANSACTION}",
+            json=req,
+            headers=headers,
+        )
+
+    async def estimate_gas(self, tx: dict[str, Any]) -> str:
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "eth_estimateGas",
+            "params": [tx],
+            "id": 1,
+        }
+        result = await self._request_json("POST", self.rpc_url, json=payload)
+        return PolymarketAPIClient._parse_estimate_gas_result(result)
@@ -4,7 +4,9 @@
 # @Site:
 # @File: base.py
 # @Software: PyCharm
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator
 from decimal import Decimal, InvalidOperation, ROUND_DOWN
 import re
 
@@ -23,26 +25,23 @@ from poly_web3.const import (
     CTF_COLLATERAL_ADAPTER_ADDRESS,
     NEG_RISK_CTF_COLLATERAL_ADAPTER_ADDRESS,
     PUSD_WRAPPER_ADDRESS,
-    CTF_ABI_REDEEM,
-    CTF_ABI_SPLIT,
-    CTF_ABI_MERGE,
     NEG_RISK_ADAPTER_ADDRESS,
     POL,
     AMOY,
-    NEG_RISK_ADAPTER_ABI_REDEEM,
-    NEG_RISK_ADAPTER_ABI_SPLIT,
-    NEG_RISK_ADAPTER_ABI_MERGE,
     PROXY_INIT_CODE_HASH,
     ERC20_ABI_BALANCE,
-    ERC20_ABI_APPROVE,
-    PUSD_WRAPPER_ABI_WRAP,
 )
 from poly_web3.signature.build import derive_proxy_wallet
+from poly_web3.signature.ctf_ids import get_outcome_position_id
 from poly_web3.schema import (
     BatchBinaryOperationItem,
     BatchBinaryOperationErrorItem,
     BatchBinaryOperationResult,
     BatchBinaryOperationSuccessItem,
+    ConditionPayoutState,
+    DryRunBatchItem,
+    DryRunConditionItem,
+    DryRunResult,
     MergeAllResult,
     MergeErrorItem,
     MergePlanItem,
@@ -52,19 +51,65 @@ from poly_web3.schema import (
     WalletType,
 )
 from poly_web3.log import logger
+from poly_web3.web3_service import calldata
 from poly_web3.web3_service.api_client import PolymarketAPIClient
+from poly_web3.web3_service.gas_batcher import AdaptiveBatcher, GasModel, GasUnit
+from poly_web3.web3_service.merge_planner import MergePlanner
+from poly_web3.web3_service.multicall import Multicall3
+from poly_web3.web3_service.nonce_manager import NonceManager
+from poly_web3.web3_service.pipeline import BuiltBatch, PipelinedExecutor
+from poly_web3.web3_service.position_index import PositionIndex
+from poly_web3.web3_service.relayer_quota import RelayerQuotaTracker
+from poly_web3.web3_service.relayer_status import RelayerStatusTracker
+from poly_web3.web3_service.resolution_cache import ResolutionCache
+from poly_web3.web3_service.rpc_pool import PooledHTTPProvider, normalize_rpc_urls
+from poly_web3.web3_service.submission import (
+    SubmissionHandle,
+    notify_submitted,
+    run_in_background,
+)
+from poly_web3.web3_service.transaction_plan import TransactionPlan
+from poly_web3.web3_service.transport import HttpTransport
 
 
 class BaseWeb3Service:
     RELAYER_DAILY_SUBMIT_LIMIT = 100
     RELAYER_RECOMMENDED_SUBMIT_INTERVAL_MINUTES = 15
+    # Max relayer batches in flight; 1 keeps build -> submit -> confirm strictly serial.
+    pipeline_depth: int = 1
+    quota_tracker: RelayerQuotaTracker | None = None
+    # When set, batches are filled up to this much gas instead of a fixed batch_size.
+    batch_gas_limit: int | None = None
+    gas_model: GasModel | None = None
+    # Opt-in: bisect a failed batch with estimateGas and resubmit the rest once.
+    isolate_failed_batches: bool = False
+    # Concurrent estimateGas calls for dry runs.
+    DRY_RUN_MAX_WORKERS = 8
+    # (address, id(abi)) -> web3 contract, filled lazily by _contract()
+    _contracts: dict[tuple[str | None, int], Any] | None = None
+    # When set, relayer confirmations are polled in one loop shared by all submits.
+    status_tracker: RelayerStatusTracker | None = None
+    # When set, redeem/merge candidates come from this event-log index.
+    position_index: PositionIndex | None = None
 
     def __init__(
             self,
             clob_client: Any = None,
             relayer_client: RelayClient = None,
-            rpc_url: str | None = None,
+            rpc_url: str | list[str] | None = None,
+            resolution_cache: ResolutionCache | None = None,
+            pipeline_depth: int = 1,
+            api_client: PolymarketAPIClient | None = None,
+            w3: Web3 | None = None,
+            quota_tracker: RelayerQuotaTracker | None = None,
+            batch_gas_limit: int | None = None,
+            gas_model: GasModel | None = None,
+            isolate_failed_batches: bool = False,
+            transport: HttpTransport | None = None,
+            status_tracker: RelayerStatusTracker | None = None,
     ):
+        if pipeline_depth <= 0:
+            raise Exception("pipeline_depth must be greater than 0")
         self.relayer_client = relayer_client
         self.clob_client = clob_client
         if self.clob_client:
@@ -74,11 +119,37 @@ class BaseWeb3Service:
         else:
             self.wallet_type = WalletType.PROXY
         self.rpc_url = rpc_url or RPC_URL
-        self.api_client = PolymarketAPIClient(rpc_url=self.rpc_url)
-        self.w3: Web3 = Web3(Web3.HTTPProvider(self.rpc_url))
+        self.api_client = api_client or PolymarketAPIClient(
+            rpc_url=self.rpc_url, transport=transport
+        )
+        self.w3: Web3 = w3 or Web3(self._build_web3_provider())
+        self.multicall = Multicall3(self.w3)
+        self.resolution_cache = resolution_cache or ResolutionCache()
+        self.pipeline_depth = pipeline_depth
+        self.nonce_manager = NonceManager(self._fetch_relayer_nonce)
+        self.quota_tracker = quota_tracker
+        self.batch_gas_limit = batch_gas_limit
+        self.gas_model = gas_model or GasModel()
+        self.isolate_failed_batches = isolate_failed_batches
+        self.status_tracker = status_tracker
         if self.wallet_type in (WalletType.PROXY, WalletType.DEPOSIT_WALLET) and relayer_client is None:
             raise Exception("relayer_client must be provided")
 
+    def _build_web3_provider(self) -> Web3.HTTPProvider:
+        rpc_pool = getattr(self.api_client, "rpc_pool", None)
+        if rpc_pool is not None:
+            return PooledHTTPProvider(rpc_pool)
+        rpc_url = normalize_rpc_urls(self.rpc_url)[0]
+        transport = getattr(self.api_client, "transport", None)
+        if transport is not None:
+            transport.mount_rpc_url(rpc_url)
+            return Web3.HTTPProvider(
+                rpc_url,
+                session=transport.session,
+                request_kwargs={"timeout": transport.timeout("rpc")},
+            )
+        return Web3.HTTPProvider(rpc_url)
+
     def _resolve_user_address(self):
         funder = get_clob_funder(self.clob_client)
         if funder:
@@ -95,79 +166,265 @@ class BaseWeb3Service:
         return self.clob_client.get_address()
 
     def is_condition_resolved(self, condition_id: str) -> bool:
-        ctf = self.w3.eth.contract(address=CTF_ADDRESS, abi=CTF_ABI_PAYOUT)
-        return ctf.functions.payoutDenominator(condition_id).call() > 0
+        denominator, _ = self.get_payout_vectors([condition_id])[condition_id]
+        return denominator > 0
 
     def get_winning_indexes(self, condition_id: str) -> list[int]:
-        ctf = self.w3.eth.contract(address=CTF_ADDRESS, abi=CTF_ABI_PAYOUT)
-        if not self.is_condition_resolved(condition_id):
+        denominator, numerators = self.get_payout_vectors([condition_id])[condition_id]
+        if denominator <= 0:
+            return []
+        return [i for i, numerator in enumerate(numerators) if numerator > 0]
+
+    def get_payout_vectors(
+            self, condition_ids: list[str]
+    ) -> dict[str, tuple[int, list[int]]]:
+        """
+        Return ``(payout_denominator, payout_numerators)`` per condition, served
+        from ``resolution_cache`` when possible and read through Multicall3 otherwise.
+        """
+        ctf = self._contract(CTF_ABI_PAYOUT, CTF_ADDRESS)
+        vectors, outcome_counts = self._read_payout_denominators(condition_ids, ctf)
+        pending = [
+            condition_id
+            for condition_id, count in outcome_counts.items()
+            if vectors[condition_id][0] > 0
+        ]
+        values = iter(
+            self._aggregate_reads(
+                [
+                    (
+                        CTF_ADDRESS,
+                        ctf.functions.payoutNumerators(condition_id, index),
+                        "uint256",
+                    )
+                    for condition_id in pending
+                    for index in range(outcome_counts[condition_id])
+                ]
+            )
+        )
+        for condition_id in pending:
+            numerators = [next(values) for _ in range(outcome_counts[condition_id])]
+            if any(numerator is None for numerator in numerators):
+                raise Exception(
+                    f"multicall read failed: payoutNumerators, condition_id={condition_id}"
+                )
+            vectors[condition_id] = (vectors[condition_id][0], numerators)
+            self.resolution_cache.set(condition_id, *vectors[condition_id])
+        return vectors
+
+    def _read_payout_denominators(
+            self,
+            condition_ids: list[str],
+            ctf: Any,
+    ) -> tuple[dict[str, tuple[int, list[int]]], dict[str, int]]:
+        """
+        Fill payout vectors from the resolution cache and read
+        ``payoutDenominator``/``getOutcomeSlotCount`` for the misses. Newly
+        resolved conditions come back with empty numerators and their outcome
+        count in the second mapping; unresolved ones are cached right away.
+        """
+        vectors: dict[str, tuple[int, list[int]]] = {}
+        missing: list[str] = []
+        for condition_id in dict.fromkeys(condition_ids):
+            cached = self.resolution_cache.get(condition_id)
+            if cached is None:
+                missing.append(condition_id)
+            else:
+                vectors[condition_id] = cached
+
+        calls = []
+        for condition_id in missing:
+            calls.append(
+                (CTF_ADDRESS, ctf.functions.payoutDenominator(condition_id), "uint256")
+            )
+            calls.append(
+                (CTF_ADDRESS, ctf.functions.getOutcomeSlotCount(condition_id), "uint256")
+            )
+        values = self._aggregate_reads(calls)
+        outcome_counts: dict[str, int] = {}
+        for i, condition_id in enumerate(missing):
+            denominator, outcome_count = values[2 * i], values[2 * i + 1]
+            if denominator is None or outcome_count is None:
+                raise Exception(
+                    "multicall read failed: payoutDenominator/getOutcomeSlotCount, "
+                    f"condition_id={condition_id}"
+                )
+            vectors[condition_id] = (denominator, [])
+            outcome_counts[condition_id] = outcome_count
+            if denominator <= 0:
+                self.resolution_cache.set(condition_id, denominator, [])
+        return vectors, outcome_counts
+
+    def get_condition_payout_states(
+            self,
+            condition_ids: list[str],
+            collateral_token: str = CTF_COLLATERAL_TOKEN,
+            owner: str | None = None,
+    ) -> dict[str, ConditionPayoutState]:
+        """
+        Read payout vectors and winning-outcome balances for many conditions
+        through Multicall3 instead of one eth_call per value. Position IDs are
+        derived locally and settled payout vectors come from ``resolution_cache``,
+        so a batch costs at most two aggregated round trips.
+        """
+        if not condition_ids:
+            return {}
+        owner_checksum = to_checksum_address(owner or self._resolve_user_address())
+        ctf = self._contract(CTF_ABI_PAYOUT, CTF_ADDRESS)
+        vectors, outcome_counts = self._read_payout_denominators(condition_ids, ctf)
+        states = {
+            condition_id: ConditionPayoutState(
+                condition_id=condition_id,
+                payout_denominator=denominator,
+                payout_numerators=numerators,
+            )
+            for condition_id, (denominator, numerators) in vectors.items()
+        }
+
+        resolved = [state for state in states.values() if state.resolved]
+        calls = []
+        for state in resolved:
+            read_numerators = state.condition_id in outcome_counts
+            outcome_count = (
+                outcome_counts[state.condition_id]
+                if read_numerators
+                else len(state.payout_numerators)
+            )
+            for index in range(outcome_count):
+                if read_numerators:
+                    calls.append(
+                        (
+                            CTF_ADDRESS,
+                            ctf.functions.payoutNumerators(state.condition_id, index),
+                            "uint256",
+                        )
+                    )
+                elif state.payout_numerators[index] <= 0:
+                    continue
+                position_id = get_outcome_position_id(
+                    collateral_token, ZERO_BYTES32, state.condition_id, 1 << index
+                )
+                calls.append(
+                    (
+                        CTF_ADDRESS,
+                        ctf.functions.balanceOf(owner_checksum, position_id),
+                        "uint256",
+                    )
+                )
+        values = iter(self._aggregate_reads(calls))
+        for state in resolved:
+            if state.condition_id in outcome_counts:
+                pairs = [
+                    (next(values), next(values))
+                    for _ in range(outcome_counts[state.condition_id])
+                ]
+                if any(numerator is None or balance is None for numerator, balance in pairs):
+                    state.error = "multicall read failed: payoutNumerators/balanceOf"
+                    continue
+                state.payout_numerators = [numerator for numerator, _ in pairs]
+                self.resolution_cache.set(
+                    state.condition_id,
+                    state.payout_denominator,
+                    state.payout_numerators,
+                )
+                balances = [balance for _, balance in pairs]
+            else:
+                balances = [
+                    next(values) if numerator > 0 else 0
+                    for numerator in state.payout_numerators
+                ]
+                if any(balance is None for balance in balances):
+                    state.error = "multicall read failed: balanceOf"
+                    continue
+            state.balances = {
+                index: balance
+                for index, balance in enumerate(balances)
+                if state.payout_numerators[index] > 0
+            }
+        return states
+
+    def _aggregate_reads(self, calls: list[tuple[str, Any, str]]) -> list[Any]:
+        """
+        Run ``(target, contract_function, output_type)`` reads through Multicall3
+        and decode each return value, yielding ``None`` for failed calls.
+        """
+        if not calls:
             return []
-        outcome_count = ctf.functions.getOutcomeSlotCount(condition_id).call()
-        winners: list[int] = []
-        for i in range(outcome_count):
-            if ctf.functions.payoutNumerators(condition_id, i).call() > 0:
-                winners.append(i)
-        return winners
+        results = self.multicall.aggregate3(
+            [(target, function._encode_transaction_data()) for target, function, _ in calls]
+        )
+        values: list[Any] = []
+        for (_, _, output_type), (success, data) in zip(calls, results):
+            if not success or not data:
+                values.append(None)
+                continue
+            values.append(self.w3.codec.decode([output_type], data)[0])
+        return values
+
+    def _get_condition_payout_state(
+            self,
+            condition_id: str,
+            collateral_token: str = CTF_COLLATERAL_TOKEN,
+    ) -> ConditionPayoutState:
+        state = self.get_condition_payout_states(
+            [condition_id], collateral_token=collateral_token
+        )[condition_id]
+        if state.error:
+            raise Exception(state.error)
+        return state
 
     def get_redeemable_index_and_balance(
             self,
             condition_id: str,
             collateral_token: str = CTF_COLLATERAL_TOKEN,
     ) -> list[tuple]:
-        owner = self._resolve_user_address()
-        winners = self.get_winning_indexes(condition_id)
-        if not winners:
-            return []
-        ctf = self.w3.eth.contract(address=CTF_ADDRESS, abi=CTF_ABI_PAYOUT)
-        owner_checksum = to_checksum_address(owner)
-        redeemable: list[tuple] = []
-        for index in winners:
-            index_set = 1 << index
-            collection_id = ctf.functions.getCollectionId(
-                ZERO_BYTES32, condition_id, index_set
-            ).call()
-            position_id = ctf.functions.getPositionId(
-                collateral_token, collection_id
-            ).call()
-            balance = ctf.functions.balanceOf(owner_checksum, position_id).call()
-            if balance > 0:
-                redeemable.append((index, balance / 1000000))
-        return redeemable
+        return self._get_condition_payout_state(
+            condition_id, collateral_token
+        ).redeemable_index_and_balance
 
     def get_redeemable_payout_amount(
             self,
             condition_id: str,
             collateral_token: str = CTF_COLLATERAL_TOKEN,
     ) -> int:
-        owner = self._resolve_user_address()
-        ctf = self.w3.eth.contract(address=CTF_ADDRESS, abi=CTF_ABI_PAYOUT)
-        denominator = ctf.functions.payoutDenominator(condition_id).call()
-        if denominator <= 0:
-            return 0
-        outcome_count = ctf.functions.getOutcomeSlotCount(condition_id).call()
-        owner_checksum = to_checksum_address(owner)
-        total_payout = 0
-        for index in range(outcome_count):
-            numerator = ctf.functions.payoutNumerators(condition_id, index).call()
-            if numerator <= 0:
-                continue
-            index_set = 1 << index
-            collection_id = ctf.functions.getCollectionId(
-                ZERO_BYTES32, condition_id, index_set
-            ).call()
-            position_id = ctf.functions.getPositionId(
-                collateral_token, collection_id
-            ).call()
-            balance = ctf.functions.balanceOf(owner_checksum, position_id).call()
-            if balance > 0:
-                total_payout += balance * numerator // denominator
-        return total_payout
+        return self._get_condition_payout_state(
+            condition_id, collateral_token
+        ).payout_amount
 
-    def get_erc20_balance(self, token_address: str, owner: str | None = None) -> int:
-        token = self.w3.eth.contract(
-            address=to_checksum_address(token_address),
-            abi=ERC20_ABI_BALANCE,
+    def get_redeemable_payout_amounts(
+            self,
+            condition_ids: list[str],
+            collateral_token: str = CTF_COLLATERAL_TOKEN,
+    ) -> dict[str, int]:
+        states = self.get_condition_payout_states(
+            condition_ids, collateral_token=collateral_token
         )
+        payout_amounts: dict[str, int] = {}
+        for condition_id, state in states.items():
+            if state.error:
+                raise Exception(f"condition_id={condition_id}: {state.error}")
+            payout_amounts[condition_id] = state.payout_amount
+        return payout_amounts
+
+    def _contract(self, abi: list[dict], address: str | None = None) -> Any:
+        """
+        Web3 contract objects cached per service; building one re-parses the ABI.
+        """
+        if self._contracts is None:
+            self._contracts = {}
+        key = (address, id(abi))
+        contract = self._contracts.get(key)
+        if contract is None:
+            contract = (
+                self.w3.eth.contract(address=address, abi=abi)
+                if address
+                else self.w3.eth.contract(abi=abi)
+            )
+            self._contracts[key] = contract
+        return contract
+
+    def get_erc20_balance(self, token_address: str, owner: str | None = None) -> int:
+        token = self._contract(ERC20_ABI_BALANCE, to_checksum_address(token_address))
         return token.functions.balanceOf(
             to_checksum_address(owner or self._resolve_user_address())
         ).call()
@@ -195,13 +452,12 @@ class BaseWeb3Service:
             condition_id: str,
             collateral_token: str = CTF_COLLATERAL_TOKEN,
     ) -> str:
-        ctf = self.w3.eth.contract(address=CTF_ADDRESS, abi=CTF_ABI_REDEEM)
-        return ctf.functions.redeemPositions(
+        return calldata.encode_ctf_redeem(
             collateral_token,
             ZERO_BYTES32,
             condition_id,
             [1, 2],
-        )._encode_transaction_data()
+        )
 
     def build_erc20_approve_tx_data(
             self,
@@ -209,14 +465,13 @@ class BaseWeb3Service:
             amount: int,
             token_address: str = CTF_COLLATERAL_TOKEN,
     ) -> str:
-        token = self.w3.eth.contract(
-            address=to_checksum_address(token_address),
-            abi=ERC20_ABI_APPROVE,
-        )
-        return token.functions.approve(
-            to_checksum_address(spender),
-            amount,
-        )._encode_transaction_data()
+        """
+        ``approve(spender, amount)`` calldata. ``token_address`` is deprecated:
+        the calldata does not depend on it (the token is the tx's ``to``), but
+        it is still checksum-validated so bad input keeps failing.
+        """
+        to_checksum_address(token_address)
+        return calldata.encode_erc20_approve(to_checksum_address(spender), amount)
 
     def build_pusd_wrap_tx_data(
             self,
@@ -224,15 +479,11 @@ class BaseWeb3Service:
             receiver: str,
             amount: int,
     ) -> str:
-        wrapper = self.w3.eth.contract(
-            address=PUSD_WRAPPER_ADDRESS,
-            abi=PUSD_WRAPPER_ABI_WRAP,
-        )
-        return wrapper.functions.wrap(
+        return calldata.encode_pusd_wrap(
             to_checksum_address(token_address),
             to_checksum_address(receiver),
             amount,
-        )._encode_transaction_data()
+        )
 
     def _build_wrap_redeemed_collateral_txs(self, amount: int) -> list[Any]:
         if amount <= 0:
@@ -265,14 +516,13 @@ class BaseWeb3Service:
             collateral_token: str = DEFAULT_COLLATERAL_TOKEN,
             parent_collection_id: str = ZERO_BYTES32,
     ) -> str:
-        ctf = self.w3.eth.contract(address=CTF_ADDRESS, abi=CTF_ABI_SPLIT)
-        return ctf.functions.splitPosition(
+        return calldata.encode_split_position(
             collateral_token,
             parent_collection_id,
             condition_id,
             partition,
             amount,
-        )._encode_transaction_data()
+        )
 
     def build_ctf_merge_tx_data(
             self,
@@ -282,14 +532,13 @@ class BaseWeb3Service:
             collateral_token: str = DEFAULT_COLLATERAL_TOKEN,
             parent_collection_id: str = ZERO_BYTES32,
     ) -> str:
-        ctf = self.w3.eth.contract(address=CTF_ADDRESS, abi=CTF_ABI_MERGE)
-        return ctf.functions.mergePositions(
+        return calldata.encode_merge_positions(
             collateral_token,
             parent_collection_id,
             condition_id,
             partition,
             amount,
-        )._encode_transaction_data()
+        )
 
     def build_neg_risk_split_tx_data(
             self,
@@ -299,16 +548,13 @@ class BaseWeb3Service:
             collateral_token: str = DEFAULT_COLLATERAL_TOKEN,
             parent_collection_id: str = ZERO_BYTES32,
     ) -> str:
-        nr_adapter = self.w3.eth.contract(
-            address=NEG_RISK_ADAPTER_ADDRESS, abi=NEG_RISK_ADAPTER_ABI_SPLIT
-        )
-        return nr_adapter.functions.splitPosition(
+        return calldata.encode_split_position(
             collateral_token,
             parent_collection_id,
             condition_id,
             partition,
             amount,
-        )._encode_transaction_data()
+        )
 
     def build_neg_risk_merge_tx_data(
             self,
@@ -318,35 +564,45 @@ class BaseWeb3Service:
             collateral_token: str = DEFAULT_COLLATERAL_TOKEN,
             parent_collection_id: str = ZERO_BYTES32,
     ) -> str:
-        nr_adapter = self.w3.eth.contract(
-            address=NEG_RISK_ADAPTER_ADDRESS, abi=NEG_RISK_ADAPTER_ABI_MERGE
-        )
-        return nr_adapter.functions.mergePositions(
+        return calldata.encode_merge_positions(
             collateral_token,
             parent_collection_id,
             condition_id,
             partition,
             amount,
-        )._encode_transaction_data()
+        )
 
     def build_neg_risk_redeem_tx_data(
             self, condition_id: str, redeem_amounts: list[int]
     ) -> str:
-        nr_adapter = self.w3.eth.contract(
-            address=NEG_RISK_ADAPTER_ADDRESS, abi=NEG_RISK_ADAPTER_ABI_REDEEM
-        )
-        return nr_adapter.functions.redeemPositions(
-            condition_id,
-            redeem_amounts,
-        )._encode_transaction_data()
+        return calldata.encode_neg_risk_redeem(condition_id, redeem_amounts)
 
     def get_market_by_condition_id(self, condition_id: str) -> dict | None:
         return self.api_client.get_market_by_condition_id(condition_id)
 
+    def get_markets_by_condition_ids(
+            self, condition_ids: list[str]
+    ) -> dict[str, dict | None]:
+        return self.api_client.get_markets_by_condition_ids(condition_ids)
+
     def is_negative_risk_condition(self, condition_id: str) -> bool:
         market = self.get_market_by_condition_id(condition_id)
         return bool(market and market.get("negRisk"))
 
+    def prefetch_negative_risk_flags(self, condition_ids: list[str]) -> dict[str, bool]:
+        """
+        Resolve ``negRisk`` for many conditions with bulk Gamma lookups.
+        Conditions whose lookup failed are omitted so callers can fall back
+        to ``is_negative_risk_condition``.
+        """
+        if not condition_ids:
+            return {}
+        markets = self.get_markets_by_condition_ids(condition_ids)
+        return {
+            condition_id: bool(market and market.get("negRisk"))
+            for condition_id, market in markets.items()
+        }
+
     def _resolve_negative_risk_flag(
             self, condition_id: str, negative_risk: bool | None
     ) -> bool:
@@ -430,23 +686,27 @@ class BaseWeb3Service:
         tx = self._build_ctf_tx(to, data)
         return is_negative_risk, tx
 
-    def _submit_binary_market_batch(
+    def _group_binary_market_txs(
             self,
             action: str,
             operations: list[BatchBinaryOperationItem | dict],
-            batch_size: int = 10,
-            collateral_token: str = DEFAULT_COLLATERAL_TOKEN,
-            parent_collection_id: str = ZERO_BYTES32,
-    ) -> BatchBinaryOperationResult:
+            collateral_token: str,
+            parent_collection_id: str,
+    ) -> dict[bool, list[tuple[BatchBinaryOperationItem, Any]]]:
         normalized_operations = self._normalize_batch_binary_operation_items(
             operations
         )
-        if batch_size <= 0:
-            raise Exception("batch_size must be greater than 0")
         grouped_operations: dict[bool, list[tuple[BatchBinaryOperationItem, Any]]] = {
             False: [],
             True: [],
         }
+        negative_risk_flags = self.prefetch_negative_risk_flags(
+            [
+                operation.condition_id
+                for operation in normalized_operations
+                if operation.negative_risk is None
+            ]
+        )
 
         for operation in normalized_operations:
             is_negative_risk, tx = self._build_binary_market_tx(
@@ -455,39 +715,247 @@ class BaseWeb3Service:
                 amount=operation.amount,
                 collateral_token=collateral_token,
                 parent_collection_id=parent_collection_id,
-                negative_risk=operation.negative_risk,
+                negative_risk=(
+                    operation.negative_risk
+                    if operation.negative_risk is not None
+                    else negative_risk_flags.get(operation.condition_id)
+                ),
             )
             grouped_operations[is_negative_risk].append((operation, tx))
+        return grouped_operations
 
-        batch_result = BatchBinaryOperationResult()
+    def _dry_run_binary_market_batch(
+            self,
+            action: str,
+            operations: list[BatchBinaryOperationItem | dict],
+            batch_size: int = 10,
+            collateral_token: str = DEFAULT_COLLATERAL_TOKEN,
+            parent_collection_id: str = ZERO_BYTES32,
+    ) -> DryRunResult:
+        if batch_size <= 0:
+            raise Exception("batch_size must be greater than 0")
+        grouped_operations = self._group_binary_market_txs(
+            action, operations, collateral_token, parent_collection_id
+        )
+        batches: list[list[GasUnit]] = []
         for is_negative_risk in (False, True):
-            grouped = grouped_operations[is_negative_risk]
-            if not grouped:
+            batches.extend(
+                self._pack_units(
+                    self._binary_gas_units(
+                        action, is_negative_risk, grouped_operations[is_negative_risk]
+                    ),
+                    batch_size,
+                )
+            )
+        return self._simulate_batches(action, batches)
+
+    @staticmethod
+    def _binary_gas_units(
+            action: str,
+            is_negative_risk: bool,
+            grouped: list[tuple[BatchBinaryOperationItem, Any]],
+    ) -> list[GasUnit]:
+        tx_type = f"neg_risk_{action}" if is_negative_risk else action
+        return [GasUnit(operation.condition_id, [tx], [tx_type]) for operation, tx in grouped]
+
+    def _submit_binary_market_batch(
+            self,
+            action: str,
+            operations: list[BatchBinaryOperationItem | dict],
+            batch_size: int = 10,
+            collateral_token: str = DEFAULT_COLLATERAL_TOKEN,
+            parent_collection_id: str = ZERO_BYTES32,
+    ) -> BatchBinaryOperationResult:
+        if batch_size <= 0:
+            raise Exception("batch_size must be greater than 0")
+        grouped_operations = self._group_binary_market_txs(
+            action, operations, collateral_token, parent_collection_id
+        )
+
+        batch_result = BatchBinaryOperationResult()
+        if self.batch_gas_limit:
+            jobs = self._gas_batched_binary_jobs(action, grouped_operations)
+        else:
+            jobs = [
+                (
+                    (is_negative_risk, [item.condition_id for item, _ in grouped_chunk], []),
+                    lambda chunk=grouped_chunk: [tx for _, tx in chunk],
+                )
+                for is_negative_risk in (False, True)
+                for grouped_chunk in self._chunk_grouped_operations(
+                    grouped_operations[is_negative_risk], batch_size
+                )
+            ]
+        txs_by_condition: dict[str, list[Any]] = {}
+        for grouped in grouped_operations.values():
+            for operation, tx in grouped:
+                txs_by_condition.setdefault(operation.condition_id, []).append(tx)
+        for (is_negative_risk, condition_ids, build_errors), submit_result, error in (
+                self._run_submission_pipeline(jobs, action)
+        ):
+            batch_result.error_list.extend(build_errors)
+            if not condition_ids:
                 continue
-            for grouped_chunk in self._chunk_grouped_operations(grouped, batch_size):
-                condition_ids = [item.condition_id for item, _ in grouped_chunk]
-                txs = [tx for _, tx in grouped_chunk]
-                try:
-                    submit_result = self._submit_transactions(txs, action)
-                    if submit_result is None:
-                        raise Exception(f"{action} execute returned None")
-                    batch_result.success_list.append(
-                        BatchBinaryOperationSuccessItem(
-                            negative_risk=is_negative_risk,
-                            condition_ids=condition_ids,
-                            result=submit_result,
-                        )
-                    )
-                except Exception as exc:
-                    batch_result.error_list.append(
-                        BatchBinaryOperationErrorItem(
-                            negative_risk=is_negative_risk,
-                            condition_ids=condition_ids,
-                            error=str(exc),
-                        )
+            if error is None and submit_result is None:
+                error = Exception(f"{action} execute returned None")
+            if error is not None:
+                retry_result = self._retry_failed_binary_batch(
+                    action, is_negative_risk, condition_ids, txs_by_condition, error
+                )
+                if retry_result is not None:
+                    batch_result.success_list.extend(retry_result.success_list)
+                    batch_result.error_list.extend(retry_result.error_list)
+                    continue
+                batch_result.error_list.append(
+                    BatchBinaryOperationErrorItem(
+                        negative_risk=is_negative_risk,
+                        condition_ids=condition_ids,
+                        error=str(error),
                     )
+                )
+                continue
+            batch_result.success_list.append(
+                BatchBinaryOperationSuccessItem(
+                    negative_risk=is_negative_risk,
+                    condition_ids=condition_ids,
+                    result=submit_result,
+                )
+            )
         return batch_result
 
+    def _retry_failed_binary_batch(
+            self,
+            action: str,
+            is_negative_risk: bool,
+            condition_ids: list[str],
+            txs_by_condition: dict[str, list[Any]],
+            error: Exception,
+    ) -> BatchBinaryOperationResult | None:
+        tx_type = f"neg_risk_{action}" if is_negative_risk else action
+        units = []
+        for condition_id in dict.fromkeys(condition_ids):
+            txs = txs_by_condition[condition_id]
+            units.append(GasUnit(condition_id, txs, [tx_type] * len(txs)))
+        retry = self._retry_failed_batch(
+            units, error, action, lambda ok_units: [tx for unit in ok_units for tx in unit.txs]
+        )
+        if retry is None:
+            return None
+        ok_units, submit_result, failed, submit_error = retry
+        retry_result = BatchBinaryOperationResult()
+        for unit, exc in failed:
+            retry_result.error_list.append(
+                BatchBinaryOperationErrorItem(
+                    negative_risk=is_negative_risk,
+                    condition_ids=[unit.key],
+                    error=str(exc),
+                )
+            )
+        if not ok_units:
+            return retry_result
+        ok_condition_ids = [unit.key for unit in ok_units]
+        if submit_error is not None:
+            retry_result.error_list.append(
+                BatchBinaryOperationErrorItem(
+                    negative_risk=is_negative_risk,
+                    condition_ids=ok_condition_ids,
+                    error=str(submit_error),
+                )
+            )
+        else:
+            retry_result.success_list.append(
+                BatchBinaryOperationSuccessItem(
+                    negative_risk=is_negative_risk,
+                    condition_ids=ok_condition_ids,
+                    result=submit_result,
+                )
+            )
+        return retry_result
+
+    def _retry_failed_batch(
+            self,
+            units: list[GasUnit],
+            error: Exception,
+            metadata: str,
+            build_txs: Callable[[list[GasUnit]], list[Any]],
+    ) -> tuple[list[GasUnit], Any, list[tuple[GasUnit, Exception]], Exception | None] | None:
+        """
+        Bisect a failed batch with ``estimate_batch_gas`` and resubmit the units
+        that simulate cleanly in one submission. Returns ``(resubmitted_units,
+        result, failed_units, resubmit_error)``, or ``None`` when isolation is
+        off or the simulation cannot pin the failure on specific units.
+        """
+        if not self.isolate_failed_batches or len(units) < 2:
+            return None
+        if "quota exceeded" in str(error).lower():
+            return None
+        batcher = AdaptiveBatcher(
+            self.gas_model or GasModel(), None, estimate_batch=self.estimate_batch_gas
+        )
+        ok_units, failed = batcher.isolate(units)
+        if not failed:
+            return None
+        logger.warning(
+            f"{metadata} batch failed, isolated {[unit.key for unit, _ in failed]} "
+            f"by simulation, resubmitting {len(ok_units)} remaining"
+        )
+        if not ok_units:
+            return [], None, failed, None
+        try:
+            submit_result = self._quota_guarded(self._submit_transactions)(
+                build_txs(ok_units), metadata
+            )
+            if submit_result is None:
+                raise Exception(f"{metadata} execute returned None")
+        except Exception as exc:
+            return ok_units, None, failed, exc
+        return ok_units, submit_result, failed, None
+
+    def _gas_batched_binary_jobs(
+            self,
+            action: str,
+            grouped_operations: dict[bool, list[tuple[BatchBinaryOperationItem, Any]]],
+    ) -> list[tuple[Any, Callable[[], BuiltBatch]]]:
+        batcher = self._gas_batcher()
+        jobs = []
+        for is_negative_risk in (False, True):
+            units = self._binary_gas_units(
+                action, is_negative_risk, grouped_operations[is_negative_risk]
+            )
+            for batch_units in batcher.pack(units):
+                jobs.append(
+                    (
+                        (is_negative_risk, [unit.key for unit in batch_units], []),
+                        partial(
+                            self._isolate_binary_batch,
+                            batcher,
+                            batch_units,
+                            is_negative_risk,
+                        ),
+                    )
+                )
+        return jobs
+
+    @staticmethod
+    def _isolate_binary_batch(
+            batcher: AdaptiveBatcher,
+            units: list[GasUnit],
+            is_negative_risk: bool,
+    ) -> BuiltBatch:
+        ok_units, failed = batcher.isolate(units)
+        errors = [
+            BatchBinaryOperationErrorItem(
+                negative_risk=is_negative_risk,
+                condition_ids=[unit.key],
+                error=str(exc),
+            )
+            for unit, exc in failed
+        ]
+        return BuiltBatch(
+            [tx for unit in ok_units for tx in unit.txs],
+            (is_negative_risk, [unit.key for unit in ok_units], errors),
+        )
+
     def _build_redeem_txs_from_positions(
             self,
             positions: list[dict],
@@ -520,9 +988,11 @@ class BaseWeb3Service:
                 )
             )
         wrap_amount = 0
+        if wrap_redeemed_collateral and normal_conditions:
+            wrap_amount = sum(
+                self.get_redeemable_payout_amounts(list(normal_conditions)).values()
+            )
         for condition_id in normal_conditions:
-            if wrap_redeemed_collateral:
-                wrap_amount += self.get_redeemable_payout_amount(condition_id)
             txs.append(
                 self._build_redeem_tx(
                     CTF_ADDRESS,
@@ -533,86 +1003,242 @@ class BaseWeb3Service:
             txs.extend(self._build_wrap_redeemed_collateral_txs(wrap_amount))
         return txs
 
-    def _submit_transactions(self, txs: list[Any], metadata: str) -> dict | None:
+    def _fetch_relayer_nonce(self) -> int | str:
+        raise NotImplementedError("relayer nonce not implemented")
+
+    def _send_transactions(self, txs: list[Any], metadata: str) -> Any:
+        """
+        Sign and hand one batch to the relayer without waiting for it to be
+        mined; returns whatever ``_wait_transactions`` needs to confirm it.
+        """
         raise NotImplementedError("transaction submit not implemented")
 
+    def _wait_transactions(self, pending: Any) -> dict | None:
+        raise NotImplementedError("transaction submit not implemented")
+
+    def _submit_transactions(self, txs: list[Any], metadata: str) -> dict | None:
+        return self._wait_transactions(self._send_and_notify(txs, metadata))
+
+    def _send_and_notify(self, txs: list[Any], metadata: str) -> Any:
+        pending = self._send_transactions(txs, metadata)
+        notify_submitted(self._pending_transaction_id(pending))
+        return pending
+
+    def _pending_transaction_id(self, pending: Any) -> str | None:
+        return getattr(pending, "transaction_id", None)
+
+    def _wait_relayer_transaction(
+            self, transaction_id: str | None, poll: Callable[[], dict | None]
+    ) -> dict | None:
+        """
+        Wait for a relayer transaction through ``status_tracker`` when one is
+        set, otherwise with the relayer client's own per-transaction ``poll``.
+        """
+        if self.status_tracker is None:
+            return poll()
+        if not transaction_id:
+            return None
+        return self.status_tracker.wait(transaction_id)
+
+    def _run_submission_pipeline(
+            self,
+            jobs: Iterable[tuple[Any, Callable[[], list[Any]]]],
+            metadata: str,
+    ) -> list[tuple[Any, Any, Exception | None]]:
+        """
+        Build and submit ``(context, build)`` jobs. With ``pipeline_depth > 1``
+        the next batch is built and sent while earlier ones are still confirming.
+        """
+        if self.pipeline_depth > 1:
+            executor = PipelinedExecutor(
+                self._quota_guarded(self._send_and_notify),
+                self._wait_transactions,
+                depth=self.pipeline_depth,
+            )
+        else:
+            executor = PipelinedExecutor(self._quota_guarded(self._submit_transactions))
+        return executor.run(jobs, metadata)
+
+    def _quota_guarded(
+            self, send: Callable[[list[Any], str], Any]
+    ) -> Callable[[list[Any], str], Any]:
+        """
+        Wrap a relayer submit so it spends one ``quota_tracker`` token, fails
+        fast when none is left and records relayer quota errors with their reset time.
+        """
+        if self.quota_tracker is None:
+            return send
+
+        def guarded(txs: list[Any], metadata: str) -> Any:
+            signer = self.clob_client.get_address()
+            if not self.quota_tracker.try_acquire(signer):
+                wait_seconds = self.quota_tracker.seconds_until_available(signer)
+                raise Exception(
+                    f"relayer submit quota exceeded for {signer} (tracked locally), "
+                    f"next submit available in about {int(wait_seconds)} seconds"
+                )
+            try:
+                return send(txs, metadata)
+            except Exception as exc:
+                if "quota exceeded" in str(exc).lower():
+                    self.quota_tracker.record_quota_exceeded(
+                        signer, self._extract_quota_reset_seconds(str(exc))
+                    )
+                raise
+
+        return guarded
+
+    def _tx_target_and_data(self, tx: Any) -> tuple[str, str]:
+        return tx["to"], tx["data"]
+
+    def _simulation_txs(self, txs: list[Any]) -> list[dict]:
+        """
+        ``eth_estimateGas`` calls that stand for one batch: each tx sent from the
+        wallet. Wallets that can simulate the real batch call override this.
+        """
+        owner = self._resolve_user_address()
+        simulation_txs = []
+        for tx in txs:
+            to, data = self._tx_target_and_data(tx)
+            simulation_txs.append({"from": owner, "to": to, "data": data})
+        return simulation_txs
+
+    def estimate_batches_gas(self, tx_batches: list[list[Any]]) -> list[int | Exception]:
+        """
+        Simulate several batches in one JSON-RPC batch request. Each batch gets
+        its summed gas, or the error of its first reverting call.
+        """
+        simulations = [self._simulation_txs(txs) for txs in tx_batches]
+        flat_txs = [tx for simulation in simulations for tx in simulation]
+        results = self.api_client.batch_estimate_gas(flat_txs) if flat_txs else []
+        batch_gas: list[int | Exception] = []
+        offset = 0
+        for simulation in simulations:
+            chunk = results[offset: offset + len(simulation)]
+            offset += len(simulation)
+            error = next((item for item in chunk if isinstance(item, Exception)), None)
+            batch_gas.append(error if error is not None else sum(int(item) for item in chunk))
+        return batch_gas
+
+    def estimate_batch_gas(self, txs: list[Any]) -> int:
+        """
+        Simulate one batch and return its gas; raises if any call reverts.
+        """
+        gas = self.estimate_batches_gas([txs])[0]
+        if isinstance(gas, Exception):
+            raise gas
+        return gas
+
+    def _gas_batcher(self) -> AdaptiveBatcher:
+        if self.gas_model is None:
+            self.gas_model = GasModel()
+        return AdaptiveBatcher(
+            self.gas_model,
+            self.batch_gas_limit,
+            estimate_batch=self.estimate_batch_gas,
+        )
+
+    def _pack_units(
+            self, units: list[GasUnit], batch_size: int, reserve_gas: int = 0
+    ) -> list[list[GasUnit]]:
+        if self.batch_gas_limit:
+            return self._gas_batcher().pack(units, reserve_gas=reserve_gas)
+        if batch_size <= 0:
+            raise Exception("batch_size must be greater than 0")
+        return [units[i: i + batch_size] for i in range(0, len(units), batch_size)]
+
+    def _simulate_batches(
+            self,
+            action: str,
+            batches: list[list[GasUnit]],
+            unplanned: dict[str, str] | None = None,
+    ) -> DryRunResult:
+        """
+        Simulate every batch, and every unit in it on its own, through
+        ``estimate_batches_gas``: JSON-RPC batches sent concurrently. Nothing
+        is signed or sent to the relayer, so no submit quota is spent.
+        """
+
+        # One entry per batch, then one per unit of batches with several units.
+        tx_lists = [[tx for unit in batch for tx in unit.txs] for batch in batches]
+        for batch in batches:
+            if len(batch) > 1:
+                tx_lists.extend(unit.txs for unit in batch)
+        chunk_size = getattr(
+            self.api_client, "RPC_MAX_BATCH_SIZE", PolymarketAPIClient.RPC_MAX_BATCH_SIZE
+        )
+        with ThreadPoolExecutor(max_workers=self.DRY_RUN_MAX_WORKERS) as executor:
+            chunk_results = list(executor.map(
+                self.estimate_batches_gas,
+                [
+                    tx_lists[i: i + chunk_size]
+                    for i in range(0, len(tx_lists), chunk_size)
+                ],
+            ))
+        simulated = iter(
+            (None, gas) if isinstance(gas, Exception) else (gas, None)
+            for chunk in chunk_results
+            for gas in chunk
+        )
+        batch_results = [next(simulated) for _ in batches]
+        unit_results = [
+            [batch_result] if len(batch) == 1 else [next(simulated) for _ in batch]
+            for batch, batch_result in zip(batches, batch_results)
+        ]
+
+        dry_run_result = DryRunResult()
+        for condition_id, error in (unplanned or {}).items():
+            dry_run_result.condition_list.append(
+                DryRunConditionItem(
+                    condition_id=condition_id,
+                    action=action,
+                    success=False,
+                    error=error,
+                )
+            )
+        for batch, (batch_gas, batch_error), results in zip(
+                batches, batch_results, unit_results
+        ):
+            if batch_error is None and self.gas_model is not None:
+                self.gas_model.observe(
+                    [tx_type for unit in batch for tx_type in unit.tx_types], batch_gas
+                )
+            dry_run_result.batch_list.append(
+                DryRunBatchItem(
+                    action=action,
+                    condition_ids=[unit.key for unit in batch],
+                    success=batch_error is None,
+                    gas=batch_gas,
+                    error=None if batch_error is None else str(batch_error),
+                )
+            )
+            for unit, (gas, error) in zip(batch, results):
+                # A unit that passes alone still fails if its batch reverts.
+                error = error or batch_error
+                dry_run_result.condition_list.append(
+                    DryRunConditionItem(
+                        condition_id=unit.key,
+                        action=action,
+                        success=error is None,
+                        gas=gas,
+                        error=None if error is None else str(error),
+                    )
+                )
+        return dry_run_result
+
     def _submit_redeem(self, txs: list[Any]) -> dict | None:
         return self._submit_transactions(txs, "redeem")
 
-    @staticmethod
-    def _normalize_position_size(size: Any) -> float:
-        try:
-            return float(size or 0)
-        except (TypeError, ValueError):
-            return 0.0
-
     @classmethod
     def _build_merge_plan_from_positions(
             cls,
-            positions: list[dict],
+            positions: Iterable[dict],
             min_usdc: int | float | str | Decimal = 5,
             exclude_neg_risk: bool = True,
     ) -> list[MergePlanItem]:
-        min_usdc_float = float(Decimal(str(min_usdc)))
-        positions_by_condition: dict[str, list[dict]] = {}
-        for pos in positions:
-            condition_id = pos.get("conditionId")
-            if not condition_id:
-                continue
-            positions_by_condition.setdefault(condition_id, []).append(pos)
-
-        plan_list: list[MergePlanItem] = []
-        for condition_id, condition_positions in positions_by_condition.items():
-            yes_balance = 0.0
-            no_balance = 0.0
-            negative_risk = False
-            market_slug = None
-            invalid_outcome_index = False
-
-            for pos in condition_positions:
-                market_slug = market_slug or pos.get("slug")
-                negative_risk = negative_risk or bool(pos.get("negativeRisk"))
-                outcome_index = pos.get("outcomeIndex")
-                size = cls._normalize_position_size(pos.get("size"))
-                if outcome_index == 0:
-                    yes_balance += size
-                elif outcome_index == 1:
-                    no_balance += size
-                else:
-                    invalid_outcome_index = True
-
-            mergeable = min(yes_balance, no_balance)
-            reason = None
-            if invalid_outcome_index:
-                reason = "unsupported_outcome_index"
-            elif exclude_neg_risk and negative_risk:
-                reason = "negative_risk_excluded"
-            elif yes_balance <= 0 or no_balance <= 0:
-                reason = "missing_opposite_side"
-            elif mergeable < min_usdc_float:
-                reason = "below_min_usdc"
-
-            plan_list.append(
-                MergePlanItem(
-                    condition_id=condition_id,
-                    market_slug=market_slug,
-                    yes_balance=yes_balance,
-                    no_balance=no_balance,
-                    mergeable=mergeable,
-                    negative_risk=negative_risk,
-                    reason=reason,
-                )
-            )
-
-        return sorted(
-            plan_list,
-            key=lambda item: (
-                item.reason is not None,
-                -item.mergeable,
-                item.market_slug or "",
-                item.condition_id,
-            ),
-        )
+        planner = MergePlanner()
+        planner.add_many(positions)
+        return planner.build(min_usdc=min_usdc, exclude_neg_risk=exclude_neg_risk)
 
     @staticmethod
     def _build_redeem_error_items(
@@ -650,14 +1276,16 @@ class BaseWeb3Service:
             return RedeemResult()
         user_address = self._resolve_user_address()
         redeem_result = RedeemResult()
+        # With a gas limit, positions of all fetch batches are packed together.
+        gas_batched_positions: list[dict] = []
         for batch in self._chunk_condition_ids(condition_ids, batch_size):
-            positions = self.api_client.fetch_positions_by_condition_ids(
-                user_address=user_address, condition_ids=batch
-            )
+            positions = self._fetch_positions_by_condition_ids(batch, user_address)
             position_condition_ids = {
                 pos.get("conditionId") for pos in positions if pos.get("conditionId")
             }
-            if positions:
+            if positions and self.batch_gas_limit:
+                gas_batched_positions.extend(positions)
+            elif positions:
                 batch_result = self._redeem_from_positions(
                     positions,
                     len(batch),
@@ -680,6 +1308,14 @@ class BaseWeb3Service:
                 )
                 redeem_result.success_list.extend(chain_result.success_list)
                 redeem_result.error_list.extend(chain_result.error_list)
+        if gas_batched_positions:
+            batch_result = self._redeem_from_positions(
+                gas_batched_positions,
+                batch_size,
+                wrap_redeemed_collateral=wrap_redeemed_collateral,
+            )
+            redeem_result.success_list.extend(batch_result.success_list)
+            redeem_result.error_list.extend(batch_result.error_list)
         return redeem_result
 
     def _redeem_conditions_from_chain(
@@ -690,87 +1326,165 @@ class BaseWeb3Service:
             wrap_redeemed_collateral: bool = True,
     ) -> RedeemResult:
         redeem_result = RedeemResult()
+        negative_risk_flags = self.prefetch_negative_risk_flags(condition_ids)
+        jobs = []
         for batch in self._chunk_condition_ids(condition_ids, batch_size):
-            txs: list[Any] = []
-            tx_condition_ids: list[str] = []
-            wrap_amount = 0
-            for condition_id in batch:
-                try:
-                    if self.is_negative_risk_condition(condition_id):
-                        redeem_result.error_list.append(
-                            RedeemErrorItem(
-                                condition_id=condition_id,
-                                error=(
-                                    "negative risk direct chain redeem is not supported "
-                                    "without position amounts from the Data API"
-                                ),
-                            )
-                        )
-                        continue
-                    if not self.is_condition_resolved(condition_id):
-                        redeem_result.error_list.append(
-                            RedeemErrorItem(
-                                condition_id=condition_id,
-                                error="condition is not resolved",
-                            )
-                        )
-                        continue
-                    balances = self.get_redeemable_index_and_balance(
-                        condition_id=condition_id,
+            jobs.append(
+                (
+                    (batch, []),
+                    partial(
+                        self._build_chain_redeem_batch,
+                        batch,
+                        negative_risk_flags,
                         collateral_token=collateral_token,
-                    )
-                    if not balances:
-                        redeem_result.error_list.append(
-                            RedeemErrorItem(
-                                condition_id=condition_id,
-                                error=(
-                                    "no redeemable ERC1155 balance found on-chain "
-                                    f"for collateral_token={collateral_token}"
-                                ),
-                            )
-                        )
-                        continue
-                    if wrap_redeemed_collateral and collateral_token == CTF_COLLATERAL_TOKEN:
-                        wrap_amount += self.get_redeemable_payout_amount(
+                        wrap_redeemed_collateral=wrap_redeemed_collateral,
+                    ),
+                )
+            )
+
+        for (tx_condition_ids, build_errors), redeem_res, error in (
+                self._run_submission_pipeline(jobs, "redeem")
+        ):
+            redeem_result.error_list.extend(build_errors)
+            if not tx_condition_ids:
+                continue
+            if error is None and redeem_res is None:
+                error = Exception("redeem execute returned None")
+            if error is not None:
+                for condition_id in tx_condition_ids:
+                    redeem_result.error_list.append(
+                        RedeemErrorItem(
                             condition_id=condition_id,
-                            collateral_token=collateral_token,
-                        )
-                    txs.append(
-                        self._build_redeem_tx(
-                            CTF_ADDRESS,
-                            self.build_ctf_redeem_tx_data(
-                                condition_id=condition_id,
-                                collateral_token=collateral_token,
-                            ),
+                            error=str(error),
                         )
                     )
-                    tx_condition_ids.append(condition_id)
-                except Exception as exc:
-                    redeem_result.error_list.append(
+                continue
+            redeem_result.success_list.append(redeem_res)
+        return redeem_result
+
+    def _build_chain_redeem_batch(
+            self,
+            batch: list[str],
+            negative_risk_flags: dict[str, bool],
+            collateral_token: str = CTF_COLLATERAL_TOKEN,
+            wrap_redeemed_collateral: bool = True,
+    ) -> BuiltBatch:
+        txs, tx_condition_ids, errors = self._build_chain_redeem_txs(
+            batch,
+            negative_risk_flags,
+            collateral_token=collateral_token,
+            wrap_redeemed_collateral=wrap_redeemed_collateral,
+        )
+        return BuiltBatch(txs, (tx_condition_ids, errors))
+
+    def _build_chain_redeem_txs(
+            self,
+            batch: list[str],
+            negative_risk_flags: dict[str, bool],
+            collateral_token: str = CTF_COLLATERAL_TOKEN,
+            wrap_redeemed_collateral: bool = True,
+    ) -> tuple[list[Any], list[str], list[RedeemErrorItem]]:
+        """
+        Read payout state for one batch of conditions and build its redeem txs.
+        Returns ``(txs, tx_condition_ids, errors)``: the conditions that made it
+        into the txs and those that cannot be redeemed, with their error.
+        """
+        txs: list[Any] = []
+        tx_condition_ids: list[str] = []
+        errors: list[RedeemErrorItem] = []
+        wrap_amount = 0
+        candidate_condition_ids: list[str] = []
+        for condition_id in batch:
+            try:
+                is_negative_risk = (
+                    negative_risk_flags[condition_id]
+                    if condition_id in negative_risk_flags
+                    else self.is_negative_risk_condition(condition_id)
+                )
+                if is_negative_risk:
+                    errors.append(
                         RedeemErrorItem(
                             condition_id=condition_id,
-                            error=str(exc),
+                            error=(
+                                "negative risk direct chain redeem is not supported "
+                                "without position amounts from the Data API"
+                            ),
                         )
                     )
+                    continue
+                candidate_condition_ids.append(condition_id)
+            except Exception as exc:
+                errors.append(
+                    RedeemErrorItem(
+                        condition_id=condition_id,
+                        error=str(exc),
+                    )
+                )
+        if not candidate_condition_ids:
+            return txs, tx_condition_ids, errors
 
-            if not txs:
-                continue
-            if wrap_redeemed_collateral and wrap_amount > 0:
-                txs.extend(self._build_wrap_redeemed_collateral_txs(wrap_amount))
+        try:
+            states = self.get_condition_payout_states(
+                candidate_condition_ids,
+                collateral_token=collateral_token,
+            )
+        except Exception as exc:
+            for condition_id in candidate_condition_ids:
+                errors.append(
+                    RedeemErrorItem(
+                        condition_id=condition_id,
+                        error=str(exc),
+                    )
+                )
+            return txs, tx_condition_ids, errors
+
+        for condition_id in candidate_condition_ids:
             try:
-                redeem_res = self._submit_redeem(txs)
-                if redeem_res is None:
-                    raise Exception("redeem execute returned None")
-                redeem_result.success_list.append(redeem_res)
-            except Exception as exc:
-                for condition_id in tx_condition_ids:
-                    redeem_result.error_list.append(
+                state = states[condition_id]
+                if state.error:
+                    raise Exception(state.error)
+                if not state.resolved:
+                    errors.append(
                         RedeemErrorItem(
                             condition_id=condition_id,
-                            error=str(exc),
+                            error="condition is not resolved",
                         )
                     )
-        return redeem_result
+                    continue
+                if not state.redeemable_index_and_balance:
+                    errors.append(
+                        RedeemErrorItem(
+                            condition_id=condition_id,
+                            error=(
+                                "no redeemable ERC1155 balance found on-chain "
+                                f"for collateral_token={collateral_token}"
+                            ),
+                        )
+                    )
+                    continue
+                if wrap_redeemed_collateral and collateral_token == CTF_COLLATERAL_TOKEN:
+                    wrap_amount += state.payout_amount
+                txs.append(
+                    self._build_redeem_tx(
+                        CTF_ADDRESS,
+                        self.build_ctf_redeem_tx_data(
+                            condition_id=condition_id,
+                            collateral_token=collateral_token,
+                        ),
+                    )
+                )
+                tx_condition_ids.append(condition_id)
+            except Exception as exc:
+                errors.append(
+                    RedeemErrorItem(
+                        condition_id=condition_id,
+                        error=str(exc),
+                    )
+                )
+
+        if txs and wrap_redeemed_collateral and wrap_amount > 0:
+            txs.extend(self._build_wrap_redeemed_collateral_txs(wrap_amount))
+        return txs, tx_condition_ids, errors
 
     def _redeem_from_positions(
             self,
@@ -791,36 +1505,59 @@ class BaseWeb3Service:
             positions_by_condition.setdefault(condition_id, []).append(pos)
 
         redeem_result = RedeemResult()
-        condition_ids = list(positions_by_condition.keys())
-        for batch in self._chunk_condition_ids(condition_ids, batch_size):
-            batch_positions = []
-            for condition_id in batch:
-                batch_positions.extend(positions_by_condition.get(condition_id, []))
-            try:
-                txs = self._build_redeem_txs_from_positions(
-                    batch_positions,
-                    wrap_redeemed_collateral=wrap_redeemed_collateral,
+        if self.batch_gas_limit:
+            jobs = self._gas_batched_redeem_jobs(
+                positions_by_condition, redeem_result, wrap_redeemed_collateral
+            )
+        else:
+            jobs = []
+            for batch in self._chunk_condition_ids(list(positions_by_condition), batch_size):
+                batch_positions = []
+                for condition_id in batch:
+                    batch_positions.extend(positions_by_condition.get(condition_id, []))
+                jobs.append(
+                    (
+                        (batch_positions, []),
+                        partial(
+                            self._build_redeem_txs_from_positions,
+                            batch_positions,
+                            wrap_redeemed_collateral=wrap_redeemed_collateral,
+                        ),
+                    )
                 )
-                if not txs:
+
+        for (batch_positions, build_errors), redeem_res, error in (
+                self._run_submission_pipeline(jobs, "redeem")
+        ):
+            redeem_result.error_list.extend(build_errors)
+            if not batch_positions:
+                continue
+            if error is None and redeem_res is None:
+                error = Exception("redeem execute returned None")
+            if error is not None:
+                retry_result = self._retry_failed_redeem_batch(
+                    batch_positions, error, wrap_redeemed_collateral
+                )
+                if retry_result is not None:
+                    redeem_result.success_list.extend(retry_result.success_list)
+                    redeem_result.error_list.extend(retry_result.error_list)
                     continue
-                redeem_res = self._submit_redeem(txs)
-                if redeem_res is None:
-                    raise Exception("redeem execute returned None")
-                redeem_result.success_list.append(redeem_res)
-                for pos in batch_positions:
-                    buy_price = pos.get("avgPrice")
-                    size = pos.get("size")
-                    if not buy_price or not size:
-                        continue
-                    volume = 1 / buy_price * (buy_price * size)
-                    logger.info(
-                        f"{pos.get('slug')} redeem success, volume={volume:.4f} CTF units"
-                    )
-            except Exception as e:
                 redeem_result.error_list.extend(
-                    self._build_redeem_error_items(batch_positions, e)
+                    self._build_redeem_error_items(batch_positions, error)
+                )
+                batch = list(dict.fromkeys(pos.get("conditionId") for pos in batch_positions))
+                logger.error(f"redeem batch error, {batch=}, error={error}")
+                continue
+            redeem_result.success_list.append(redeem_res)
+            for pos in batch_positions:
+                buy_price = pos.get("avgPrice")
+                size = pos.get("size")
+                if not buy_price or not size:
+                    continue
+                volume = 1 / buy_price * (buy_price * size)
+                logger.info(
+                    f"{pos.get('slug')} redeem success, volume={volume:.4f} CTF units"
                 )
-                logger.error(f"redeem batch error, {batch=}, error={e}")
         if redeem_result.error_list:
             logger.warning(
                 "error redeem condition list, "
@@ -828,6 +1565,204 @@ class BaseWeb3Service:
             )
         return redeem_result
 
+    def _retry_failed_redeem_batch(
+            self,
+            batch_positions: list[dict],
+            error: Exception,
+            wrap_redeemed_collateral: bool = True,
+    ) -> RedeemResult | None:
+        positions_by_condition: dict[str, list[dict]] = {}
+        for pos in batch_positions:
+            if pos.get("conditionId"):
+                positions_by_condition.setdefault(pos["conditionId"], []).append(pos)
+        units, errors = self._build_redeem_units(positions_by_condition)
+        if errors:
+            return None
+
+        def build_txs(ok_units: list[GasUnit]) -> list[Any]:
+            txs = [tx for unit in ok_units for tx in unit.txs]
+            normal_condition_ids = [
+                unit.key
+                for unit in ok_units
+                if not any(pos.get("negativeRisk") for pos in positions_by_condition[unit.key])
+            ]
+            if wrap_redeemed_collateral and normal_condition_ids:
+                wrap_amount = sum(
+                    self.get_redeemable_payout_amounts(normal_condition_ids).values()
+                )
+                txs.extend(self._build_wrap_redeemed_collateral_txs(wrap_amount))
+            return txs
+
+        retry = self._retry_failed_batch(units, error, "redeem", build_txs)
+        if retry is None:
+            return None
+        ok_units, submit_result, failed, submit_error = retry
+        retry_result = RedeemResult()
+        for unit, exc in failed:
+            retry_result.error_list.extend(
+                self._build_redeem_error_items(positions_by_condition[unit.key], exc)
+            )
+        ok_positions = [
+            pos for unit in ok_units for pos in positions_by_condition[unit.key]
+        ]
+        if submit_error is not None:
+            retry_result.error_list.extend(
+                self._build_redeem_error_items(ok_positions, submit_error)
+            )
+        elif ok_units:
+            retry_result.success_list.append(submit_result)
+        return retry_result
+
+    def _gas_batched_redeem_jobs(
+            self,
+            positions_by_condition: dict[str, list[dict]],
+            redeem_result: RedeemResult,
+            wrap_redeemed_collateral: bool = True,
+    ) -> list[tuple[Any, Callable[[], BuiltBatch]]]:
+        batcher = self._gas_batcher()
+        units, errors = self._build_redeem_units(positions_by_condition)
+        for condition_id, exc in errors.items():
+            redeem_result.error_list.extend(
+                self._build_redeem_error_items(positions_by_condition[condition_id], exc)
+            )
+
+        reserve_gas = (
+            batcher.gas_model.predict(["approve", "wrap"])
+            if wrap_redeemed_collateral
+            else 0
+        )
+        jobs = []
+        for batch_units in batcher.pack(units, reserve_gas=reserve_gas):
+            batch_positions = [
+                pos for unit in batch_units for pos in positions_by_condition[unit.key]
+            ]
+            jobs.append(
+                (
+                    (batch_positions, []),
+                    partial(
+                        self._build_gas_batched_redeem_txs,
+                        batcher,
+                        batch_units,
+                        positions_by_condition,
+                        wrap_redeemed_collateral,
+                    ),
+                )
+            )
+        return jobs
+
+    def _build_redeem_units(
+            self, positions_by_condition: dict[str, list[dict]]
+    ) -> tuple[list[GasUnit], dict[str, Exception]]:
+        """
+        Build one unit of redeem txs (without wrap) per condition; conditions
+        whose txs cannot be built are returned with their error.
+        """
+        units: list[GasUnit] = []
+        errors: dict[str, Exception] = {}
+        for condition_id, condition_positions in positions_by_condition.items():
+            try:
+                txs = self._build_redeem_txs_from_positions(
+                    condition_positions, wrap_redeemed_collateral=False
+                )
+            except Exception as exc:
+                errors[condition_id] = exc
+                continue
+            if not txs:
+                continue
+            tx_type = (
+                "neg_risk_redeem"
+                if any(pos.get("negativeRisk") for pos in condition_positions)
+                else "redeem"
+            )
+            units.append(GasUnit(condition_id, txs, [tx_type] * len(txs)))
+        return units, errors
+
+    def _dry_run_redeem(
+            self,
+            positions: list[dict],
+            batch_size: int,
+            chain_condition_ids: list[str] | None = None,
+            collateral_token: str = CTF_COLLATERAL_TOKEN,
+    ) -> DryRunResult:
+        """
+        Simulate the redeem txs a real run would submit, batched the same way.
+        Wrap txs are left out: they spend collateral the redeems have not paid
+        out yet, so they cannot be simulated on their own.
+        """
+        positions_by_condition: dict[str, list[dict]] = {}
+        for pos in positions:
+            if pos.get("conditionId"):
+                positions_by_condition.setdefault(pos["conditionId"], []).append(pos)
+        units, errors = self._build_redeem_units(positions_by_condition)
+        unplanned = {condition_id: str(exc) for condition_id, exc in errors.items()}
+        if chain_condition_ids:
+            txs, tx_condition_ids, chain_errors = self._build_chain_redeem_txs(
+                chain_condition_ids,
+                self.prefetch_negative_risk_flags(chain_condition_ids),
+                collateral_token=collateral_token,
+                wrap_redeemed_collateral=False,
+            )
+            units.extend(
+                GasUnit(condition_id, [tx], ["redeem"])
+                for condition_id, tx in zip(tx_condition_ids, txs)
+            )
+            for item in chain_errors:
+                unplanned.setdefault(item.condition_id, item.error)
+        return self._simulate_batches(
+            "redeem", self._pack_units(units, batch_size), unplanned
+        )
+
+    def _dry_run_redeem_conditions(
+            self,
+            condition_ids: list[str],
+            batch_size: int,
+            collateral_token: str = CTF_COLLATERAL_TOKEN,
+    ) -> DryRunResult:
+        user_address = self._resolve_user_address()
+        positions: list[dict] = []
+        missing_condition_ids: list[str] = []
+        for batch in self._chunk_condition_ids(condition_ids, batch_size):
+            batch_positions = self._fetch_positions_by_condition_ids(batch, user_address)
+            positions.extend(batch_positions)
+            found = {pos.get("conditionId") for pos in batch_positions}
+            missing_condition_ids.extend(
+                condition_id for condition_id in batch if condition_id not in found
+            )
+        return self._dry_run_redeem(
+            positions, batch_size, missing_condition_ids, collateral_token
+        )
+
+    def _build_gas_batched_redeem_txs(
+            self,
+            batcher: AdaptiveBatcher,
+            units: list[GasUnit],
+            positions_by_condition: dict[str, list[dict]],
+            wrap_redeemed_collateral: bool,
+    ) -> BuiltBatch:
+        """
+        Simulate one packed batch, drop the conditions that revert and add the
+        wrap txs for what is left. The context is ``(positions, errors)``.
+        """
+        ok_units, failed = batcher.isolate(units)
+        errors = [
+            item
+            for unit, exc in failed
+            for item in self._build_redeem_error_items(positions_by_condition[unit.key], exc)
+        ]
+        batch_positions = [
+            pos for unit in ok_units for pos in positions_by_condition[unit.key]
+        ]
+        txs = [tx for unit in ok_units for tx in unit.txs]
+        normal_condition_ids = [
+            unit.key for unit in ok_units if "neg_risk_redeem" not in unit.tx_types
+        ]
+        if wrap_redeemed_collateral and normal_condition_ids:
+            wrap_amount = sum(
+                self.get_redeemable_payout_amounts(normal_condition_ids).values()
+            )
+            txs.extend(self._build_wrap_redeemed_collateral_txs(wrap_amount))
+        return BuiltBatch(txs, (batch_positions, errors))
+
     def _get_relay_payload(self, address: str, wallet_type: WalletType):
         return self.api_client.get_relay_payload(address, wallet_type)
 
@@ -926,12 +1861,18 @@ class BaseWeb3Service:
             batch_size: int = 10,
             collateral_token: str = CTF_COLLATERAL_TOKEN,
             wrap_redeemed_collateral: bool = True,
-    ) -> RedeemResult:
+            dry_run: bool = False,
+    ) -> RedeemResult | DryRunResult:
         """
-        Redeem positions for the given condition IDs.
+        Redeem positions for the given condition IDs. With ``dry_run`` the
+        redeem txs are only simulated and a ``DryRunResult`` is returned.
         """
         if isinstance(condition_ids, str):
             condition_ids = [condition_ids]
+        if dry_run:
+            return self._dry_run_redeem_conditions(
+                condition_ids, batch_size, collateral_token
+            )
         return self._redeem_batch(
             condition_ids=condition_ids,
             batch_size=batch_size,
@@ -943,19 +1884,60 @@ class BaseWeb3Service:
             self,
             batch_size: int = 10,
             wrap_redeemed_collateral: bool = True,
-    ) -> RedeemResult:
+            dry_run: bool = False,
+    ) -> RedeemResult | DryRunResult:
         """
         Redeem all currently redeemable positions for the user.
         """
-        positions = self.api_client.fetch_redeemable_positions(
-            user_address=self._resolve_user_address()
-        )
+        positions = self._fetch_redeemable_positions()
+        if dry_run:
+            return self._dry_run_redeem(positions, batch_size)
         return self._redeem_from_positions(
             positions,
             batch_size,
             wrap_redeemed_collateral=wrap_redeemed_collateral,
         )
 
+    def _fetch_redeemable_positions(self) -> list[dict]:
+        if self.position_index is not None:
+            self.position_index.sync()
+            return self.position_index.redeemable_positions()
+        return self.api_client.fetch_redeemable_positions(
+            user_address=self._resolve_user_address()
+        )
+
+    def _fetch_positions_by_condition_ids(
+            self, condition_ids: list[str], user_address: str | None = None
+    ) -> list[dict]:
+        if self.position_index is not None:
+            self.position_index.sync()
+            return self.position_index.redeemable_positions(condition_ids)
+        return self.api_client.fetch_positions_by_condition_ids(
+            user_address=user_address or self._resolve_user_address(),
+            condition_ids=condition_ids,
+        )
+
+    def enable_position_index(
+            self,
+            start_block: int,
+            path: str | None = None,
+            **kwargs: Any,
+    ) -> PositionIndex:
+        """
+        Take redeem and merge candidates from a local event-log index instead
+        of the Data API. ``start_block`` should be at or before the wallet's
+        first CTF activity; later syncs only scan blocks past the checkpoint.
+        """
+        self.position_index = PositionIndex(
+            owner=self._resolve_user_address(),
+            api_client=self.api_client,
+            path=path,
+            start_block=start_block,
+            payout_reader=self.get_payout_vectors,
+            **kwargs,
+        )
+        return self.position_index
+
     def plan_merge_all(
             self,
             min_usdc: int | float | str | Decimal = 0.5,
@@ -964,24 +1946,49 @@ class BaseWeb3Service:
         """
         Scan current positions and compute merge opportunities without executing.
         """
-        positions = self.api_client.fetch_all_mergeable_positions(
-            user_address=self._resolve_user_address()
-        )
+        if self.position_index is not None:
+            self.position_index.sync()
+            positions = self.position_index.mergeable_positions()
+        else:
+            positions = self.api_client.fetch_all_mergeable_positions(
+                user_address=self._resolve_user_address()
+            )
         return self._build_merge_plan_from_positions(
             positions=positions,
             min_usdc=min_usdc,
             exclude_neg_risk=exclude_neg_risk,
         )
 
+    def iter_merge_plan(
+            self,
+            min_usdc: int | float | str | Decimal = 0.5,
+            exclude_neg_risk: bool = False,
+    ) -> Iterator[list[MergePlanItem]]:
+        """
+        Stream mergeable positions page by page and yield the cumulative merge
+        plan after each page; the last snapshot equals ``plan_merge_all``.
+        """
+        if self.position_index is not None:
+            yield self.plan_merge_all(min_usdc=min_usdc, exclude_neg_risk=exclude_neg_risk)
+            return
+        planner = MergePlanner()
+        for page in self.api_client.iter_position_pages(
+                self._resolve_user_address(), mergeable=True
+        ):
+            planner.add_many(page)
+            yield planner.build(min_usdc=min_usdc, exclude_neg_risk=exclude_neg_risk)
+
     def merge_all(
             self,
             min_usdc: int | float | str | Decimal = 0.5,
             exclude_neg_risk: bool = False,
             max_markets: int = 100,
             batch_size: int = 10,
-    ) -> MergeAllResult:
+            dry_run: bool = False,
+    ) -> MergeAllResult | DryRunResult:
         """
         Plan and optionally execute merge operations across all mergeable markets.
+        With ``dry_run`` the planned merges are only simulated.
         """
         if max_markets <= 0:
             raise Exception("max_markets must be greater than 0")
@@ -1004,20 +2011,25 @@ class BaseWeb3Service:
             and item.mergeable >= min_usdc_float
         ][:max_markets]
         if not executable_plans:
-            return merge_result
+            return DryRunResult() if dry_run else merge_result
 
         plan_by_condition = {
             item.condition_id: item for item in executable_plans
         }
+        operations = [
+            {
+                "condition_id": item.condition_id,
+                "amount": item.mergeable,
+                "negative_risk": item.negative_risk,
+            }
+            for item in executable_plans
+        ]
+        if dry_run:
+            return self.merge_batch(
+                operations=operations, batch_size=batch_size, dry_run=True
+            )
         batch_result = self.merge_batch(
-            operations=[
-                {
-                    "condition_id": item.condition_id,
-                    "amount": item.mergeable,
-                    "negative_risk": item.negative_risk,
-                }
-                for item in executable_plans
-            ],
+            operations=operations,
             batch_size=batch_size,
         )
 
@@ -1057,6 +2069,12 @@ class BaseWeb3Service:
                 )
         return merge_result
 
+    def transaction_plan(self) -> TransactionPlan:
+        """
+        Start a plan that bundles redeem/merge/split/wrap txs into few submissions.
+        """
+        return TransactionPlan(self)
+
     def split(
             self,
             condition_id: str,
@@ -1080,7 +2098,7 @@ class BaseWeb3Service:
             parent_collection_id=parent_collection_id,
             negative_risk=negative_risk,
         )
-        return self._submit_transactions([tx], "split")
+        return self._quota_guarded(self._submit_transactions)([tx], "split")
 
     def split_batch(
             self,
@@ -1088,10 +2106,19 @@ class BaseWeb3Service:
             batch_size: int = 10,
             collateral_token: str = DEFAULT_COLLATERAL_TOKEN,
             parent_collection_id: str = ZERO_BYTES32,
-    ) -> BatchBinaryOperationResult:
+            dry_run: bool = False,
+    ) -> BatchBinaryOperationResult | DryRunResult:
         """
         Split multiple binary markets in batches. Each operation carries its own amount.
         """
+        if dry_run:
+            return self._dry_run_binary_market_batch(
+                action="split",
+                operations=operations,
+                batch_size=batch_size,
+                collateral_token=collateral_token,
+                parent_collection_id=parent_collection_id,
+            )
         return self._submit_binary_market_batch(
             action="split",
             operations=operations,
@@ -1120,7 +2147,7 @@ class BaseWeb3Service:
             parent_collection_id=parent_collection_id,
             negative_risk=negative_risk,
         )
-        return self._submit_transactions([tx], "merge")
+        return self._quota_guarded(self._submit_transactions)([tx], "merge")
 
     def merge_batch(
             self,
@@ -1128,10 +2155,19 @@ class BaseWeb3Service:
             batch_size: int = 10,
             collateral_token: str = DEFAULT_COLLATERAL_TOKEN,
             parent_collection_id: str = ZERO_BYTES32,
-    ) -> BatchBinaryOperationResult:
+            dry_run: bool = False,
+    ) -> BatchBinaryOperationResult | DryRunResult:
         """
         Merge multiple binary markets in batches. Each operation carries its own amount.
         """
+        if dry_run:
+            return self._dry_run_binary_market_batch(
+                action="merge",
+                operations=operations,
+                batch_size=batch_size,
+                collateral_token=collateral_token,
+                parent_collection_id=parent_collection_id,
+            )
         return self._submit_binary_market_batch(
             action="merge",
             operations=operations,
@@ -1139,3 +2175,38 @@ class BaseWeb3Service:
             collateral_token=collateral_token,
             parent_collection_id=parent_collection_id,
         )
+
+    def submit_redeem(self, *args: Any, **kwargs: Any) -> SubmissionHandle:
+        """
+        Non-blocking ``redeem`` (same arguments): returns once the relayer
+        accepted the first transaction; the handle completes with the
+        ``RedeemResult``.
+        """
+        return run_in_background("redeem", partial(self.redeem, *args, **kwargs))
+
+    def submit_redeem_all(self, *args: Any, **kwargs: Any) -> SubmissionHandle:
+        """Non-blocking ``redeem_all``, see ``submit_redeem``."""
+        return run_in_background("redeem_all", partial(self.redeem_all, *args, **kwargs))
+
+    def submit_split(self, *args: Any, **kwargs: Any) -> SubmissionHandle:
+        """Non-blocking ``split``, see ``submit_redeem``."""
+        return run_in_background("split", partial(self.split, *args, **kwargs))
+
+    def submit_merge(self, *args: Any, **kwargs: Any) -> SubmissionHandle:
+        """Non-blocking ``merge``, see ``submit_redeem``."""
+        return run_in_background("merge", partial(self.merge, *args, **kwargs))
+
+    def submit_split_batch(self, *args: Any, **kwargs: Any) -> SubmissionHandle:
+        """
+        Non-blocking ``split_batch``; the handle completes with the
+        ``BatchBinaryOperationResult``.
+        """
+        return run_in_background("split_batch", partial(self.split_batch, *args, **kwargs))
+
+    def submit_merge_batch(self, *args: Any, **kwargs: Any) -> SubmissionHandle:
+        """Non-blocking ``merge_batch``, see ``submit_split_batch``."""
+        return run_in_background("merge_batch", partial(self.merge_batch, *args, **kwargs))
+
+    def submit_merge_all(self, *args: Any, **kwargs: Any) -> SubmissionHandle:
+        """Non-blocking ``merge_all``; the handle completes with the ``MergeAllResult``."""
+        return run_in_background("merge_all", partial(self.merge_all, *args, **kwargs))
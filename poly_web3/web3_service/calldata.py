@@ -0,0 +1,135 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: calldata.py
+"""
+Calldata for the fixed-shape CTF, NegRisk adapter, ERC20, pUSD wrapper and
+ProxyFactory calls, encoded with precomputed selectors and ``eth_abi``
+directly instead of going through web3 contract objects.
+"""
+from typing import Any
+
+from eth_abi import encode
+
+# keccak256 of the function signature, first 4 bytes
+CTF_REDEEM_POSITIONS_SELECTOR = bytes.fromhex("01b7037c")  # redeemPositions(address,bytes32,bytes32,uint256[])
+CTF_SPLIT_POSITION_SELECTOR = bytes.fromhex("72ce4275")  # splitPosition(address,bytes32,bytes32,uint256[],uint256)
+CTF_MERGE_POSITIONS_SELECTOR = bytes.fromhex("9e7212ad")  # mergePositions(address,bytes32,bytes32,uint256[],uint256)
+NEG_RISK_REDEEM_POSITIONS_SELECTOR = bytes.fromhex("dbeccb23")  # redeemPositions(bytes32,uint256[])
+ERC20_APPROVE_SELECTOR = bytes.fromhex("095ea7b3")  # approve(address,uint256)
+PUSD_WRAP_SELECTOR = bytes.fromhex("62355638")  # wrap(address,address,uint256)
+PROXY_SELECTOR = bytes.fromhex("34ee9791")  # proxy((uint8,address,uint256,bytes)[])
+
+_POSITION_TYPES = ("address", "bytes32", "bytes32", "uint256[]", "uint256")
+
+
+def _bytes32(value: str | bytes) -> bytes:
+    if isinstance(value, bytes):
+        raw = value
+    else:
+        raw = bytes.fromhex(value[2:] if value[:2] in ("0x", "0X") else value)
+    if len(raw) != 32:
+        raise Exception(f"expected 32 bytes, got {len(raw)}: {value!r}")
+    return raw
+
+
+def _hex_bytes(value: str | bytes) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return bytes.fromhex(value[2:] if value[:2] in ("0x", "0X") else value)
+
+
+def _call(selector: bytes, types: tuple[str, ...], args: tuple[Any, ...]) -> str:
+    return "0x" + (selector + encode(types, args)).hex()
+
+
+def encode_ctf_redeem(
+        collateral_token: str,
+        parent_collection_id: str,
+        condition_id: str,
+        index_sets: list[int],
+) -> str:
+    return _call(
+        CTF_REDEEM_POSITIONS_SELECTOR,
+        ("address", "bytes32", "bytes32", "uint256[]"),
+        (
+            collateral_token,
+            _bytes32(parent_collection_id),
+            _bytes32(condition_id),
+            list(index_sets),
+        ),
+    )
+
+
+def encode_split_position(
+        collateral_token: str,
+        parent_collection_id: str,
+        condition_id: str,
+        partition: list[int],
+        amount: int,
+) -> str:
+    """``splitPosition`` has the same shape on the CTF and the NegRisk adapter."""
+    return _call(
+        CTF_SPLIT_POSITION_SELECTOR,
+        _POSITION_TYPES,
+        (
+            collateral_token,
+            _bytes32(parent_collection_id),
+            _bytes32(condition_id),
+            list(partition),
+            amount,
+        ),
+    )
+
+
+def encode_merge_positions(
+        collateral_token: str,
+        parent_collection_id: str,
+        condition_id: str,
+        partition: list[int],
+        amount: int,
+) -> str:
+    """``mergePositions`` has the same shape on the CTF and the NegRisk adapter."""
+    return _call(
+        CTF_MERGE_POSITIONS_SELECTOR,
+        _POSITION_TYPES,
+        (
+            collateral_token,
+            _bytes32(parent_collection_id),
+            _bytes32(condition_id),
+            list(partition),
+            amount,
+        ),
+    )
+
+
+def encode_neg_risk_redeem(condition_id: str, amounts: list[int]) -> str:
+    return _call(
+        NEG_RISK_REDEEM_POSITIONS_SELECTOR,
+        ("bytes32", "uint256[]"),
+        (_bytes32(condition_id), list(amounts)),
+    )
+
+
+def encode_erc20_approve(spender: str, amount: int) -> str:
+    return _call(ERC20_APPROVE_SELECTOR, ("address", "uint256"), (spender, amount))
+
+
+def encode_pusd_wrap(token_address: str, receiver: str, amount: int) -> str:
+    return _call(
+        PUSD_WRAP_SELECTOR,
+        ("address", "address", "uint256"),
+        (token_address, receiver, amount),
+    )
+
+
+def encode_proxy(calls: list[tuple[int, str, int, str | bytes]]) -> str:
+    """``calls`` are ``(typeCode, to, value, data)`` tuples."""
+    return _call(
+        PROXY_SELECTOR,
+        ("(uint8,address,uint256,bytes)[]",),
+        ([
+            (type_code, to, value, _hex_bytes(data))
+            for type_code, to, value, data in calls
+        ],),
+    )
@@ -29,14 +29,24 @@ class DepositWalletWeb3Service(BaseWeb3Service):
 
     def _build_redeem_tx(self, to: str, data: str) -> dict:
         # 字段与 ProxyWeb3Service 保持一致以复用基类逻辑；
-        # 在 _submit_transactions 中再转成 DepositWalletCall。
+        # 在 _send_transactions 中再转成 DepositWalletCall。
         return {
             "to": to,
             "data": data,
             "value": 0,
         }
 
-    def _submit_transactions(self, txs: list[dict], metadata: str) -> dict:
+    def _fetch_relayer_nonce(self) -> str:
+        from py_builder_relayer_client.models import TransactionType
+
+        signer_address = self.relayer_client.signer.address()
+        nonce_payload = self.relayer_client.get_nonce(
+            signer_address,
+            TransactionType.WALLET.value,
+        )
+        return nonce_payload["nonce"]
+
+    def _send_transactions(self, txs: list[dict], metadata: str) -> tuple[Any, int, str]:
         if self.clob_client is None:
             raise Exception("clob_client not found")
         if self.relayer_client is None:
@@ -45,19 +55,9 @@ class DepositWalletWeb3Service(BaseWeb3Service):
             raise Exception("empty tx batch")
 
         # 局部 import 避免 module 顶层引入 relayer client 失败时影响其他 service。
-        from py_builder_relayer_client.models import (
-            DepositWalletCall,
-            TransactionType,
-        )
+        from py_builder_relayer_client.models import DepositWalletCall
 
         deposit_wallet = self._resolve_user_address()
-        signer_address = self.relayer_client.signer.address()
-        nonce_payload = self.relayer_client.get_nonce(
-            signer_address,
-            TransactionType.WALLET.value,
-        )
-        wallet_nonce = str(nonce_payload["nonce"])
-
         calls = [
             DepositWalletCall(
                 target=tx["to"],
@@ -67,18 +67,42 @@ class DepositWalletWeb3Service(BaseWeb3Service):
             for tx in txs
         ]
 
-        deadline = str(int(_time.time()) + self.DEFAULT_DEADLINE_SEC)
-        response = self.relayer_client.execute_deposit_wallet_batch(
-            calls=calls,
-            wallet_address=deposit_wallet,
-            nonce=wallet_nonce,
-            deadline=deadline,
-        )
-        confirmed = response.wait()
+        # nonce 由 nonce_manager 本地递增；relayer 报 nonce 错误时重新拉取后重试一次。
+        for attempt in range(2):
+            wallet_nonce = self.nonce_manager.acquire()
+            deadline = str(int(_time.time()) + self.DEFAULT_DEADLINE_SEC)
+            try:
+                response = self.relayer_client.execute_deposit_wallet_batch(
+                    calls=calls,
+                    wallet_address=deposit_wallet,
+                    nonce=str(wallet_nonce),
+                    deadline=deadline,
+                )
+            except Exception as exc:
+                self.nonce_manager.fail(wallet_nonce)
+                if attempt == 0 and self.nonce_manager.is_nonce_error(exc):
+                    continue
+                raise
+            return response, wallet_nonce, metadata
+
+    def _pending_transaction_id(self, pending: tuple[Any, int, str]) -> str | None:
+        return getattr(pending[0], "transaction_id", None)
+
+    def _wait_transactions(self, pending: tuple[Any, int, str]) -> dict:
+        response, wallet_nonce, metadata = pending
+        try:
+            confirmed = self._wait_relayer_transaction(
+                getattr(response, "transaction_id", None), response.wait
+            )
+        except Exception:
+            self.nonce_manager.fail(wallet_nonce)
+            raise
         if confirmed is None:
+            self.nonce_manager.fail(wallet_nonce)
             raise Exception(
                 f"deposit-wallet relayer batch unconfirmed (metadata={metadata})"
             )
+        self.nonce_manager.confirm(wallet_nonce)
         return confirmed
 
     def _submit_redeem(self, txs: list[dict]) -> dict:
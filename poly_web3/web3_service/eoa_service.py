@@ -5,6 +5,7 @@
 # @File: eoa_service.py
 # @Software: PyCharm
 from decimal import Decimal
+from typing import Iterator
 
 from poly_web3.const import (
     CTF_COLLATERAL_TOKEN,
@@ -14,6 +15,7 @@ from poly_web3.const import (
 from poly_web3.schema import (
     BatchBinaryOperationItem,
     BatchBinaryOperationResult,
+    DryRunResult,
     MergeAllResult,
     MergePlanItem,
     RedeemResult,
@@ -28,14 +30,16 @@ class EOAWeb3Service(BaseWeb3Service):
         batch_size: int = 10,
         collateral_token: str = CTF_COLLATERAL_TOKEN,
         wrap_redeemed_collateral: bool = True,
-    ) -> RedeemResult:
+        dry_run: bool = False,
+    ) -> RedeemResult | DryRunResult:
         raise ImportError("EOA wallet redeem not supported")
 
     def redeem_all(
         self,
         batch_size: int = 10,
         wrap_redeemed_collateral: bool = True,
-    ) -> RedeemResult:
+        dry_run: bool = False,
+    ) -> RedeemResult | DryRunResult:
         raise ImportError("EOA wallet redeem not supported")
 
     def plan_merge_all(
@@ -45,13 +49,21 @@ class EOAWeb3Service(BaseWeb3Service):
     ) -> list[MergePlanItem]:
         raise ImportError("EOA wallet merge not supported")
 
+    def iter_merge_plan(
+        self,
+        min_usdc: int | float | str | Decimal = 5,
+        exclude_neg_risk: bool = True,
+    ) -> Iterator[list[MergePlanItem]]:
+        raise ImportError("EOA wallet merge not supported")
+
     def merge_all(
         self,
         min_usdc: int | float | str | Decimal = 5,
         exclude_neg_risk: bool = True,
         max_markets: int = 20,
         batch_size: int = 10,
-    ) -> MergeAllResult:
+        dry_run: bool = False,
+    ) -> MergeAllResult | DryRunResult:
         raise ImportError("EOA wallet merge not supported")
 
     def split(
@@ -70,7 +82,8 @@ class EOAWeb3Service(BaseWeb3Service):
         batch_size: int = 10,
         collateral_token: str = DEFAULT_COLLATERAL_TOKEN,
         parent_collection_id: str = ZERO_BYTES32,
-    ) -> BatchBinaryOperationResult:
+        dry_run: bool = False,
+    ) -> BatchBinaryOperationResult | DryRunResult:
         raise ImportError("EOA wallet split not supported")
 
     def merge(
@@ -89,5 +102,6 @@ class EOAWeb3Service(BaseWeb3Service):
         batch_size: int = 10,
         collateral_token: str = DEFAULT_COLLATERAL_TOKEN,
         parent_collection_id: str = ZERO_BYTES32,
-    ) -> BatchBinaryOperationResult:
+        dry_run: bool = False,
+    ) -> BatchBinaryOperationResult | DryRunResult:
         raise ImportError("EOA wallet merge not supported")
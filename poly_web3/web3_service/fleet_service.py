@@ -0,0 +1,263 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: fleet_service.py
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from decimal import Decimal
+from typing import Any, Callable, Iterable
+
+from py_builder_relayer_client.client import RelayClient
+from web3 import Web3
+
+from poly_web3.clob_compat import get_clob_signature_type
+from poly_web3.const import RPC_URL
+from poly_web3.log import logger
+from poly_web3.schema import (
+    DryRunResult,
+    FleetMergeAllResult,
+    FleetRedeemResult,
+    MergeAllResult,
+    RedeemResult,
+    WalletType,
+)
+from poly_web3.web3_service.api_client import PolymarketAPIClient
+from poly_web3.web3_service.base import BaseWeb3Service
+from poly_web3.web3_service.deposit_wallet_service import DepositWalletWeb3Service
+from poly_web3.web3_service.eoa_service import EOAWeb3Service
+from poly_web3.web3_service.gas_batcher import GasModel
+from poly_web3.web3_service.market_cache import MarketCache
+from poly_web3.web3_service.proxy_service import ProxyWeb3Service
+from poly_web3.web3_service.relayer_quota import RelayerQuotaTracker
+from poly_web3.web3_service.relayer_status import RelayerStatusTracker
+from poly_web3.web3_service.resolution_cache import ResolutionCache
+from poly_web3.web3_service.rpc_pool import PooledHTTPProvider
+from poly_web3.web3_service.safe_service import SafeWeb3Service
+from poly_web3.web3_service.transport import HttpTransport
+
+WALLET_SERVICES: dict[WalletType, type[BaseWeb3Service]] = {
+    WalletType.EOA: EOAWeb3Service,
+    WalletType.PROXY: ProxyWeb3Service,
+    WalletType.SAFE: SafeWeb3Service,
+    WalletType.DEPOSIT_WALLET: DepositWalletWeb3Service,
+}
+
+
+class FleetWeb3Service:
+    """
+    Run ``redeem_all``/``merge_all`` over many wallets at once.
+
+    Every wallet gets its own service, but all of them share one pooled HTTP
+    session, one Web3 provider and the market/resolution caches. Wallets
+    wait in one queue per relayer client and are handed to a bounded thread
+    pool round-robin across relayers, only while their relayer has fewer
+    than ``max_in_flight_per_relayer`` wallets running, so a busy relayer
+    never ties up workers that wallets on other relayers could use. Once a
+    relayer reports its submit quota as exceeded, its queued wallets are
+    skipped.
+    """
+
+    DEFAULT_MAX_WORKERS = 8
+    DEFAULT_MAX_IN_FLIGHT_PER_RELAYER = 2
+
+    def __init__(
+            self,
+            clients: Iterable[tuple[Any, RelayClient | None]],
+            rpc_url: str | list[str] | None = None,
+            resolution_cache: ResolutionCache | None = None,
+            market_cache: MarketCache | None = None,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            max_in_flight_per_relayer: int = DEFAULT_MAX_IN_FLIGHT_PER_RELAYER,
+            pipeline_depth: int = 1,
+            quota_tracker: RelayerQuotaTracker | None = None,
+            batch_gas_limit: int | None = None,
+            transport: HttpTransport | None = None,
+    ):
+        if max_workers <= 0:
+            raise Exception("max_workers must be greater than 0")
+        if max_in_flight_per_relayer <= 0:
+            raise Exception("max_in_flight_per_relayer must be greater than 0")
+        self.rpc_url = rpc_url or RPC_URL
+        self.max_workers = max_workers
+        self.max_in_flight_per_relayer = max_in_flight_per_relayer
+        self.transport = transport or HttpTransport(pool_maxsize=max_workers * 2)
+        self.session = self.transport.session
+        self.api_client = PolymarketAPIClient(
+            rpc_url=self.rpc_url,
+            market_cache=market_cache,
+            transport=self.transport,
+        )
+        if self.api_client.rpc_pool is not None:
+            self.w3 = Web3(PooledHTTPProvider(self.api_client.rpc_pool))
+        else:
+            self.w3 = Web3(
+                Web3.HTTPProvider(
+                    self.api_client.rpc_url,
+                    session=self.session,
+                    request_kwargs={"timeout": self.transport.timeout("rpc")},
+                )
+            )
+        self.resolution_cache = resolution_cache or ResolutionCache()
+        # Gas per tx type does not depend on the wallet, so all wallets learn together.
+        self.gas_model = GasModel()
+
+        self.services: dict[str, BaseWeb3Service] = {}
+        # One confirmation polling loop per relayer client instead of one per submit.
+        self.status_trackers: dict[int, RelayerStatusTracker] = {}
+        for clob_client, relayer_client in clients:
+            wallet_type = WalletType.get_with_code(get_clob_signature_type(clob_client))
+            service_cls = WALLET_SERVICES.get(wallet_type)
+            if service_cls is None:
+                raise Exception(f"Unknown wallet type: {wallet_type}")
+            status_tracker = None
+            if relayer_client is not None:
+                status_tracker = self.status_trackers.get(id(relayer_client))
+                if status_tracker is None:
+                    status_tracker = RelayerStatusTracker.from_clients(
+                        self.api_client, relayer_client
+                    )
+                    self.status_trackers[id(relayer_client)] = status_tracker
+            service = service_cls(
+                clob_client,
+                relayer_client,
+                rpc_url=self.rpc_url,
+                resolution_cache=self.resolution_cache,
+                pipeline_depth=pipeline_depth,
+                api_client=self.api_client,
+                w3=self.w3,
+                quota_tracker=quota_tracker,
+                batch_gas_limit=batch_gas_limit,
+                gas_model=self.gas_model,
+                status_tracker=status_tracker,
+            )
+            wallet = service._resolve_user_address()
+            if wallet in self.services:
+                raise Exception(f"duplicate wallet in fleet: {wallet}")
+            self.services[wallet] = service
+
+        self._exhausted_relayers: set[int] = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.services)
+
+    @staticmethod
+    def _is_quota_error(error: Any) -> bool:
+        return "quota exceeded" in str(error).lower()
+
+    def _mark_exhausted(self, relayer_key: int) -> None:
+        with self._lock:
+            self._exhausted_relayers.add(relayer_key)
+
+    def _is_exhausted(self, relayer_key: int) -> bool:
+        with self._lock:
+            return relayer_key in self._exhausted_relayers
+
+    def _run_for_wallets(
+            self,
+            run: Callable[[BaseWeb3Service], RedeemResult | MergeAllResult | DryRunResult],
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        results: dict[str, Any] = {}
+        error_wallets: dict[str, str] = {}
+
+        def run_wallet(wallet: str, service: BaseWeb3Service, relayer_key: int) -> None:
+            try:
+                result = run(service)
+            except Exception as exc:
+                if self._is_quota_error(exc):
+                    self._mark_exhausted(relayer_key)
+                error_wallets[wallet] = str(exc)
+                logger.error(f"fleet wallet {wallet} failed: {exc}")
+                return
+            if any(
+                    self._is_quota_error(item.error)
+                    for item in getattr(result, "error_list", [])
+            ):
+                self._mark_exhausted(relayer_key)
+            results[wallet] = result
+
+        queues: dict[int, deque[tuple[str, BaseWeb3Service]]] = {}
+        for wallet, service in self.services.items():
+            queues.setdefault(id(service.relayer_client), deque()).append((wallet, service))
+        in_flight = dict.fromkeys(queues, 0)
+        running: dict[Future, int] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            def dispatch() -> None:
+                # Round-robin one wallet per relayer at a time while workers are free.
+                progress = True
+                while progress and len(running) < self.max_workers:
+                    progress = False
+                    for relayer_key, queue in queues.items():
+                        if len(running) >= self.max_workers:
+                            break
+                        if not queue or in_flight[relayer_key] >= self.max_in_flight_per_relayer:
+                            continue
+                        wallet, service = queue.popleft()
+                        progress = True
+                        if self._is_exhausted(relayer_key):
+                            error_wallets[wallet] = "skipped: relayer submit quota exceeded"
+                            continue
+                        in_flight[relayer_key] += 1
+                        future = executor.submit(run_wallet, wallet, service, relayer_key)
+                        running[future] = relayer_key
+
+            dispatch()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight[running.pop(future)] -= 1
+                    future.result()
+                dispatch()
+        # Keep the caller's wallet order regardless of completion order.
+        return (
+            {wallet: results[wallet] for wallet in self.services if wallet in results},
+            {wallet: error_wallets[wallet] for wallet in self.services if wallet in error_wallets},
+        )
+
+    def redeem_all(
+            self,
+            batch_size: int = 10,
+            wrap_redeemed_collateral: bool = True,
+            dry_run: bool = False,
+    ) -> FleetRedeemResult:
+        """
+        Redeem all currently redeemable positions for every wallet in the fleet.
+        With ``dry_run`` every wallet's redeems are only simulated.
+        """
+        with self._lock:
+            self._exhausted_relayers.clear()
+        results, error_wallets = self._run_for_wallets(
+            lambda service: service.redeem_all(
+                batch_size=batch_size,
+                wrap_redeemed_collateral=wrap_redeemed_collateral,
+                dry_run=dry_run,
+            )
+        )
+        return FleetRedeemResult(results=results, error_wallets=error_wallets)
+
+    def merge_all(
+            self,
+            min_usdc: int | float | str | Decimal = 0.5,
+            exclude_neg_risk: bool = False,
+            max_markets: int = 100,
+            batch_size: int = 10,
+            dry_run: bool = False,
+    ) -> FleetMergeAllResult:
+        """
+        Plan and execute ``merge_all`` for every wallet in the fleet.
+        """
+        with self._lock:
+            self._exhausted_relayers.clear()
+        results, error_wallets = self._run_for_wallets(
+            lambda service: service.merge_all(
+                min_usdc=min_usdc,
+                exclude_neg_risk=exclude_neg_risk,
+                max_markets=max_markets,
+                batch_size=batch_size,
+                dry_run=dry_run,
+            )
+        )
+        return FleetMergeAllResult(results=results, error_wallets=error_wallets)
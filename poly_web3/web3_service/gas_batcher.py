@@ -0,0 +1,154 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: gas_batcher.py
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+class GasModel:
+    """
+    Per-tx-type gas estimates, learned from simulated batches.
+
+    Each observation scales the estimate of every tx type in the batch by the
+    ratio of observed to predicted gas, smoothed with an EWMA, so mixed
+    batches still teach the model without a per-tx breakdown.
+    """
+
+    DEFAULT_TX_GAS = {
+        "redeem": 120_000,
+        "neg_risk_redeem": 220_000,
+        "split": 180_000,
+        "neg_risk_split": 260_000,
+        "merge": 160_000,
+        "neg_risk_merge": 240_000,
+        "approve": 50_000,
+        "wrap": 90_000,
+    }
+    DEFAULT_SMOOTHING = 0.3
+
+    def __init__(
+            self,
+            tx_gas: dict[str, int] | None = None,
+            smoothing: float = DEFAULT_SMOOTHING,
+    ):
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        self._tx_gas: dict[str, float] = {
+            **self.DEFAULT_TX_GAS,
+            **(tx_gas or {}),
+        }
+
+    def predict(self, tx_types: list[str]) -> int:
+        with self._lock:
+            return int(sum(
+                self._tx_gas.get(tx_type, self.DEFAULT_TX_GAS["redeem"])
+                for tx_type in tx_types
+            ))
+
+    def observe(self, tx_types: list[str], gas_used: int) -> None:
+        predicted = self.predict(tx_types)
+        if not tx_types or predicted <= 0 or gas_used <= 0:
+            return
+        ratio = gas_used / predicted
+        with self._lock:
+            for tx_type in set(tx_types):
+                current = self._tx_gas.get(tx_type, self.DEFAULT_TX_GAS["redeem"])
+                self._tx_gas[tx_type] = (
+                    (1 - self.smoothing) * current + self.smoothing * current * ratio
+                )
+
+
+@dataclass
+class GasUnit:
+    """Txs for one condition/operation that are batched and isolated together."""
+    key: Any
+    txs: list[Any]
+    tx_types: list[str]
+
+
+class AdaptiveBatcher:
+    """
+    Fill batches up to ``gas_limit`` (unbounded when ``None``) using a
+    ``GasModel`` and, when ``estimate_batch`` is given, simulate each batch
+    before it is sent: a reverting batch is bisected until the failing units
+    are isolated.
+    """
+
+    def __init__(
+            self,
+            gas_model: GasModel,
+            gas_limit: int | None,
+            estimate_batch: Callable[[list[Any]], int] | None = None,
+    ):
+        if gas_limit is not None and gas_limit <= 0:
+            raise Exception("gas_limit must be greater than 0")
+        self.gas_model = gas_model
+        self.gas_limit = gas_limit
+        self.estimate_batch = estimate_batch
+
+    def pack(self, units: list[GasUnit], reserve_gas: int = 0) -> list[list[GasUnit]]:
+        """
+        Split ``units`` in order into batches whose predicted gas plus
+        ``reserve_gas`` (e.g. trailing wrap txs) fits in ``gas_limit``.
+        """
+        batches: list[list[GasUnit]] = []
+        current: list[GasUnit] = []
+        current_gas = reserve_gas
+        for unit in units:
+            unit_gas = self.gas_model.predict(unit.tx_types)
+            if (
+                    current
+                    and self.gas_limit is not None
+                    and current_gas + unit_gas > self.gas_limit
+            ):
+                batches.append(current)
+                current, current_gas = [], reserve_gas
+            current.append(unit)
+            current_gas += unit_gas
+        if current:
+            batches.append(current)
+        return batches
+
+    def isolate(
+            self, units: list[GasUnit]
+    ) -> tuple[list[GasUnit], list[tuple[GasUnit, Exception]]]:
+        """
+        Simulate ``units`` as one batch; on revert bisect and return the units
+        that simulate cleanly together with the failing ones and their errors.
+        Halves that pass on their own are simulated again as one batch, since
+        their units can still conflict (e.g. two wraps spending one balance).
+        """
+        if not units or self.estimate_batch is None:
+            return list(units), []
+        txs = [tx for unit in units for tx in unit.txs]
+        try:
+            gas_used = self.estimate_batch(txs)
+        except Exception as exc:
+            if len(units) == 1:
+                return [], [(units[0], exc)]
+            middle = len(units) // 2
+            left_ok, left_failed = self.isolate(units[:middle])
+            right_ok, right_failed = self.isolate(units[middle:])
+            failed = left_failed + right_failed
+            if not left_ok or not right_ok:
+                return left_ok + right_ok, failed
+            if failed:
+                ok_units, conflicting = self.isolate(left_ok + right_ok)
+                return ok_units, failed + conflicting
+            # Each half passes alone but not together: grow the left half one
+            # unit at a time, so every accepted set was simulated as a whole.
+            ok_units = list(left_ok)
+            for unit in right_ok:
+                try:
+                    self.estimate_batch([tx for ok in ok_units + [unit] for tx in ok.txs])
+                except Exception as conflict:
+                    failed.append((unit, conflict))
+                    continue
+                ok_units.append(unit)
+            return ok_units, failed
+        self.gas_model.observe(
+            [tx_type for unit in units for tx_type in unit.tx_types], int(gas_used)
+        )
+        return list(units), []
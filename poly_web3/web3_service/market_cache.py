@@ -0,0 +1,60 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: market_cache.py
+import threading
+import time
+from collections import OrderedDict
+
+
+class MarketCache:
+    """
+    TTL + LRU cache of Gamma market metadata keyed by condition ID.
+
+    ``None`` is a valid cached value and means Gamma returned no market for
+    the condition, so ``lookup`` reports hits separately from values.
+    """
+
+    DEFAULT_TTL_SEC = 300
+    DEFAULT_MAX_SIZE = 10000
+
+    def __init__(
+            self,
+            ttl: float = DEFAULT_TTL_SEC,
+            max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        if max_size <= 0:
+            raise Exception("max_size must be greater than 0")
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, dict | None]] = OrderedDict()
+
+    @staticmethod
+    def _key(condition_id: str) -> str:
+        return condition_id.lower()
+
+    def lookup(self, condition_id: str) -> tuple[bool, dict | None]:
+        key = self._key(condition_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, market = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, market
+
+    def set(self, condition_id: str, market: dict | None) -> None:
+        key = self._key(condition_id)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, market)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
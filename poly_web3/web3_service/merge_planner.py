@@ -0,0 +1,104 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: merge_planner.py
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Iterable
+
+from poly_web3.schema import MergePlanItem
+
+
+@dataclass
+class _ConditionBalance:
+    market_slug: str | None = None
+    yes_balance: float = 0.0
+    no_balance: float = 0.0
+    negative_risk: bool = False
+    invalid_outcome_index: bool = False
+
+
+class MergePlanner:
+    """
+    Incremental YES/NO aggregator for merge planning.
+
+    Positions are folded into per-condition totals as they arrive, so memory
+    grows with the number of conditions rather than the number of positions
+    and a plan can be built at any point while pages are still streaming in.
+    """
+
+    def __init__(self):
+        self._balances: dict[str, _ConditionBalance] = {}
+
+    def __len__(self) -> int:
+        return len(self._balances)
+
+    @staticmethod
+    def _normalize_position_size(size: Any) -> float:
+        try:
+            return float(size or 0)
+        except (TypeError, ValueError):
+            return 0.0
+
+    def add(self, position: dict) -> None:
+        condition_id = position.get("conditionId")
+        if not condition_id:
+            return
+        balance = self._balances.get(condition_id)
+        if balance is None:
+            balance = self._balances[condition_id] = _ConditionBalance()
+        balance.market_slug = balance.market_slug or position.get("slug")
+        balance.negative_risk = balance.negative_risk or bool(position.get("negativeRisk"))
+        outcome_index = position.get("outcomeIndex")
+        size = self._normalize_position_size(position.get("size"))
+        if outcome_index == 0:
+            balance.yes_balance += size
+        elif outcome_index == 1:
+            balance.no_balance += size
+        else:
+            balance.invalid_outcome_index = True
+
+    def add_many(self, positions: Iterable[dict]) -> None:
+        for position in positions:
+            self.add(position)
+
+    def build(
+            self,
+            min_usdc: int | float | str | Decimal = 5,
+            exclude_neg_risk: bool = True,
+    ) -> list[MergePlanItem]:
+        min_usdc_float = float(Decimal(str(min_usdc)))
+        plan_list: list[MergePlanItem] = []
+        for condition_id, balance in self._balances.items():
+            mergeable = min(balance.yes_balance, balance.no_balance)
+            reason = None
+            if balance.invalid_outcome_index:
+                reason = "unsupported_outcome_index"
+            elif exclude_neg_risk and balance.negative_risk:
+                reason = "negative_risk_excluded"
+            elif balance.yes_balance <= 0 or balance.no_balance <= 0:
+                reason = "missing_opposite_side"
+            elif mergeable < min_usdc_float:
+                reason = "below_min_usdc"
+
+            plan_list.append(
+                MergePlanItem(
+                    condition_id=condition_id,
+                    market_slug=balance.market_slug,
+                    yes_balance=balance.yes_balance,
+                    no_balance=balance.no_balance,
+                    mergeable=mergeable,
+                    negative_risk=balance.negative_risk,
+                    reason=reason,
+                )
+            )
+
+        return sorted(
+            plan_list,
+            key=lambda item: (
+                item.reason is not None,
+                -item.mergeable,
+                item.market_slug or "",
+                item.condition_id,
+            ),
+        )
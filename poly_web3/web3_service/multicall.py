@@ -0,0 +1,46 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: multicall.py
+from web3 import Web3
+
+from poly_web3.const import (
+    MULTICALL3_ABI_AGGREGATE3,
+    MULTICALL3_ADDRESS,
+    MULTICALL3_MAX_CALLS_PER_REQUEST,
+)
+
+
+class Multicall3:
+    """
+    Thin wrapper around Multicall3 ``aggregate3`` for read-only batching.
+
+    Each call is a ``(target, calldata)`` pair; the result list keeps the same
+    order and holds ``(success, return_data)`` for every call.
+    """
+
+    def __init__(
+            self,
+            w3: Web3,
+            address: str = MULTICALL3_ADDRESS,
+            max_calls_per_request: int = MULTICALL3_MAX_CALLS_PER_REQUEST,
+    ):
+        if max_calls_per_request <= 0:
+            raise Exception("max_calls_per_request must be greater than 0")
+        self.w3 = w3
+        self.max_calls_per_request = max_calls_per_request
+        self.contract = w3.eth.contract(address=address, abi=MULTICALL3_ABI_AGGREGATE3)
+
+    def aggregate3(
+            self,
+            calls: list[tuple[str, str | bytes]],
+            allow_failure: bool = True,
+    ) -> list[tuple[bool, bytes]]:
+        results: list[tuple[bool, bytes]] = []
+        for i in range(0, len(calls), self.max_calls_per_request):
+            chunk = calls[i: i + self.max_calls_per_request]
+            response = self.contract.functions.aggregate3(
+                [(target, allow_failure, data) for target, data in chunk]
+            ).call()
+            results.extend((bool(success), bytes(data)) for success, data in response)
+        return results
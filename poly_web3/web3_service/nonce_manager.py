@@ -0,0 +1,54 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: nonce_manager.py
+import threading
+from typing import Any, Callable
+
+
+class NonceManager:
+    """
+    Thread-safe local nonce counter for relayer submissions.
+
+    The nonce is fetched from the relayer once and then handed out locally,
+    one per ``acquire``. Nonces stay "in flight" until ``confirm`` or ``fail``;
+    a failure (or an explicit ``resync``) drops the local counter so the next
+    ``acquire`` refetches, and a refetched nonce is never allowed to fall back
+    onto one that is still in flight.
+    """
+
+    def __init__(self, fetch_nonce: Callable[[], int | str]):
+        self.fetch_nonce = fetch_nonce
+        self._lock = threading.Lock()
+        self._next_nonce: int | None = None
+        self._in_flight: set[int] = set()
+
+    def acquire(self) -> int:
+        with self._lock:
+            if self._next_nonce is None:
+                nonce = int(self.fetch_nonce())
+                if self._in_flight and nonce <= max(self._in_flight):
+                    nonce = max(self._in_flight) + 1
+                self._next_nonce = nonce
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            self._in_flight.add(nonce)
+            return nonce
+
+    def confirm(self, nonce: int) -> None:
+        with self._lock:
+            self._in_flight.discard(nonce)
+
+    def fail(self, nonce: int) -> None:
+        # Whether a failed nonce was consumed is unknown; ask the relayer again.
+        with self._lock:
+            self._in_flight.discard(nonce)
+            self._next_nonce = None
+
+    def resync(self) -> None:
+        with self._lock:
+            self._next_nonce = None
+
+    @staticmethod
+    def is_nonce_error(error: Any) -> bool:
+        return "nonce" in str(error).lower()
@@ -0,0 +1,95 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: pipeline.py
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+
+@dataclass
+class BuiltBatch:
+    """
+    What ``build()`` returns when it also reports its own context (e.g. what
+    made it into the txs and what was dropped while building).
+    """
+    txs: list[Any]
+    context: Any
+
+
+class PipelinedExecutor:
+    """
+    Overlap building/sending of batch N+1 with confirmation of batch N.
+
+    ``jobs`` yields ``(context, build)`` pairs; ``build()`` returns the txs for
+    one batch and is called lazily in the caller's thread, so gas estimation and
+    chain reads for the next batch run while up to ``depth`` earlier batches are
+    being confirmed. ``send`` runs in the caller's thread too, which keeps relayer
+    submissions (and their nonces) strictly ordered. ``wait`` runs in a worker
+    thread; when it is ``None`` the value returned by ``send`` is the result and
+    the executor degrades to plain sequential submission.
+
+    ``build()`` may instead return a ``BuiltBatch``, whose context replaces the
+    job's one; such jobs are reported even when they built no txs, as
+    ``(context, None, None)``, so the caller can still merge what the build found.
+
+    ``run`` returns ``(context, result, error)`` per non-empty batch (plus empty
+    ``BuiltBatch`` ones), in job order.
+    """
+
+    def __init__(
+            self,
+            send: Callable[[list[Any], str], Any],
+            wait: Callable[[Any], Any] | None = None,
+            depth: int = 1,
+    ):
+        if depth <= 0:
+            raise Exception("pipeline depth must be greater than 0")
+        self.send = send
+        self.wait = wait
+        self.depth = depth
+
+    def run(
+            self,
+            jobs: Iterable[tuple[Any, Callable[[], list[Any]]]],
+            metadata: str,
+    ) -> list[tuple[Any, Any, Exception | None]]:
+        outcomes: dict[int, tuple[Any, Any, Exception | None]] = {}
+        in_flight: deque[tuple[int, Any, Future]] = deque()
+        executor = ThreadPoolExecutor(max_workers=self.depth) if self.wait else None
+
+        def collect_oldest() -> None:
+            index, context, future = in_flight.popleft()
+            try:
+                outcomes[index] = (context, future.result(), None)
+            except Exception as exc:
+                outcomes[index] = (context, None, exc)
+
+        try:
+            for index, (context, build) in enumerate(jobs):
+                while len(in_flight) >= self.depth:
+                    collect_oldest()
+                try:
+                    txs = build()
+                    if isinstance(txs, BuiltBatch):
+                        context, txs = txs.context, txs.txs
+                        if not txs:
+                            outcomes[index] = (context, None, None)
+                            continue
+                    if not txs:
+                        continue
+                    sent = self.send(txs, metadata)
+                except Exception as exc:
+                    outcomes[index] = (context, None, exc)
+                    continue
+                if executor is None:
+                    outcomes[index] = (context, sent, None)
+                    continue
+                in_flight.append((index, context, executor.submit(self.wait, sent)))
+            while in_flight:
+                collect_oldest()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        return [outcomes[index] for index in sorted(outcomes)]
@@ -0,0 +1,469 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: position_index.py
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from eth_abi import decode
+
+from poly_web3.const import CTF_ADDRESS, CTF_COLLATERAL_TOKEN, ZERO_BYTES32
+from poly_web3.log import logger
+from poly_web3.signature.ctf_ids import get_outcome_position_id
+
+# keccak256 of the CTF event signatures
+# TransferSingle(address,address,address,uint256,uint256)
+TRANSFER_SINGLE_TOPIC = (
+    "0xc3d58168c5ae7397731d063d5bbf3d657854427343f4c083240f7aacaa2d0f62"
+)
+# TransferBatch(address,address,address,uint256[],uint256[])
+TRANSFER_BATCH_TOPIC = (
+    "0x4a39dc06d4c0dbc64b70af90fd698a233a518aa5d07e595d983b8c0526c8f7fb"
+)
+# PositionSplit(address,address,bytes32,bytes32,uint256[],uint256)
+POSITION_SPLIT_TOPIC = (
+    "0x2e6bb91f8cbcda0c93623c54d0403a43514fabc40084ec96b6d5379a74786298"
+)
+# PositionsMerge(address,address,bytes32,bytes32,uint256[],uint256)
+POSITIONS_MERGE_TOPIC = (
+    "0x6f13ca62553fcc2bcd2372180a43949c1e4cebba603901ede2f4e14f36b282ca"
+)
+# ConditionResolution(bytes32,address,bytes32,uint256,uint256[])
+CONDITION_RESOLUTION_TOPIC = (
+    "0xb44d84d3289691f71497564b85d4233648d9dbae8cbdbb4329f301c3a0185894"
+)
+
+# token_ids -> {token_id: {"condition_id", "outcome_index", "negative_risk", "market_slug"}}
+TokenResolver = Callable[[list[int]], dict[int, dict]]
+# condition_ids -> {condition_id: (payout_denominator, payout_numerators)}
+PayoutReader = Callable[[list[str]], dict[str, tuple[int, list[int]]]]
+
+
+def _address_topic(address: str) -> str:
+    return "0x" + "0" * 24 + address.lower()[2:]
+
+
+def _topic_address(topic: str) -> str:
+    return "0x" + topic[-40:].lower()
+
+
+def _data(log: dict) -> bytes:
+    return bytes.fromhex(log["data"][2:])
+
+
+class PositionIndex:
+    """
+    Local ERC1155 position index for one wallet, built from CTF event logs.
+
+    ``sync`` scans ``TransferSingle``/``TransferBatch`` to and from the wallet,
+    the wallet's own ``PositionSplit``/``PositionsMerge`` and the
+    ``ConditionResolution`` of held conditions with ``eth_getLogs`` in
+    block-range chunks. Balances, the token -> condition map, payouts and a
+    checkpoint block are kept in SQLite, so each sync only scans new blocks.
+    Redeem and merge candidates are then read locally, in the Data API
+    ``/positions`` shape the services already consume. ``start_block`` is
+    required: it should be at or just before the wallet's first CTF activity,
+    since scanning from genesis takes thousands of ``eth_getLogs`` ranges.
+    """
+
+    DEFAULT_BLOCK_CHUNK_SIZE = 5000
+    MIN_BLOCK_CHUNK_SIZE = 100
+    # Stay this many blocks behind the head so reorged logs are not indexed.
+    DEFAULT_CONFIRMATIONS = 20
+    # Block ranges whose eth_getLogs calls share one JSON-RPC batch request.
+    RANGES_PER_REQUEST = 4
+    CONDITIONS_PER_FILTER = 100
+
+    def __init__(
+            self,
+            owner: str,
+            api_client: Any,
+            start_block: int,
+            path: str | Path | None = None,
+            block_chunk_size: int = DEFAULT_BLOCK_CHUNK_SIZE,
+            confirmations: int = DEFAULT_CONFIRMATIONS,
+            token_resolver: TokenResolver | None = None,
+            payout_reader: PayoutReader | None = None,
+    ):
+        if block_chunk_size <= 0:
+            raise Exception("block_chunk_size must be greater than 0")
+        if start_block < 0:
+            raise Exception("start_block must not be negative")
+        self.owner = owner.lower()
+        self.api_client = api_client
+        self.start_block = start_block
+        self.block_chunk_size = block_chunk_size
+        self.confirmations = confirmations
+        self.token_resolver = token_resolver or self._resolve_tokens_from_gamma
+        self.payout_reader = payout_reader
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(path) if path is not None else ":memory:", check_same_thread=False
+        )
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS position_index_checkpoint ("
+            "owner TEXT PRIMARY KEY, block INTEGER NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS position_balance ("
+            "owner TEXT NOT NULL, token_id TEXT NOT NULL, balance TEXT NOT NULL, "
+            "PRIMARY KEY (owner, token_id));"
+            "CREATE TABLE IF NOT EXISTS position_token ("
+            "token_id TEXT PRIMARY KEY, condition_id TEXT NOT NULL, "
+            "outcome_index INTEGER NOT NULL, negative_risk INTEGER NOT NULL, "
+            "market_slug TEXT);"
+            "CREATE TABLE IF NOT EXISTS position_condition ("
+            "condition_id TEXT PRIMARY KEY, payout_denominator TEXT NOT NULL, "
+            "payout_numerators TEXT NOT NULL);"
+        )
+        self._conn.commit()
+
+    @property
+    def checkpoint(self) -> int:
+        """Last fully indexed block; ``start_block - 1`` before the first sync."""
+        row = self._conn.execute(
+            "SELECT block FROM position_index_checkpoint WHERE owner = ?", (self.owner,)
+        ).fetchone()
+        return row[0] if row else self.start_block - 1
+
+    def sync(self, to_block: int | None = None) -> int:
+        """
+        Index every block after the checkpoint up to ``to_block`` (default:
+        ``confirmations`` behind the head) and return the new checkpoint.
+        """
+        with self._lock:
+            if to_block is None:
+                to_block = self._block_number() - self.confirmations
+            tracked = self._unresolved_conditions()
+            for end_block, logs in self._scan(
+                    self.checkpoint + 1,
+                    to_block,
+                    lambda start, end: self._sync_filters(start, end, tracked),
+            ):
+                self._apply_logs(logs, end_block)
+            new_conditions = self._map_unknown_tokens()
+            if new_conditions:
+                self._backfill_resolutions(new_conditions)
+            return self.checkpoint
+
+    def positions(self, condition_ids: list[str] | None = None) -> list[dict]:
+        """Held positions with a known market, in the Data API ``/positions`` shape."""
+        wanted = {condition_id.lower() for condition_id in condition_ids} if condition_ids else None
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT b.token_id, b.balance, t.condition_id, t.outcome_index, "
+                "t.negative_risk, t.market_slug, c.payout_denominator, c.payout_numerators "
+                "FROM position_balance b "
+                "JOIN position_token t ON t.token_id = b.token_id "
+                "LEFT JOIN position_condition c ON c.condition_id = t.condition_id "
+                "WHERE b.owner = ? ORDER BY t.condition_id, t.outcome_index",
+                (self.owner,),
+            ).fetchall()
+        positions: list[dict] = []
+        for row in rows:
+            token_id, balance, condition_id, outcome_index, negative_risk, slug = row[:6]
+            denominator, numerators = row[6:]
+            if wanted is not None and condition_id not in wanted:
+                continue
+            numerators = [int(value) for value in json.loads(numerators)] if numerators else []
+            payout = numerators[outcome_index] if outcome_index < len(numerators) else 0
+            positions.append(
+                {
+                    "asset": token_id,
+                    "conditionId": condition_id,
+                    "outcomeIndex": outcome_index,
+                    "size": int(balance) / 1e6,
+                    "negativeRisk": bool(negative_risk),
+                    "slug": slug,
+                    "redeemable": denominator is not None,
+                    "payoutNumerator": payout,
+                }
+            )
+        return positions
+
+    def redeemable_positions(self, condition_ids: list[str] | None = None) -> list[dict]:
+        """Held outcomes of resolved conditions that pay out."""
+        return [
+            position
+            for position in self.positions(condition_ids)
+            if position["redeemable"] and position["payoutNumerator"] > 0
+        ]
+
+    def mergeable_positions(self) -> list[dict]:
+        """Held outcomes of unresolved conditions, for the merge planner."""
+        return [position for position in self.positions() if not position["redeemable"]]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _block_number(self) -> int:
+        return int(self._rpc("eth_blockNumber", []), 16)
+
+    def _rpc(self, method: str, params: list[Any]) -> Any:
+        result = self.api_client.batch_rpc([(method, params)])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _scan(
+            self,
+            from_block: int,
+            to_block: int,
+            build_filters: Callable[[int, int], list[dict]],
+    ) -> Iterator[tuple[int, list[dict]]]:
+        """
+        Yield ``(last_block, logs)`` per JSON-RPC batch of block ranges. A
+        rejected range (too many results, range limit) halves the chunk size.
+        """
+        while from_block <= to_block:
+            ranges: list[tuple[int, int]] = []
+            start = from_block
+            while start <= to_block and len(ranges) < self.RANGES_PER_REQUEST:
+                end = min(start + self.block_chunk_size - 1, to_block)
+                ranges.append((start, end))
+                start = end + 1
+            filters = [item for start, end in ranges for item in build_filters(start, end)]
+            try:
+                results = self.api_client.batch_rpc([("eth_getLogs", [item]) for item in filters])
+                error = next((item for item in results if isinstance(item, Exception)), None)
+                if error is not None:
+                    raise error
+            except Exception as exc:
+                if self.block_chunk_size <= self.MIN_BLOCK_CHUNK_SIZE:
+                    raise
+                self.block_chunk_size = max(self.MIN_BLOCK_CHUNK_SIZE, self.block_chunk_size // 2)
+                logger.warning(
+                    f"eth_getLogs failed for blocks {from_block}-{ranges[-1][1]}, "
+                    f"retrying with block_chunk_size={self.block_chunk_size}: {exc}"
+                )
+                continue
+            # A transfer can match both the "from" and "to" filters.
+            unique: dict[tuple[str, str], dict] = {}
+            for logs in results:
+                for log in logs:
+                    unique[(log["transactionHash"], log["logIndex"])] = log
+            yield ranges[-1][1], list(unique.values())
+            from_block = ranges[-1][1] + 1
+
+    def _range_filter(self, from_block: int, to_block: int, topics: list[Any]) -> dict:
+        return {
+            "address": CTF_ADDRESS,
+            "fromBlock": hex(from_block),
+            "toBlock": hex(to_block),
+            "topics": topics,
+        }
+
+    def _sync_filters(self, from_block: int, to_block: int, tracked: list[str]) -> list[dict]:
+        owner = _address_topic(self.owner)
+        transfers = [TRANSFER_SINGLE_TOPIC, TRANSFER_BATCH_TOPIC]
+        filters = [
+            self._range_filter(from_block, to_block, [transfers, None, owner]),
+            self._range_filter(from_block, to_block, [transfers, None, None, owner]),
+            self._range_filter(
+                from_block, to_block, [[POSITION_SPLIT_TOPIC, POSITIONS_MERGE_TOPIC], owner]
+            ),
+        ]
+        return filters + self._resolution_filters(from_block, to_block, tracked)
+
+    def _resolution_filters(
+            self, from_block: int, to_block: int, condition_ids: list[str]
+    ) -> list[dict]:
+        return [
+            self._range_filter(
+                from_block,
+                to_block,
+                [CONDITION_RESOLUTION_TOPIC, condition_ids[i: i + self.CONDITIONS_PER_FILTER]],
+            )
+            for i in range(0, len(condition_ids), self.CONDITIONS_PER_FILTER)
+        ]
+
+    def _apply_logs(self, logs: list[dict], end_block: int) -> None:
+        """Apply one scanned batch and move the checkpoint in a single transaction."""
+        deltas: dict[int, int] = {}
+        with self._conn:
+            for log in logs:
+                topic = log["topics"][0].lower()
+                if topic in (TRANSFER_SINGLE_TOPIC, TRANSFER_BATCH_TOPIC):
+                    sender = _topic_address(log["topics"][2])
+                    receiver = _topic_address(log["topics"][3])
+                    if topic == TRANSFER_SINGLE_TOPIC:
+                        token_id, value = decode(["uint256", "uint256"], _data(log))
+                        transfers = [(token_id, value)]
+                    else:
+                        token_ids, values = decode(["uint256[]", "uint256[]"], _data(log))
+                        transfers = list(zip(token_ids, values))
+                    for token_id, value in transfers:
+                        if sender == self.owner:
+                            deltas[token_id] = deltas.get(token_id, 0) - value
+                        if receiver == self.owner:
+                            deltas[token_id] = deltas.get(token_id, 0) + value
+                elif topic in (POSITION_SPLIT_TOPIC, POSITIONS_MERGE_TOPIC):
+                    self._map_split_tokens(log)
+                elif topic == CONDITION_RESOLUTION_TOPIC:
+                    _, numerators = decode(["uint256", "uint256[]"], _data(log))
+                    self._store_resolution(log["topics"][1], sum(numerators), list(numerators))
+            for token_id, delta in deltas.items():
+                if delta:
+                    self._add_balance(token_id, delta)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO position_index_checkpoint (owner, block) VALUES (?, ?)",
+                (self.owner, end_block),
+            )
+
+    def _add_balance(self, token_id: int, delta: int) -> None:
+        row = self._conn.execute(
+            "SELECT balance FROM position_balance WHERE owner = ? AND token_id = ?",
+            (self.owner, str(token_id)),
+        ).fetchone()
+        balance = (int(row[0]) if row else 0) + delta
+        if balance > 0:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO position_balance (owner, token_id, balance) "
+                "VALUES (?, ?, ?)",
+                (self.owner, str(token_id), str(balance)),
+            )
+        else:
+            self._conn.execute(
+                "DELETE FROM position_balance WHERE owner = ? AND token_id = ?",
+                (self.owner, str(token_id)),
+            )
+
+    def _map_split_tokens(self, log: dict) -> None:
+        """
+        Own splits/merges name the condition, so their token IDs map locally.
+        Only splits of the plain CTF collateral are mapped: negRisk outcomes are
+        backed by the adapter's wrapped collateral, so for any other collateral
+        the negRisk flag is unknown and the tokens are left to ``token_resolver``.
+        """
+        parent_collection_id = log["topics"][2].lower()
+        if parent_collection_id != ZERO_BYTES32:
+            return
+        condition_id = log["topics"][3].lower()
+        collateral_token, partition, _ = decode(["address", "uint256[]", "uint256"], _data(log))
+        if collateral_token.lower() != CTF_COLLATERAL_TOKEN.lower():
+            return
+        for index_set in partition:
+            if index_set & (index_set - 1):
+                continue
+            token_id = get_outcome_position_id(
+                collateral_token, ZERO_BYTES32, condition_id, index_set
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO position_token "
+                "(token_id, condition_id, outcome_index, negative_risk, market_slug) "
+                "VALUES (?, ?, ?, 0, NULL)",
+                (str(token_id), condition_id, index_set.bit_length() - 1),
+            )
+
+    def _store_resolution(
+            self, condition_id: str, payout_denominator: int, payout_numerators: list[int]
+    ) -> None:
+        if payout_denominator <= 0:
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO position_condition "
+            "(condition_id, payout_denominator, payout_numerators) VALUES (?, ?, ?)",
+            (
+                condition_id.lower(),
+                str(payout_denominator),
+                json.dumps([str(value) for value in payout_numerators]),
+            ),
+        )
+
+    def _unresolved_conditions(self) -> list[str]:
+        rows = self._conn.execute(
+            "SELECT DISTINCT t.condition_id FROM position_balance b "
+            "JOIN position_token t ON t.token_id = b.token_id "
+            "LEFT JOIN position_condition c ON c.condition_id = t.condition_id "
+            "WHERE b.owner = ? AND c.condition_id IS NULL",
+            (self.owner,),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def _map_unknown_tokens(self) -> list[str]:
+        """
+        Map held token IDs that no own split/merge explained through
+        ``token_resolver``; return the newly mapped unresolved conditions.
+        """
+        before = set(self._unresolved_conditions())
+        rows = self._conn.execute(
+            "SELECT b.token_id FROM position_balance b "
+            "LEFT JOIN position_token t ON t.token_id = b.token_id "
+            "WHERE b.owner = ? AND t.token_id IS NULL",
+            (self.owner,),
+        ).fetchall()
+        token_ids = [int(row[0]) for row in rows]
+        if token_ids:
+            try:
+                mapped = self.token_resolver(token_ids)
+            except Exception as exc:
+                logger.warning(f"failed to map position token ids: {exc}")
+                mapped = {}
+            with self._conn:
+                for token_id, item in mapped.items():
+                    # The resolver knows the negRisk flag, so its row wins.
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO position_token "
+                        "(token_id, condition_id, outcome_index, negative_risk, market_slug) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (
+                            str(token_id),
+                            item["condition_id"].lower(),
+                            item["outcome_index"],
+                            int(bool(item.get("negative_risk"))),
+                            item.get("market_slug"),
+                        ),
+                    )
+        return [
+            condition_id
+            for condition_id in self._unresolved_conditions()
+            if condition_id not in before
+        ]
+
+    def _backfill_resolutions(self, condition_ids: list[str]) -> None:
+        """
+        Conditions first seen in this sync may have resolved before the scanned
+        range: read their payouts through ``payout_reader`` or, without one,
+        scan their ``ConditionResolution`` logs from ``start_block``.
+        """
+        with self._conn:
+            if self.payout_reader is not None:
+                for condition_id, (denominator, numerators) in self.payout_reader(
+                        condition_ids
+                ).items():
+                    self._store_resolution(condition_id, denominator, numerators)
+                return
+            for _, logs in self._scan(
+                    self.start_block,
+                    self.checkpoint,
+                    lambda start, end: self._resolution_filters(start, end, condition_ids),
+            ):
+                for log in logs:
+                    _, numerators = decode(["uint256", "uint256[]"], _data(log))
+                    self._store_resolution(log["topics"][1], sum(numerators), list(numerators))
+
+    def _resolve_tokens_from_gamma(self, token_ids: list[int]) -> dict[int, dict]:
+        markets = self.api_client.get_markets_by_token_ids(
+            [str(token_id) for token_id in token_ids]
+        )
+        mapped: dict[int, dict] = {}
+        for token_id in token_ids:
+            market = markets.get(str(token_id))
+            if not market or not market.get("conditionId"):
+                continue
+            clob_token_ids = self.api_client.parse_clob_token_ids(market)
+            if str(token_id) not in clob_token_ids:
+                logger.warning(
+                    f"token {token_id} missing from clobTokenIds of market "
+                    f"{market['conditionId']}, skipping"
+                )
+                continue
+            mapped[token_id] = {
+                "condition_id": market["conditionId"],
+                "outcome_index": clob_token_ids.index(str(token_id)),
+                "negative_risk": bool(market.get("negRisk")),
+                "market_slug": market.get("slug"),
+            }
+        return mapped
@@ -4,23 +4,26 @@
 # @Site:
 # @File: proxy_service.py
 # @Software: PyCharm
-from eth_utils import to_bytes, to_checksum_address
+from eth_utils import to_checksum_address
 
 from poly_web3.const import (
-    proxy_wallet_factory_abi,
     PROXY_INIT_CODE_HASH,
     SUBMIT_TRANSACTION,
     STATE_MINED,
     STATE_CONFIRMED,
     STATE_FAILED,
 )
+from poly_web3.web3_service import calldata
 from poly_web3.web3_service.base import BaseWeb3Service
 from poly_web3.signature.build import derive_proxy_wallet, create_struct_hash
-from poly_web3.signature.hash_message import hash_message
 from poly_web3.signature import secp256k1
 
 
 class ProxyWeb3Service(BaseWeb3Service):
+    _relay_address: str | None = None
+    _signer: secp256k1.Signer | None = None
+    _signer_key: str | None = None
+
     def _build_redeem_tx(self, to: str, data: str) -> dict:
         return {
             "to": to,
@@ -57,19 +60,9 @@ class ProxyWeb3Service(BaseWeb3Service):
             args["nonce"],
             relay_hub,
             args.get("relay"),
+            output="bytes",
         )
-        message = {"raw": list(to_bytes(hexstr=tx_hash))}
-
-        r, s, recovery = secp256k1.sign(
-            hash_message(message)[2:], self.clob_client.signer.private_key
-        )
-        signature = {
-            "r": secp256k1.int_to_hex(r, 32),
-            "s": secp256k1.int_to_hex(s, 32),
-            "v": 28 if recovery else 27,
-            "yParity": recovery,
-        }
-        final_sig = secp256k1.serialize_signature(**signature, to="hex")
+        final_sig = self._get_signer().sign_message(tx_hash)
         req = {
             "from": args["from"],
             "to": to,
@@ -83,29 +76,67 @@ class ProxyWeb3Service(BaseWeb3Service):
         }
         return req
 
+    def _get_signer(self) -> secp256k1.Signer:
+        private_key = self.clob_client.signer.private_key
+        if self._signer is None or self._signer_key != private_key:
+            self._signer = secp256k1.Signer(private_key)
+            self._signer_key = private_key
+        return self._signer
+
     def encode_proxy_transaction_data(self, txns):
         # Prepare the arguments for the 'proxy' function
         calls_data = [
             (txn["typeCode"], txn["to"], txn["value"], txn["data"]) for txn in txns
         ]
+        return calldata.encode_proxy(calls_data)
 
-        # Create the contract object
-        contract = self.w3.eth.contract(abi=proxy_wallet_factory_abi)
-
-        # Encode function data (compatible with web3 6/7)
-        return contract.functions.proxy(calls_data)._encode_transaction_data()
+    def _simulation_txs(self, txs: list[dict]) -> list[dict]:
+        # Simulate the exact proxy(calls) the relayer will execute.
+        proxy_factory = self.get_contract_config()["ProxyContracts"]["ProxyFactory"]
+        return [
+            {
+                "from": to_checksum_address(self.clob_client.get_address()),
+                "to": proxy_factory,
+                "data": self.encode_proxy_transaction_data(txs),
+            }
+        ]
 
-    def _submit_transactions(self, txs: list[dict], metadata: str) -> dict:
+    def _fetch_relayer_nonce(self) -> str:
         if self.clob_client is None:
             raise Exception("signer not found")
         _from = to_checksum_address(self.clob_client.get_address())
         rp = self._get_relay_payload(_from, self.wallet_type)
+        self._relay_address = rp["address"]
+        return rp["nonce"]
+
+    def _send_transactions(self, txs: list[dict], metadata: str) -> tuple[str, int]:
+        if self.clob_client is None:
+            raise Exception("signer not found")
+        _from = to_checksum_address(self.clob_client.get_address())
+        data = self.encode_proxy_transaction_data(txs)
+        # Retry once with a freshly fetched nonce if the relayer rejects ours.
+        for attempt in range(2):
+            nonce = self.nonce_manager.acquire()
+            try:
+                transaction_id = self._send_proxy_transaction(
+                    _from, data, str(nonce), metadata
+                )
+            except Exception as exc:
+                self.nonce_manager.fail(nonce)
+                if attempt == 0 and self.nonce_manager.is_nonce_error(exc):
+                    continue
+                raise
+            return transaction_id, nonce
+
+    def _send_proxy_transaction(
+            self, _from: str, data: str, nonce: str, metadata: str
+    ) -> str:
         args = {
             "from": _from,
             "gasPrice": "0",
-            "data": self.encode_proxy_transaction_data(txs),
-            "relay": rp["address"],
-            "nonce": rp["nonce"],
+            "data": data,
+            "relay": self._relay_address,
+            "nonce": nonce,
         }
         req = self.build_proxy_transaction_request(args, metadata=metadata)
         headers = self.relayer_client._generate_builder_headers(
@@ -123,13 +154,31 @@ class ProxyWeb3Service(BaseWeb3Service):
                 "Relayer submit transaction failed: transactionID missing, "
                 f"response={response}"
             )
-        redeem_res = self.relayer_client.poll_until_state(
-            transaction_id=response["transactionID"],
-            states=[STATE_MINED, STATE_CONFIRMED],
-            fail_state=STATE_FAILED,
-            max_polls=100,
-        )
-        return redeem_res
+        return response["transactionID"]
+
+    def _pending_transaction_id(self, pending: tuple[str, int]) -> str:
+        return pending[0]
+
+    def _wait_transactions(self, pending: tuple[str, int]) -> dict | None:
+        transaction_id, nonce = pending
+        try:
+            result = self._wait_relayer_transaction(
+                transaction_id,
+                lambda: self.relayer_client.poll_until_state(
+                    transaction_id=transaction_id,
+                    states=[STATE_MINED, STATE_CONFIRMED],
+                    fail_state=STATE_FAILED,
+                    max_polls=100,
+                ),
+            )
+        except Exception:
+            self.nonce_manager.fail(nonce)
+            raise
+        if result is None:
+            self.nonce_manager.fail(nonce)
+        else:
+            self.nonce_manager.confirm(nonce)
+        return result
 
     def _submit_redeem(self, txs: list[dict]) -> dict:
         return self._submit_transactions(txs, "redeem")
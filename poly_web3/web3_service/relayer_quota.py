@@ -0,0 +1,126 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: relayer_quota.py
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+
+class RelayerQuotaTracker:
+    """
+    Token bucket of relayer submits per signer address.
+
+    Each signer starts with ``capacity`` submits (the relayer's daily limit)
+    that refill continuously over ``window_sec``. When the relayer reports the
+    quota as exceeded the bucket is emptied and blocked until the reported
+    reset. State is persisted to SQLite when ``path`` is given, so a restarted
+    process does not start with a full bucket.
+    """
+
+    DEFAULT_CAPACITY = 100  # BaseWeb3Service.RELAYER_DAILY_SUBMIT_LIMIT
+    DEFAULT_WINDOW_SEC = 24 * 60 * 60
+
+    def __init__(
+            self,
+            path: str | Path | None = None,
+            capacity: int = DEFAULT_CAPACITY,
+            window_sec: float = DEFAULT_WINDOW_SEC,
+            clock: Callable[[], float] = time.time,
+    ):
+        if capacity <= 0:
+            raise Exception("capacity must be greater than 0")
+        self.capacity = capacity
+        self.window_sec = window_sec
+        self.clock = clock
+        self._lock = threading.Lock()
+        # signer -> (tokens, updated_at, blocked_until)
+        self._buckets: dict[str, tuple[float, float, float]] = {}
+        self._conn: sqlite3.Connection | None = None
+        if path is not None:
+            self._conn = sqlite3.connect(str(path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS relayer_quota ("
+                "signer TEXT PRIMARY KEY, "
+                "tokens REAL NOT NULL, "
+                "updated_at REAL NOT NULL, "
+                "blocked_until REAL NOT NULL)"
+            )
+            self._conn.commit()
+            for signer, tokens, updated_at, blocked_until in self._conn.execute(
+                    "SELECT signer, tokens, updated_at, blocked_until FROM relayer_quota"
+            ):
+                self._buckets[signer] = (tokens, updated_at, blocked_until)
+
+    @staticmethod
+    def _key(signer: str) -> str:
+        return signer.lower()
+
+    def _refilled(self, key: str, now: float) -> tuple[float, float]:
+        tokens, updated_at, blocked_until = self._buckets.get(
+            key, (float(self.capacity), now, 0.0)
+        )
+        if blocked_until:
+            # The relayer quota resets in full at the reported time.
+            if now < blocked_until:
+                return 0.0, blocked_until
+            return float(self.capacity), 0.0
+        rate = self.capacity / self.window_sec
+        tokens = min(float(self.capacity), tokens + max(0.0, now - updated_at) * rate)
+        return tokens, 0.0
+
+    def _store(self, key: str, tokens: float, now: float, blocked_until: float) -> None:
+        self._buckets[key] = (tokens, now, blocked_until)
+        if self._conn is not None:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO relayer_quota "
+                "(signer, tokens, updated_at, blocked_until) VALUES (?, ?, ?, ?)",
+                (key, tokens, now, blocked_until),
+            )
+            self._conn.commit()
+
+    def available(self, signer: str) -> int:
+        with self._lock:
+            tokens, _ = self._refilled(self._key(signer), self.clock())
+            return int(tokens)
+
+    def seconds_until_available(self, signer: str, count: int = 1) -> float:
+        with self._lock:
+            now = self.clock()
+            tokens, blocked_until = self._refilled(self._key(signer), now)
+            if blocked_until:
+                return blocked_until - now
+            missing = count - tokens
+            if missing <= 0:
+                return 0.0
+            return missing * self.window_sec / self.capacity
+
+    def try_acquire(self, signer: str) -> bool:
+        key = self._key(signer)
+        with self._lock:
+            now = self.clock()
+            tokens, blocked_until = self._refilled(key, now)
+            if tokens < 1:
+                return False
+            self._store(key, tokens - 1, now, blocked_until)
+            return True
+
+    def record_quota_exceeded(self, signer: str, reset_seconds: int | None = None) -> None:
+        """
+        Empty the bucket after the relayer rejected a submit. With a reset hint
+        the bucket is refilled in full at that time, otherwise it refills at
+        its normal rate.
+        """
+        key = self._key(signer)
+        with self._lock:
+            now = self.clock()
+            blocked_until = now + reset_seconds if reset_seconds else 0.0
+            self._store(key, 0.0, now, blocked_until)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,231 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: relayer_status.py
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from poly_web3.const import (
+    GET_TRANSACTIONS,
+    STATE_CONFIRMED,
+    STATE_FAILED,
+    STATE_MINED,
+)
+from poly_web3.log import logger
+
+
+@dataclass
+class _TrackedTransaction:
+    future: Future
+    deadline: float
+    state: str | None = None
+    # consecutive polls whose /transactions list did not contain the ID
+    misses: int = 0
+    next_lookup_at: float = 0.0
+
+
+class RelayerStatusTracker:
+    """
+    Confirm many relayer transactions with one polling loop.
+
+    Every poll fetches the builder's ``/transactions`` list once and resolves
+    the tracked IDs found in it. Only IDs the list has missed for
+    ``misses_before_lookup`` polls in a row are looked up one by one with
+    ``/transaction?id=``, at most ``max_lookups_per_poll`` per poll and once
+    per ``lookup_interval`` per ID. A transaction's future resolves to
+    the relayer transaction dict once it is mined or confirmed, and to
+    ``None`` when it failed or timed out, like ``poll_until_state``. The poll
+    interval starts at ``min_interval`` and backs off towards
+    ``max_interval`` while no tracked transaction changes state. With
+    ``background=False`` no thread is started and the caller drives
+    ``poll_once``.
+    """
+
+    SUCCESS_STATES = frozenset({STATE_MINED, STATE_CONFIRMED})
+    DEFAULT_MIN_INTERVAL_SEC = 1.0
+    DEFAULT_MAX_INTERVAL_SEC = 8.0
+    DEFAULT_BACKOFF = 1.5
+    DEFAULT_TIMEOUT_SEC = 200
+    DEFAULT_MISSES_BEFORE_LOOKUP = 3
+    DEFAULT_MAX_LOOKUPS_PER_POLL = 5
+
+    def __init__(
+            self,
+            fetch_transactions: Callable[[], list[dict]],
+            fetch_transaction: Callable[[str], list[dict]] | None = None,
+            min_interval: float = DEFAULT_MIN_INTERVAL_SEC,
+            max_interval: float = DEFAULT_MAX_INTERVAL_SEC,
+            backoff: float = DEFAULT_BACKOFF,
+            timeout: float = DEFAULT_TIMEOUT_SEC,
+            clock: Callable[[], float] = time.monotonic,
+            background: bool = True,
+            misses_before_lookup: int = DEFAULT_MISSES_BEFORE_LOOKUP,
+            max_lookups_per_poll: int = DEFAULT_MAX_LOOKUPS_PER_POLL,
+            lookup_interval: float | None = None,
+    ):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise Exception("poll intervals must satisfy 0 < min_interval <= max_interval")
+        self.fetch_transactions = fetch_transactions
+        self.fetch_transaction = fetch_transaction
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.clock = clock
+        self.background = background
+        self.misses_before_lookup = misses_before_lookup
+        self.max_lookups_per_poll = max_lookups_per_poll
+        self.lookup_interval = max_interval if lookup_interval is None else lookup_interval
+        self.interval = min_interval
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pending: dict[str, _TrackedTransaction] = {}
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_clients(
+            cls, api_client: Any, relayer_client: Any, **kwargs: Any
+    ) -> "RelayerStatusTracker":
+        """
+        Poll ``relayer_client``'s relayer through ``api_client``'s session,
+        with builder headers from ``relayer_client``.
+        """
+        relayer_url = getattr(relayer_client, "relayer_url", None) or api_client.relayer_url
+
+        def fetch_transactions() -> list[dict]:
+            headers = relayer_client._generate_builder_headers("GET", GET_TRANSACTIONS)
+            return api_client.get_relayer_transactions(headers=headers, relayer_url=relayer_url)
+
+        def fetch_transaction(transaction_id: str) -> list[dict]:
+            return api_client.get_relayer_transaction(transaction_id, relayer_url=relayer_url)
+
+        return cls(fetch_transactions, fetch_transaction, **kwargs)
+
+    def track(self, transaction_id: str, timeout: float | None = None) -> Future:
+        """Start tracking ``transaction_id``; tracking the same ID twice shares the future."""
+        with self._lock:
+            if transaction_id in self._pending:
+                return self._pending[transaction_id].future
+            future: Future = Future()
+            deadline = self.clock() + (self.timeout if timeout is None else timeout)
+            self._pending[transaction_id] = _TrackedTransaction(future, deadline)
+            self.interval = self.min_interval
+            if self.background and (self._thread is None or not self._thread.is_alive()):
+                self._thread = threading.Thread(
+                    target=self._run, name="poly-web3-relayer-status", daemon=True
+                )
+                self._thread.start()
+        self._wakeup.set()
+        return future
+
+    def wait(self, transaction_id: str, timeout: float | None = None) -> dict | None:
+        return self.track(transaction_id, timeout=timeout).result()
+
+    def in_flight(self) -> list[str]:
+        with self._lock:
+            return list(self._pending)
+
+    def poll_once(self) -> None:
+        """Fetch every tracked transaction's state once and resolve finished ones."""
+        with self._lock:
+            transaction_ids = list(self._pending)
+        if not transaction_ids:
+            return
+        wanted = set(transaction_ids)
+        found: dict[str, dict] = {}
+        try:
+            for txn in self.fetch_transactions() or []:
+                transaction_id = txn.get("transactionID")
+                if transaction_id in wanted:
+                    found[transaction_id] = txn
+        except Exception as exc:
+            logger.warning(f"relayer /transactions poll failed: {exc}")
+        for transaction_id in self._lookup_candidates(transaction_ids, found):
+            try:
+                txns = self.fetch_transaction(transaction_id)
+            except Exception as exc:
+                logger.warning(f"relayer transaction {transaction_id} poll failed: {exc}")
+                continue
+            if txns:
+                found[transaction_id] = txns[0]
+
+        changed = False
+        finished: list[tuple[Future, dict | None]] = []
+        now = self.clock()
+        with self._lock:
+            for transaction_id in transaction_ids:
+                tracked = self._pending[transaction_id]
+                txn = found.get(transaction_id)
+                state = txn.get("state") if txn else None
+                if state in self.SUCCESS_STATES:
+                    result = txn
+                elif state == STATE_FAILED:
+                    logger.error(
+                        f"txn {transaction_id} failed onchain, "
+                        f"transaction_hash: {txn.get('transactionHash')}!"
+                    )
+                    result = None
+                elif now >= tracked.deadline:
+                    logger.info(f"Transaction {transaction_id} not mined in time, timing out!")
+                    result = None
+                else:
+                    if state != tracked.state:
+                        tracked.state = state
+                        changed = True
+                    continue
+                del self._pending[transaction_id]
+                finished.append((tracked.future, result))
+                changed = True
+            self.interval = (
+                self.min_interval
+                if changed
+                else min(self.max_interval, self.interval * self.backoff)
+            )
+        # Resolve outside the lock so done-callbacks may call back into the tracker.
+        for future, result in finished:
+            future.set_result(result)
+
+    def _lookup_candidates(
+            self, transaction_ids: list[str], found: dict[str, dict]
+    ) -> list[str]:
+        """
+        Count list misses and pick the IDs due for a single ``/transaction``
+        lookup, longest missing first.
+        """
+        if self.fetch_transaction is None:
+            return []
+        now = self.clock()
+        due: list[tuple[int, str]] = []
+        with self._lock:
+            for transaction_id in transaction_ids:
+                tracked = self._pending.get(transaction_id)
+                if tracked is None:
+                    continue
+                if transaction_id in found:
+                    tracked.misses = 0
+                    continue
+                tracked.misses += 1
+                if tracked.misses >= self.misses_before_lookup and now >= tracked.next_lookup_at:
+                    due.append((tracked.misses, transaction_id))
+            due.sort(key=lambda item: -item[0])
+            lookups = [transaction_id for _, transaction_id in due[: self.max_lookups_per_poll]]
+            for transaction_id in lookups:
+                self._pending[transaction_id].next_lookup_at = now + self.lookup_interval
+        return lookups
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.poll_once()
+            except Exception as exc:
+                logger.error(f"relayer status poll failed: {exc}")
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+                interval = self.interval
+            self._wakeup.wait(interval)
+            self._wakeup.clear()
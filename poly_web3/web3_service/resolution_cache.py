@@ -0,0 +1,116 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: resolution_cache.py
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+class ResolutionCache:
+    """
+    Cache of CTF payout vectors keyed by condition ID.
+
+    Resolved conditions never change their payout vector, so they are kept
+    forever (and persisted to SQLite when ``path`` is given). Unresolved
+    conditions are only remembered in memory for ``unresolved_ttl`` seconds.
+    """
+
+    DEFAULT_UNRESOLVED_TTL_SEC = 60
+
+    def __init__(
+            self,
+            path: str | Path | None = None,
+            unresolved_ttl: float = DEFAULT_UNRESOLVED_TTL_SEC,
+    ):
+        self.unresolved_ttl = unresolved_ttl
+        self._lock = threading.Lock()
+        self._resolved: dict[str, tuple[int, list[int]]] = {}
+        self._unresolved: dict[str, float] = {}
+        self._conn: sqlite3.Connection | None = None
+        if path is not None:
+            self._conn = sqlite3.connect(str(path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS condition_resolution ("
+                "condition_id TEXT PRIMARY KEY, "
+                "payout_denominator TEXT NOT NULL, "
+                "payout_numerators TEXT NOT NULL, "
+                "resolved_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+            for condition_id, denominator, numerators in self._conn.execute(
+                    "SELECT condition_id, payout_denominator, payout_numerators "
+                    "FROM condition_resolution"
+            ):
+                self._resolved[condition_id] = (
+                    int(denominator),
+                    [int(value) for value in json.loads(numerators)],
+                )
+
+    @staticmethod
+    def _key(condition_id: str) -> str:
+        return condition_id.lower()
+
+    def get(self, condition_id: str) -> tuple[int, list[int]] | None:
+        """
+        Return ``(payout_denominator, payout_numerators)`` when known, where an
+        unresolved condition is ``(0, [])``; ``None`` means a fresh read is needed.
+        """
+        key = self._key(condition_id)
+        with self._lock:
+            if key in self._resolved:
+                denominator, numerators = self._resolved[key]
+                return denominator, list(numerators)
+            expires_at = self._unresolved.get(key)
+            if expires_at is None:
+                return None
+            if expires_at <= time.monotonic():
+                del self._unresolved[key]
+                return None
+            return 0, []
+
+    def set(
+            self,
+            condition_id: str,
+            payout_denominator: int,
+            payout_numerators: list[int],
+    ) -> None:
+        key = self._key(condition_id)
+        with self._lock:
+            if payout_denominator <= 0:
+                self._unresolved[key] = time.monotonic() + self.unresolved_ttl
+                return
+            self._unresolved.pop(key, None)
+            self._resolved[key] = (payout_denominator, list(payout_numerators))
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO condition_resolution "
+                    "(condition_id, payout_denominator, payout_numerators, resolved_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (
+                        key,
+                        str(payout_denominator),
+                        json.dumps([str(value) for value in payout_numerators]),
+                        time.time(),
+                    ),
+                )
+                self._conn.commit()
+
+    def invalidate(self, condition_id: str) -> None:
+        key = self._key(condition_id)
+        with self._lock:
+            self._unresolved.pop(key, None)
+            self._resolved.pop(key, None)
+            if self._conn is not None:
+                self._conn.execute(
+                    "DELETE FROM condition_resolution WHERE condition_id = ?", (key,)
+                )
+                self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,327 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: resolution_watcher.py
+import threading
+import time
+from typing import Any, Callable
+
+from eth_abi import decode
+
+from poly_web3.const import CTF_ADDRESS, CTF_COLLATERAL_TOKEN
+from poly_web3.log import logger
+from poly_web3.schema import RedeemResult
+from poly_web3.web3_service.base import BaseWeb3Service
+from poly_web3.web3_service.position_index import CONDITION_RESOLUTION_TOPIC
+
+
+class ResolutionWatcher:
+    """
+    Watch the conditions a wallet holds and redeem them as soon as they resolve.
+
+    Each ``poll`` reads CTF ``ConditionResolution`` logs for the watched
+    conditions over the blocks seen since the previous poll (or syncs the
+    service's ``position_index`` when one is enabled). Newly resolved
+    conditions go into a debounced queue: ``flush`` redeems them once no new
+    resolution has arrived for ``debounce_sec`` or ``max_batch_size`` are
+    waiting, through ``_redeem_from_positions`` with a chain-read fallback
+    for conditions the position source does not know. Conditions whose
+    redeem fails (or raises) go back into the queue and are retried after
+    ``retry_backoff_sec``, doubled per attempt, up to ``max_retries`` times.
+    """
+
+    DEFAULT_POLL_INTERVAL_SEC = 15
+    DEFAULT_DEBOUNCE_SEC = 30
+    DEFAULT_MAX_BATCH_SIZE = 20
+    DEFAULT_HOLDINGS_REFRESH_SEC = 300
+    DEFAULT_CONFIRMATIONS = 5
+    DEFAULT_MAX_RETRIES = 5
+    DEFAULT_RETRY_BACKOFF_SEC = 60
+    BLOCK_CHUNK_SIZE = 5000
+    CONDITIONS_PER_FILTER = 100
+
+    def __init__(
+            self,
+            service: BaseWeb3Service,
+            poll_interval: float = DEFAULT_POLL_INTERVAL_SEC,
+            debounce_sec: float = DEFAULT_DEBOUNCE_SEC,
+            max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+            holdings_refresh_sec: float = DEFAULT_HOLDINGS_REFRESH_SEC,
+            confirmations: int = DEFAULT_CONFIRMATIONS,
+            max_retries: int = DEFAULT_MAX_RETRIES,
+            retry_backoff_sec: float = DEFAULT_RETRY_BACKOFF_SEC,
+            wrap_redeemed_collateral: bool = True,
+            collateral_token: str = CTF_COLLATERAL_TOKEN,
+            on_redeem: Callable[[RedeemResult], None] | None = None,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_batch_size <= 0:
+            raise Exception("max_batch_size must be greater than 0")
+        self.service = service
+        self.poll_interval = poll_interval
+        self.debounce_sec = debounce_sec
+        self.max_batch_size = max_batch_size
+        self.holdings_refresh_sec = holdings_refresh_sec
+        self.confirmations = confirmations
+        self.max_retries = max_retries
+        self.retry_backoff_sec = retry_backoff_sec
+        self.wrap_redeemed_collateral = wrap_redeemed_collateral
+        self.collateral_token = collateral_token
+        self.on_redeem = on_redeem
+        self.clock = clock
+        self.last_block: int | None = None
+        self._lock = threading.Lock()
+        self._watched: set[str] = set()
+        self._queue: list[str] = []
+        # condition_id -> (failed redeem attempts, clock time of next attempt)
+        self._retries: dict[str, tuple[int, float]] = {}
+        self._last_queued_at: float | None = None
+        self._holdings_refreshed_at: float | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def watch(self, condition_ids: str | list[str]) -> None:
+        """
+        Start watching conditions; ones that already resolved are queued
+        right away.
+        """
+        if isinstance(condition_ids, str):
+            condition_ids = [condition_ids]
+        with self._lock:
+            new = [
+                condition_id
+                for condition_id in dict.fromkeys(
+                    condition_id.lower() for condition_id in condition_ids if condition_id
+                )
+                if condition_id not in self._watched and condition_id not in self._queue
+            ]
+        if not new:
+            return
+        vectors = self.service.get_payout_vectors(new)
+        with self._lock:
+            for condition_id in new:
+                denominator, _ = vectors.get(condition_id, (0, []))
+                if denominator > 0:
+                    self._enqueue(condition_id)
+                else:
+                    self._watched.add(condition_id)
+
+    def watched(self) -> list[str]:
+        with self._lock:
+            return sorted(self._watched)
+
+    def pending(self) -> list[str]:
+        with self._lock:
+            return list(self._queue)
+
+    def refresh_holdings(self) -> None:
+        """Watch every condition the wallet currently holds a position in."""
+        self._holdings_refreshed_at = self.clock()
+        if self.service.position_index is not None:
+            self.service.position_index.sync()
+            positions = self.service.position_index.positions()
+        else:
+            positions = self.service.api_client.fetch_all_positions(
+                user_address=self.service._resolve_user_address()
+            )
+        self.watch([pos.get("conditionId") for pos in positions if pos.get("conditionId")])
+
+    def poll(self) -> list[str]:
+        """Queue watched conditions resolved since the last poll and return them."""
+        if self.service.position_index is not None:
+            resolved = self._poll_position_index()
+        else:
+            resolved = self._poll_resolution_logs()
+        with self._lock:
+            for condition_id in resolved:
+                if condition_id in self._watched:
+                    self._watched.discard(condition_id)
+                    self._enqueue(condition_id)
+        if resolved:
+            logger.info(f"resolved conditions queued for redeem: {resolved}")
+        return resolved
+
+    def flush(self, force: bool = False) -> RedeemResult | None:
+        """
+        Redeem the queue once it has been quiet for ``debounce_sec`` or is
+        full; ``force=True`` redeems whatever is queued now.
+        """
+        with self._lock:
+            now = self.clock()
+            ready = [
+                condition_id
+                for condition_id in self._queue
+                if force or self._retries.get(condition_id, (0, now))[1] <= now
+            ]
+            if not ready:
+                return None
+            quiet = now - self._last_queued_at >= self.debounce_sec
+            if not (force or quiet or len(ready) >= self.max_batch_size):
+                return None
+            taken = set(ready)
+            self._queue = [
+                condition_id for condition_id in self._queue if condition_id not in taken
+            ]
+        try:
+            result = self._redeem(ready)
+        except Exception as exc:
+            self._retry(ready, str(exc))
+            raise
+        failed = {condition_id.lower() for condition_id in result.error_condition_ids}
+        self._retry([condition_id for condition_id in ready if condition_id in failed])
+        with self._lock:
+            for condition_id in ready:
+                if condition_id not in failed:
+                    self._retries.pop(condition_id, None)
+        if self.on_redeem is not None:
+            self.on_redeem(result)
+        return result
+
+    def run_once(self) -> RedeemResult | None:
+        now = self.clock()
+        if (
+                self._holdings_refreshed_at is None
+                or now - self._holdings_refreshed_at >= self.holdings_refresh_sec
+        ):
+            self.refresh_holdings()
+        self.poll()
+        return self.flush()
+
+    def start(self) -> None:
+        """Run ``run_once`` every ``poll_interval`` seconds on a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="poly-web3-resolution-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, flush: bool = True, timeout: float | None = None) -> RedeemResult | None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        return self.flush(force=True) if flush else None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as exc:
+                logger.error(f"resolution watcher poll failed: {exc}")
+            self._stop.wait(self.poll_interval)
+
+    def _retry(self, condition_ids: list[str], error: str | None = None) -> None:
+        """Queue failed conditions again with backoff, or give up on them."""
+        with self._lock:
+            now = self.clock()
+            for condition_id in condition_ids:
+                attempts = self._retries.get(condition_id, (0, now))[0] + 1
+                if attempts > self.max_retries:
+                    self._retries.pop(condition_id, None)
+                    logger.error(
+                        f"giving up redeem of {condition_id} after {self.max_retries} retries"
+                        + (f": {error}" if error else "")
+                    )
+                    continue
+                self._retries[condition_id] = (
+                    attempts,
+                    now + self.retry_backoff_sec * 2 ** (attempts - 1),
+                )
+                if condition_id not in self._queue:
+                    self._queue.append(condition_id)
+
+    def _enqueue(self, condition_id: str) -> None:
+        if condition_id not in self._queue:
+            self._queue.append(condition_id)
+            self._last_queued_at = self.clock()
+
+    def _redeem(self, condition_ids: list[str]) -> RedeemResult:
+        positions = self.service._fetch_positions_by_condition_ids(condition_ids)
+        result = self.service._redeem_from_positions(
+            positions,
+            self.max_batch_size,
+            wrap_redeemed_collateral=self.wrap_redeemed_collateral,
+        )
+        found = {pos.get("conditionId", "").lower() for pos in positions}
+        missing = [condition_id for condition_id in condition_ids if condition_id not in found]
+        if missing:
+            chain_result = self.service._redeem_conditions_from_chain(
+                condition_ids=missing,
+                batch_size=self.max_batch_size,
+                collateral_token=self.collateral_token,
+                wrap_redeemed_collateral=self.wrap_redeemed_collateral,
+            )
+            result.success_list.extend(chain_result.success_list)
+            result.error_list.extend(chain_result.error_list)
+        return result
+
+    def _poll_position_index(self) -> list[str]:
+        """
+        Return watched conditions the index saw resolve with a payout; ones
+        that resolved against every held outcome stop being watched.
+        """
+        index = self.service.position_index
+        self.last_block = index.sync()
+        resolved: set[str] = set()
+        paying: set[str] = set()
+        for position in index.positions():
+            if position["redeemable"]:
+                resolved.add(position["conditionId"])
+                if position["payoutNumerator"] > 0:
+                    paying.add(position["conditionId"])
+        with self._lock:
+            lost = sorted((resolved - paying) & self._watched)
+            self._watched.difference_update(lost)
+            redeemable = sorted(paying & self._watched)
+        if lost:
+            logger.info(f"resolved conditions with nothing to redeem, unwatched: {lost}")
+        return redeemable
+
+    def _poll_resolution_logs(self) -> list[str]:
+        api_client = self.service.api_client
+        head = int(self._rpc("eth_blockNumber", []), 16) - self.confirmations
+        if self.last_block is None:
+            # Anything resolved before the first poll was caught by watch().
+            self.last_block = head
+            return []
+        with self._lock:
+            watched = sorted(self._watched)
+        resolved: list[str] = []
+        from_block = self.last_block + 1
+        while watched and from_block <= head:
+            to_block = min(from_block + self.BLOCK_CHUNK_SIZE - 1, head)
+            filters = [
+                {
+                    "address": CTF_ADDRESS,
+                    "fromBlock": hex(from_block),
+                    "toBlock": hex(to_block),
+                    "topics": [
+                        CONDITION_RESOLUTION_TOPIC,
+                        watched[i: i + self.CONDITIONS_PER_FILTER],
+                    ],
+                }
+                for i in range(0, len(watched), self.CONDITIONS_PER_FILTER)
+            ]
+            for logs in api_client.batch_rpc([("eth_getLogs", [item]) for item in filters]):
+                if isinstance(logs, Exception):
+                    raise logs
+                for log in logs:
+                    condition_id = log["topics"][1].lower()
+                    _, numerators = decode(
+                        ["uint256", "uint256[]"], bytes.fromhex(log["data"][2:])
+                    )
+                    self.service.resolution_cache.set(
+                        condition_id, sum(numerators), list(numerators)
+                    )
+                    resolved.append(condition_id)
+            from_block = to_block + 1
+        self.last_block = max(self.last_block, head)
+        return list(dict.fromkeys(resolved))
+
+    def _rpc(self, method: str, params: list[Any]) -> Any:
+        result = self.service.api_client.batch_rpc([(method, params)])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
@@ -0,0 +1,214 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: rpc_pool.py
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable
+
+import requests
+from web3 import HTTPProvider
+
+from poly_web3.const import HTTP_REQUEST_TIMEOUT_SECONDS, RPC_URL
+from poly_web3.log import logger
+
+
+def normalize_rpc_urls(rpc_url: str | list[str] | None) -> list[str]:
+    if not rpc_url:
+        return [RPC_URL]
+    if isinstance(rpc_url, str):
+        return [rpc_url]
+    return list(dict.fromkeys(rpc_url))
+
+
+class RpcEndpointPool:
+    """
+    Route JSON-RPC requests over several endpoints.
+
+    Endpoints are ranked by an EWMA of their response latency. An endpoint
+    that times out, errors or answers 429/5xx is put on cooldown and the
+    request fails over to the next one. Hedged requests go to the fastest
+    endpoint first and, if it has not answered within ``hedge_delay``, to the
+    next one as well; the first successful response wins.
+    """
+
+    DEFAULT_HEDGE_DELAY_SEC = 0.3
+    DEFAULT_COOLDOWN_SEC = 30
+    DEFAULT_SMOOTHING = 0.3
+    FAILOVER_STATUS_CODES = {429, 500, 502, 503, 504}
+
+    def __init__(
+            self,
+            urls: str | list[str],
+            session: requests.Session | None = None,
+            timeout: int = HTTP_REQUEST_TIMEOUT_SECONDS,
+            hedge_delay: float = DEFAULT_HEDGE_DELAY_SEC,
+            cooldown_sec: float = DEFAULT_COOLDOWN_SEC,
+            smoothing: float = DEFAULT_SMOOTHING,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.urls = normalize_rpc_urls(urls)
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self.hedge_delay = hedge_delay
+        self.cooldown_sec = cooldown_sec
+        self.smoothing = smoothing
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._latency: dict[str, float | None] = {url: None for url in self.urls}
+        self._down_until: dict[str, float] = {url: 0.0 for url in self.urls}
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def ranked(self) -> list[str]:
+        """
+        Healthy endpoints by EWMA latency (unmeasured ones keep their given
+        order after measured ones), then endpoints on cooldown as a last resort.
+        """
+        with self._lock:
+            now = self.clock()
+            healthy = [url for url in self.urls if self._down_until[url] <= now]
+            down = [url for url in self.urls if self._down_until[url] > now]
+            healthy.sort(
+                key=lambda url: (
+                    self._latency[url] is None,
+                    self._latency[url] or 0.0,
+                )
+            )
+            down.sort(key=lambda url: self._down_until[url])
+            return healthy + down
+
+    def latency(self, url: str) -> float | None:
+        with self._lock:
+            return self._latency[url]
+
+    def record_success(self, url: str, latency: float) -> None:
+        with self._lock:
+            current = self._latency[url]
+            self._latency[url] = (
+                latency
+                if current is None
+                else (1 - self.smoothing) * current + self.smoothing * latency
+            )
+            self._down_until[url] = 0.0
+
+    def record_failure(self, url: str) -> None:
+        with self._lock:
+            self._down_until[url] = self.clock() + self.cooldown_sec
+
+    def request(self, payload: Any, hedge: bool = True) -> requests.Response:
+        """
+        POST a JSON-RPC payload (a dict/list, or already encoded bytes) and
+        return the first successful HTTP response.
+        """
+        endpoints = self.ranked()
+        if hedge and len(endpoints) > 1:
+            return self._hedged_request(payload, endpoints)
+        last_error: Exception | None = None
+        for url in endpoints:
+            try:
+                return self._post(url, payload)
+            except Exception as exc:
+                last_error = exc
+                logger.warning(f"rpc endpoint {url} failed, failing over: {exc}")
+        raise last_error
+
+    def check_health(self) -> dict[str, bool]:
+        """
+        Probe every endpoint with ``eth_blockNumber`` and update its latency
+        or cooldown; returns url -> healthy.
+        """
+        payload = {"jsonrpc": "2.0", "method": "eth_blockNumber", "params": [], "id": 1}
+
+        def probe(url: str) -> bool:
+            try:
+                self._post(url, payload)
+                return True
+            except Exception as exc:
+                logger.warning(f"rpc endpoint {url} health check failed: {exc}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=len(self.urls)) as executor:
+            return dict(zip(self.urls, executor.map(probe, self.urls)))
+
+    def _post(self, url: str, payload: Any) -> requests.Response:
+        if isinstance(payload, (bytes, str)):
+            kwargs = {"data": payload, "headers": {"Content-Type": "application/json"}}
+        else:
+            kwargs = {"json": payload}
+        started = self.clock()
+        try:
+            response = self.session.post(url, timeout=self.timeout, **kwargs)
+        except Exception:
+            self.record_failure(url)
+            raise
+        if response.status_code in self.FAILOVER_STATUS_CODES:
+            self.record_failure(url)
+            raise Exception(f"rpc endpoint {url} returned HTTP {response.status_code}")
+        response.raise_for_status()
+        self.record_success(url, self.clock() - started)
+        return response
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=max(2, 2 * len(self.urls)))
+            return self._executor
+
+    def _hedged_request(self, payload: Any, endpoints: list[str]) -> requests.Response:
+        executor = self._get_executor()
+        remaining = iter(endpoints)
+        pending: dict[Any, str] = {}
+        errors: list[Exception] = []
+
+        def launch() -> None:
+            url = next(remaining, None)
+            if url is not None:
+                pending[executor.submit(self._post, url, payload)] = url
+
+        launch()
+        while pending:
+            done, _ = wait(pending, timeout=self.hedge_delay, return_when=FIRST_COMPLETED)
+            if not done:
+                # The leader is slow: hedge on the next endpoint.
+                launch()
+                continue
+            for future in done:
+                url = pending.pop(future)
+                try:
+                    return future.result()
+                except Exception as exc:
+                    errors.append(exc)
+                    logger.warning(f"rpc endpoint {url} failed, failing over: {exc}")
+            if not pending:
+                launch()
+        raise errors[-1]
+
+
+class PooledHTTPProvider(HTTPProvider):
+    """
+    Web3 HTTP provider that sends every request through an ``RpcEndpointPool``.
+    Reads are hedged; transaction submits only fail over.
+    """
+
+    NON_IDEMPOTENT_METHODS = {"eth_sendRawTransaction", "eth_sendTransaction"}
+
+    def __init__(self, pool: RpcEndpointPool, **kwargs: Any):
+        super().__init__(pool.urls[0], session=pool.session, **kwargs)
+        self.pool = pool
+
+    def _make_request(self, method: str, request_data: bytes) -> bytes:
+        return self.pool.request(
+            request_data, hedge=method not in self.NON_IDEMPOTENT_METHODS
+        ).content
+
+    def make_batch_request(self, batch_requests: list[tuple[str, Any]]) -> Any:
+        request_data = self.encode_batch_rpc_request(batch_requests)
+        response = self.decode_rpc_response(self.pool.request(request_data).content)
+        if not isinstance(response, list):
+            return response
+        return sorted(response, key=lambda item: item.get("id") or 0)
+
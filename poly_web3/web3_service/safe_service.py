@@ -4,11 +4,24 @@
 # @Site:
 # @File: safe_service.py
 # @Software: PyCharm
-from py_builder_relayer_client.models import OperationType, SafeTransaction
+from py_builder_relayer_client.builder.safe import build_safe_transaction_request
+from py_builder_relayer_client.config import is_safe_config_valid
+from py_builder_relayer_client.models import (
+    OperationType,
+    SafeTransaction,
+    SafeTransactionArgs,
+    TransactionType,
+)
+from py_builder_relayer_client.response import ClientRelayerTransactionResponse
+
+from poly_web3.const import SUBMIT_TRANSACTION
 from poly_web3.web3_service.base import BaseWeb3Service
 
 
 class SafeWeb3Service(BaseWeb3Service):
+    # A deployed Safe stays deployed, so /deployed is only asked until it says so.
+    _safe_deployed = False
+
     def _build_redeem_tx(self, to: str, data: str) -> SafeTransaction:
         return SafeTransaction(
             to=to,
@@ -17,18 +30,105 @@ class SafeWeb3Service(BaseWeb3Service):
             operation=OperationType.Call,
         )
 
-    def _submit_transactions(
+    def _tx_target_and_data(self, tx: SafeTransaction) -> tuple[str, str]:
+        return tx.to, tx.data
+
+    def _fetch_relayer_nonce(self) -> str:
+        if self.relayer_client is None:
+            raise Exception("relayer_client not found")
+        nonce_payload = self.relayer_client.get_nonce(
+            self.relayer_client.signer.address(), TransactionType.SAFE.value
+        )
+        if not nonce_payload or nonce_payload.get("nonce") is None:
+            raise Exception("invalid nonce payload received")
+        return nonce_payload["nonce"]
+
+    def _send_transactions(
             self, txs: list[SafeTransaction], metadata: str
-    ) -> dict | None:
+    ) -> tuple[ClientRelayerTransactionResponse, int]:
         if self.relayer_client is None:
             raise Exception("relayer_client not found")
+        self._assert_safe_ready()
+        # Safe nonces come from nonce_manager like the proxy and deposit-wallet
+        # ones, so pipelined batches never sign with the same nonce; retry once
+        # with a freshly fetched nonce if the relayer rejects ours.
+        for attempt in range(2):
+            nonce = self.nonce_manager.acquire()
+            try:
+                response = self._send_safe_transaction(txs, str(nonce), metadata)
+            except Exception as exc:
+                self.nonce_manager.fail(nonce)
+                self._raise_relayer_quota_exceeded_if_needed(exc)
+                if attempt == 0 and self.nonce_manager.is_nonce_error(exc):
+                    continue
+                raise
+            return response, nonce
+
+    def _assert_safe_ready(self) -> None:
+        """Same preconditions ``RelayClient.execute`` checks before signing."""
+        relayer_client = self.relayer_client
+        relayer_client.assert_signer_needed()
+        relayer_client.assert_builder_creds_needed()
+        if not is_safe_config_valid(relayer_client.contract_config):
+            raise Exception("Safe contracts are not configured for this chain")
+        if self._safe_deployed:
+            return
+        safe_address = relayer_client.get_expected_safe()
+        if not relayer_client.get_deployed(safe_address):
+            raise Exception(f"expected safe {safe_address} is not deployed")
+        self._safe_deployed = True
+
+    def _send_safe_transaction(
+            self, txs: list[SafeTransaction], nonce: str, metadata: str
+    ) -> ClientRelayerTransactionResponse:
+        relayer_client = self.relayer_client
+        req = build_safe_transaction_request(
+            signer=relayer_client.signer,
+            args=SafeTransactionArgs(
+                from_address=relayer_client.signer.address(),
+                nonce=nonce,
+                chain_id=relayer_client.chain_id,
+                transactions=txs,
+            ),
+            config=relayer_client.contract_config,
+            metadata=metadata,
+        ).to_dict()
+        response = self._post_relayer_request(SUBMIT_TRANSACTION, req)
+        self._raise_relayer_quota_exceeded_if_needed(response)
+        if not isinstance(response, dict) or not response.get("transactionID"):
+            raise Exception(
+                "Relayer submit transaction failed: transactionID missing, "
+                f"response={response}"
+            )
+        return ClientRelayerTransactionResponse(
+            response["transactionID"], response.get("transactionHash"), relayer_client
+        )
+
+    def _post_relayer_request(self, path: str, body: dict) -> dict:
+        # The only private RelayClient API used here: it signs builder headers
+        # and posts to the relayer client's own URL.
+        return self.relayer_client._post_request("POST", path, body)
+
+    def _pending_transaction_id(
+            self, pending: tuple[ClientRelayerTransactionResponse, int]
+    ) -> str | None:
+        return pending[0].transaction_id
+
+    def _wait_transactions(
+            self, pending: tuple[ClientRelayerTransactionResponse, int]
+    ) -> dict | None:
+        response, nonce = pending
         try:
-            resp = self.relayer_client.execute(txs, metadata)
-            result = resp.wait()
+            result = self._wait_relayer_transaction(response.transaction_id, response.wait)
+            self._raise_relayer_quota_exceeded_if_needed(result)
         except Exception as exc:
+            self.nonce_manager.fail(nonce)
             self._raise_relayer_quota_exceeded_if_needed(exc)
             raise
-        self._raise_relayer_quota_exceeded_if_needed(result)
+        if result is None:
+            self.nonce_manager.fail(nonce)
+        else:
+            self.nonce_manager.confirm(nonce)
         return result
 
     def _submit_redeem(self, txs: list[SafeTransaction]) -> dict | None:
@@ -0,0 +1,119 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: submission.py
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable
+
+STATE_BUILDING = "building"
+STATE_SUBMITTED = "submitted"
+STATE_COMPLETED = "completed"
+STATE_FAILED = "failed"
+
+_local = threading.local()
+
+
+class SubmissionHandle:
+    """
+    Handle of a non-blocking ``submit_*`` call.
+
+    The action runs on its own thread. ``state`` moves from ``building`` to
+    ``submitted`` once the relayer accepted the first transaction, then to
+    ``completed`` with the action's usual result (``RedeemResult``,
+    ``BatchBinaryOperationResult``, ...) or to ``failed`` if it raised.
+    ``future`` is a plain ``concurrent.futures.Future``, so handles from many
+    wallets can be awaited together with ``concurrent.futures.wait``.
+    """
+
+    def __init__(self, action: str):
+        self.action = action
+        self.future: Future = Future()
+        self.transaction_ids: list[str] = []
+        self._state = STATE_BUILDING
+        self._lock = threading.Lock()
+        self._submitted = threading.Event()
+        self._submitted_callbacks: list[Callable[["SubmissionHandle"], Any]] = []
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def wait(self, timeout: float | None = None) -> Any:
+        """Block until the action finished and return its result (or raise its error)."""
+        return self.future.result(timeout)
+
+    def wait_submitted(self, timeout: float | None = None) -> bool:
+        """Block until the first transaction was accepted or the action ended."""
+        return self._submitted.wait(timeout)
+
+    def add_done_callback(self, fn: Callable[["SubmissionHandle"], Any]) -> None:
+        self.future.add_done_callback(lambda _: fn(self))
+
+    def add_submitted_callback(self, fn: Callable[["SubmissionHandle"], Any]) -> None:
+        with self._lock:
+            if not self._submitted.is_set():
+                self._submitted_callbacks.append(fn)
+                return
+        fn(self)
+
+    def _mark_submitted(self, transaction_id: str | None) -> None:
+        with self._lock:
+            if transaction_id:
+                self.transaction_ids.append(transaction_id)
+            if self._submitted.is_set():
+                return
+            self._state = STATE_SUBMITTED
+            self._submitted.set()
+            callbacks, self._submitted_callbacks = self._submitted_callbacks, []
+        for fn in callbacks:
+            fn(self)
+
+    def _finish(self, result: Any = None, error: BaseException | None = None) -> None:
+        with self._lock:
+            self._state = STATE_FAILED if error is not None else STATE_COMPLETED
+            self._submitted.set()
+            self._submitted_callbacks = []
+        if error is not None:
+            self.future.set_exception(error)
+        else:
+            self.future.set_result(result)
+
+    def __repr__(self) -> str:
+        return (
+            f"SubmissionHandle(action={self.action!r}, state={self._state!r}, "
+            f"transaction_ids={self.transaction_ids!r})"
+        )
+
+
+def notify_submitted(transaction_id: str | None) -> None:
+    """Report an accepted relayer transaction to the handle running on this thread."""
+    handle = getattr(_local, "handle", None)
+    if handle is not None:
+        handle._mark_submitted(transaction_id)
+
+
+def run_in_background(action: str, run: Callable[[], Any]) -> SubmissionHandle:
+    """
+    Run ``run`` on a new thread and return its handle once the first relayer
+    transaction was accepted, or the action finished without submitting.
+    """
+    handle = SubmissionHandle(action)
+
+    def target() -> None:
+        _local.handle = handle
+        try:
+            result = run()
+        except BaseException as exc:
+            handle._finish(error=exc)
+        else:
+            handle._finish(result)
+        finally:
+            _local.handle = None
+
+    threading.Thread(target=target, name=f"poly-web3-submit-{action}", daemon=True).start()
+    handle.wait_submitted()
+    return handle
@@ -0,0 +1,166 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: submit_scheduler.py
+import threading
+from typing import Any
+
+from poly_web3.schema import BatchBinaryOperationItem, ScheduledSubmitResult
+from poly_web3.web3_service.base import BaseWeb3Service
+from poly_web3.web3_service.transaction_plan import TransactionBundle, TransactionPlan
+
+
+class SubmissionScheduler:
+    """
+    Queue redeem/merge/split work and submit it in full relayer submissions.
+
+    ``flush`` plans everything queued as one ``TransactionPlan``, so redeems,
+    merges and splits (negRisk or not, including redeems that fall back to
+    on-chain payout state) share bundles of up to ``max_batch_size`` txs and
+    ``gas_budget`` gas. Only full bundles (by tx count or by gas) are sent
+    unless ``force=True``, and never more bundles than
+    the service's ``quota_tracker`` has tokens for: each bundle is exactly one
+    relayer submission. Work in bundles that were not sent stays queued.
+    """
+
+    DEFAULT_MAX_BATCH_SIZE = 20
+    ACTIONS = ("redeem", "merge", "split")
+
+    def __init__(
+            self,
+            service: BaseWeb3Service,
+            max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+            gas_budget: int = TransactionPlan.DEFAULT_GAS_BUDGET,
+            wrap_redeemed_collateral: bool = True,
+    ):
+        if max_batch_size <= 0:
+            raise Exception("max_batch_size must be greater than 0")
+        self.service = service
+        self.max_batch_size = max_batch_size
+        self.gas_budget = gas_budget
+        self.wrap_redeemed_collateral = wrap_redeemed_collateral
+        self._lock = threading.Lock()
+        self._redeem_queue: list[str] = []
+        self._merge_queue: list[BatchBinaryOperationItem] = []
+        self._split_queue: list[BatchBinaryOperationItem] = []
+
+    def queue_redeem(self, condition_ids: str | list[str]) -> None:
+        if isinstance(condition_ids, str):
+            condition_ids = [condition_ids]
+        with self._lock:
+            for condition_id in condition_ids:
+                if condition_id and condition_id not in self._redeem_queue:
+                    self._redeem_queue.append(condition_id)
+
+    def queue_merge(self, operations: list[BatchBinaryOperationItem | dict]) -> None:
+        with self._lock:
+            self._merge_queue.extend(
+                self.service._normalize_batch_binary_operation_items(operations)
+            )
+
+    def queue_split(self, operations: list[BatchBinaryOperationItem | dict]) -> None:
+        with self._lock:
+            self._split_queue.extend(
+                self.service._normalize_batch_binary_operation_items(operations)
+            )
+
+    def pending(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "redeem": len(self._redeem_queue),
+                "merge": len(self._merge_queue),
+                "split": len(self._split_queue),
+            }
+
+    def _queued_count(self) -> int:
+        return len(self._redeem_queue) + len(self._merge_queue) + len(self._split_queue)
+
+    def _available_submits(self) -> int | None:
+        if self.service.quota_tracker is None:
+            return None
+        return self.service.quota_tracker.available(
+            self.service.clob_client.get_address()
+        )
+
+    def _ready_bundles(
+            self, bundles: list[TransactionBundle], force: bool
+    ) -> list[TransactionBundle]:
+        """Drop the last bundle unless it is full or ``force`` is set."""
+        if bundles and not force and not bundles[-1].full:
+            return bundles[:-1]
+        return bundles
+
+    def flush(self, force: bool = False) -> ScheduledSubmitResult:
+        """
+        Submit queued work as full bundles; ``force=True`` also sends the last
+        partial one.
+        """
+        result = ScheduledSubmitResult()
+        budget = self._available_submits()
+        with self._lock:
+            if budget is not None and budget <= 0:
+                result.deferred_count = self._queued_count()
+                return result
+            taken = {
+                action: getattr(self, f"_{action}_queue")[:] for action in self.ACTIONS
+            }
+            for action in self.ACTIONS:
+                getattr(self, f"_{action}_queue").clear()
+
+        try:
+            plan = TransactionPlan(self.service)
+            if taken["redeem"]:
+                plan.add_redeem(
+                    taken["redeem"], wrap_redeemed_collateral=self.wrap_redeemed_collateral
+                )
+            if taken["merge"]:
+                plan.add_merge_batch(taken["merge"])
+            if taken["split"]:
+                plan.add_split_batch(taken["split"])
+            bundles = self._ready_bundles(
+                plan.bundle(self.gas_budget, self.max_batch_size), force
+            )
+        except Exception:
+            self._requeue(taken)
+            raise
+        send = bundles if budget is None else bundles[:budget]
+
+        # Everything planned but not sent goes back to the queue.
+        sent_units = {id(unit) for bundle in send for unit in bundle.units}
+        deferred: dict[str, list[Any]] = {action: [] for action in self.ACTIONS}
+        items = self._items_by_condition(taken)
+        for unit in plan.units:
+            if id(unit) in sent_units or unit.action not in deferred:
+                continue
+            for condition_id in unit.condition_ids:
+                if items[unit.action].get(condition_id):
+                    deferred[unit.action].append(items[unit.action][condition_id].pop(0))
+        self._requeue(deferred)
+
+        plan.submit_bundles(send, result)
+        result.submitted_count = len(send)
+        with self._lock:
+            result.deferred_count = self._queued_count()
+        return result
+
+    @staticmethod
+    def _items_by_condition(taken: dict[str, list[Any]]) -> dict[str, dict[str, list[Any]]]:
+        items: dict[str, dict[str, list[Any]]] = {}
+        for action, queued in taken.items():
+            by_condition: dict[str, list[Any]] = {}
+            for item in queued:
+                condition_id = item if action == "redeem" else item.condition_id
+                by_condition.setdefault(condition_id, []).append(item)
+            items[action] = by_condition
+        return items
+
+    def _requeue(self, items: dict[str, list[Any]]) -> None:
+        """Put items back at the head of their queue, ahead of newer work."""
+        with self._lock:
+            for action, queued in items.items():
+                queue = getattr(self, f"_{action}_queue")
+                if action == "redeem":
+                    queued = [
+                        condition_id for condition_id in queued if condition_id not in queue
+                    ]
+                queue[:0] = queued
@@ -0,0 +1,389 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: transaction_plan.py
+from dataclasses import dataclass, field
+from typing import Any
+
+from poly_web3.const import (
+    DEFAULT_COLLATERAL_TOKEN,
+    ZERO_BYTES32,
+)
+from poly_web3.log import logger
+from poly_web3.web3_service.gas_batcher import GasModel
+from poly_web3.schema import (
+    BatchBinaryOperationItem,
+    TransactionBundleErrorItem,
+    TransactionBundleSuccessItem,
+    TransactionPlanResult,
+    WalletType,
+)
+
+
+@dataclass
+class PlannedTransaction:
+    """
+    Txs that must land in the same submission, e.g. one condition's redeem.
+    ``wrap_amount`` is the collateral the unit pays out that the bundle's
+    trailing wrap should convert.
+    """
+    action: str
+    condition_ids: list[str]
+    txs: list[Any]
+    gas: int
+    wrap_amount: int = 0
+
+
+@dataclass
+class TransactionBundle:
+    units: list[PlannedTransaction] = field(default_factory=list)
+    # set by ``TransactionPlan.bundle``: no planned unit fits in what is left
+    # of the gas budget / tx limit
+    full: bool = False
+
+    @property
+    def txs(self) -> list[Any]:
+        return [tx for unit in self.units for tx in unit.txs]
+
+    @property
+    def gas(self) -> int:
+        return sum(unit.gas for unit in self.units)
+
+    @property
+    def actions(self) -> list[str]:
+        return list(dict.fromkeys(unit.action for unit in self.units))
+
+    @property
+    def condition_ids(self) -> list[str]:
+        return list(dict.fromkeys(
+            condition_id for unit in self.units for condition_id in unit.condition_ids
+        ))
+
+    @property
+    def wrap_amount(self) -> int:
+        return sum(unit.wrap_amount for unit in self.units)
+
+
+class TransactionPlan:
+    """
+    Collect redeem/merge/split/wrap txs for one wallet and pack them into as
+    few relayer submissions as fit in a gas budget.
+
+    Proxy ``proxy(calls)``, Safe multisend and deposit-wallet batches all take
+    mixed targets, so negRisk and plain CTF txs of different actions can share
+    a submission. Units keep the order they were added in. Redeem payouts to
+    wrap are not planned as a unit of their own: every bundle holding such
+    redeems ends with one approve+wrap for exactly what they pay out, so a
+    wrap never lands in a different submission than the redeems funding it.
+    """
+
+    DEFAULT_GAS_BUDGET = 5_000_000
+    # approve + wrap appended to bundles that redeem collateral to wrap
+    WRAP_TX_TYPES = ["approve", "wrap"]
+
+    def __init__(self, service: Any):
+        if getattr(service, "wallet_type", None) == WalletType.EOA:
+            raise ImportError("EOA wallet bundle not supported")
+        self.service = service
+        # Unit gas comes from the service's GasModel, which learns from
+        # simulated batches, so the plan and the batchers share one estimate.
+        self.gas_model: GasModel = getattr(service, "gas_model", None) or GasModel()
+        self.units: list[PlannedTransaction] = []
+        # condition_id -> reason it could not be planned
+        self.unplanned: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def add(
+            self,
+            action: str,
+            txs: list[Any],
+            condition_ids: list[str] | None = None,
+            gas: int | None = None,
+            wrap_amount: int = 0,
+            tx_types: list[str] | None = None,
+    ) -> None:
+        """
+        Plan ``txs`` as one unit. Without ``gas`` the unit is estimated from
+        ``tx_types`` (``GasModel`` keys, ``action`` per tx by default).
+        """
+        if not txs:
+            return
+        if gas is None:
+            gas = self.gas_model.predict(tx_types or [action] * len(txs))
+        self.units.append(
+            PlannedTransaction(
+                action=action,
+                condition_ids=list(condition_ids or []),
+                txs=list(txs),
+                gas=gas,
+                wrap_amount=wrap_amount,
+            )
+        )
+
+    def add_redeem(
+            self,
+            condition_ids: str | list[str],
+            wrap_redeemed_collateral: bool = True,
+    ) -> None:
+        """
+        Plan redeems for condition IDs using positions from the Data API, or
+        from the service's position index when one is enabled. Conditions
+        without a position there are redeemed from on-chain payout state, like
+        ``redeem`` does.
+        """
+        if isinstance(condition_ids, str):
+            condition_ids = [condition_ids]
+        positions = self.service._fetch_positions_by_condition_ids(condition_ids)
+        self.add_redeem_positions(
+            positions, wrap_redeemed_collateral=wrap_redeemed_collateral
+        )
+        found = {pos.get("conditionId") for pos in positions}
+        missing_condition_ids = [
+            condition_id for condition_id in condition_ids if condition_id not in found
+        ]
+        if missing_condition_ids:
+            self._add_chain_redeems(missing_condition_ids, wrap_redeemed_collateral)
+
+    def _add_chain_redeems(
+            self, condition_ids: list[str], wrap_redeemed_collateral: bool
+    ) -> None:
+        try:
+            txs, tx_condition_ids, chain_errors = self.service._build_chain_redeem_txs(
+                condition_ids,
+                self.service.prefetch_negative_risk_flags(condition_ids),
+                wrap_redeemed_collateral=False,
+            )
+            payouts: dict[str, int] = {}
+            if wrap_redeemed_collateral and tx_condition_ids:
+                payouts = self.service.get_redeemable_payout_amounts(tx_condition_ids)
+        except Exception as exc:
+            for condition_id in condition_ids:
+                self.unplanned[condition_id] = str(exc)
+            return
+        for condition_id, tx in zip(tx_condition_ids, txs):
+            self.add(
+                "redeem",
+                [tx],
+                [condition_id],
+                wrap_amount=payouts.get(condition_id, 0),
+                tx_types=["redeem"],
+            )
+        for item in chain_errors:
+            self.unplanned.setdefault(item.condition_id, item.error)
+
+    def add_redeem_positions(
+            self,
+            positions: list[dict],
+            wrap_redeemed_collateral: bool = True,
+    ) -> None:
+        positions_by_condition: dict[str, list[dict]] = {}
+        for pos in positions:
+            condition_id = pos.get("conditionId")
+            if condition_id:
+                positions_by_condition.setdefault(condition_id, []).append(pos)
+
+        redeem_txs: dict[str, list[Any]] = {}
+        normal_condition_ids: list[str] = []
+        neg_risk_condition_ids: set[str] = set()
+        for condition_id, condition_positions in positions_by_condition.items():
+            try:
+                txs = self.service._build_redeem_txs_from_positions(
+                    condition_positions, wrap_redeemed_collateral=False
+                )
+            except Exception as exc:
+                self.unplanned[condition_id] = str(exc)
+                continue
+            redeem_txs[condition_id] = txs
+            if any(pos.get("negativeRisk") for pos in condition_positions):
+                neg_risk_condition_ids.add(condition_id)
+            elif txs:
+                normal_condition_ids.append(condition_id)
+
+        payouts: dict[str, int] = {}
+        if wrap_redeemed_collateral and normal_condition_ids:
+            payouts = self.service.get_redeemable_payout_amounts(normal_condition_ids)
+        for condition_id, txs in redeem_txs.items():
+            tx_type = "neg_risk_redeem" if condition_id in neg_risk_condition_ids else "redeem"
+            self.add(
+                "redeem",
+                txs,
+                [condition_id],
+                wrap_amount=payouts.get(condition_id, 0),
+                tx_types=[tx_type] * len(txs),
+            )
+
+    def add_wrap(self, amount: int, condition_ids: list[str] | None = None) -> None:
+        """Plan a standalone wrap of collateral the wallet already holds."""
+        self.add(
+            "wrap",
+            self.service._build_wrap_redeemed_collateral_txs(amount),
+            condition_ids,
+            tx_types=self.WRAP_TX_TYPES,
+        )
+
+    def add_split_batch(
+            self,
+            operations: list[BatchBinaryOperationItem | dict],
+            collateral_token: str = DEFAULT_COLLATERAL_TOKEN,
+            parent_collection_id: str = ZERO_BYTES32,
+    ) -> None:
+        self._add_binary_operations("split", operations, collateral_token, parent_collection_id)
+
+    def add_merge_batch(
+            self,
+            operations: list[BatchBinaryOperationItem | dict],
+            collateral_token: str = DEFAULT_COLLATERAL_TOKEN,
+            parent_collection_id: str = ZERO_BYTES32,
+    ) -> None:
+        self._add_binary_operations("merge", operations, collateral_token, parent_collection_id)
+
+    def _add_binary_operations(
+            self,
+            action: str,
+            operations: list[BatchBinaryOperationItem | dict],
+            collateral_token: str,
+            parent_collection_id: str,
+    ) -> None:
+        normalized_operations = self.service._normalize_batch_binary_operation_items(
+            operations
+        )
+        negative_risk_flags = self.service.prefetch_negative_risk_flags(
+            [
+                operation.condition_id
+                for operation in normalized_operations
+                if operation.negative_risk is None
+            ]
+        )
+        for operation in normalized_operations:
+            negative_risk = (
+                operation.negative_risk
+                if operation.negative_risk is not None
+                else negative_risk_flags.get(operation.condition_id)
+            )
+            try:
+                _, tx = self.service._build_binary_market_tx(
+                    action=action,
+                    condition_id=operation.condition_id,
+                    amount=operation.amount,
+                    collateral_token=collateral_token,
+                    parent_collection_id=parent_collection_id,
+                    negative_risk=negative_risk,
+                )
+            except Exception as exc:
+                self.unplanned[operation.condition_id] = str(exc)
+                continue
+            self.add(
+                action,
+                [tx],
+                [operation.condition_id],
+                tx_types=[f"neg_risk_{action}" if negative_risk else action],
+            )
+
+    def bundle(
+            self,
+            gas_budget: int = DEFAULT_GAS_BUDGET,
+            max_txs_per_bundle: int | None = None,
+    ) -> list[TransactionBundle]:
+        """
+        Pack units in order into bundles whose summed gas stays within
+        ``gas_budget``; a unit larger than the budget gets a bundle of its own.
+        Bundles with redeem payouts to wrap get room for, and end with, their
+        own approve+wrap. A bundle is marked ``full`` when it closed because the
+        next unit did not fit, or, for the last one, when none of the planned
+        units would fit in it any more.
+        """
+        if gas_budget <= 0:
+            raise Exception("gas_budget must be greater than 0")
+        wrap_gas = self.gas_model.predict(self.WRAP_TX_TYPES)
+
+        def fits(bundle: TransactionBundle, unit: PlannedTransaction) -> bool:
+            wraps = bool(unit.wrap_amount or bundle.wrap_amount)
+            if bundle.gas + unit.gas + (wrap_gas if wraps else 0) > gas_budget:
+                return False
+            return (
+                max_txs_per_bundle is None
+                or len(bundle.txs) + len(unit.txs) + (2 if wraps else 0)
+                <= max_txs_per_bundle
+            )
+
+        bundles: list[TransactionBundle] = []
+        current = TransactionBundle()
+        for unit in self.units:
+            if current.units and not fits(current, unit):
+                current.full = True
+                bundles.append(self._close_bundle(current, wrap_gas))
+                current = TransactionBundle()
+            current.units.append(unit)
+        if current.units:
+            current.full = not any(fits(current, unit) for unit in self.units)
+            bundles.append(self._close_bundle(current, wrap_gas))
+        return bundles
+
+    def _close_bundle(self, bundle: TransactionBundle, wrap_gas: int) -> TransactionBundle:
+        wrap_amount = bundle.wrap_amount
+        if wrap_amount > 0:
+            txs = self.service._build_wrap_redeemed_collateral_txs(wrap_amount)
+            if txs:
+                bundle.units.append(
+                    PlannedTransaction(action="wrap", condition_ids=[], txs=txs, gas=wrap_gas)
+                )
+        return bundle
+
+    def submit(
+            self,
+            gas_budget: int = DEFAULT_GAS_BUDGET,
+            max_txs_per_bundle: int | None = None,
+    ) -> TransactionPlanResult:
+        """
+        Submit every bundle and map each outcome back to its condition IDs.
+        """
+        return self.submit_bundles(self.bundle(gas_budget, max_txs_per_bundle))
+
+    def submit_bundles(
+            self,
+            bundles: list[TransactionBundle],
+            plan_result: TransactionPlanResult | None = None,
+    ) -> TransactionPlanResult:
+        """
+        Submit ``bundles`` (from ``bundle``) and record their outcomes, plus
+        the plan's unplanned conditions, in ``plan_result``.
+        """
+        if plan_result is None:
+            plan_result = TransactionPlanResult()
+        for condition_id, error in self.unplanned.items():
+            plan_result.error_list.append(
+                TransactionBundleErrorItem(
+                    actions=[],
+                    condition_ids=[condition_id],
+                    error=error,
+                )
+            )
+        jobs = [(bundle, lambda bundle=bundle: bundle.txs) for bundle in bundles]
+        for bundle, submit_result, error in self.service._run_submission_pipeline(
+                jobs, "bundle"
+        ):
+            if error is None and submit_result is None:
+                error = Exception("bundle execute returned None")
+            if error is not None:
+                logger.error(
+                    f"bundle error, actions={bundle.actions}, "
+                    f"condition_ids={bundle.condition_ids}, error={error}"
+                )
+                plan_result.error_list.append(
+                    TransactionBundleErrorItem(
+                        actions=bundle.actions,
+                        condition_ids=bundle.condition_ids,
+                        error=str(error),
+                    )
+                )
+                continue
+            plan_result.success_list.append(
+                TransactionBundleSuccessItem(
+                    actions=bundle.actions,
+                    condition_ids=bundle.condition_ids,
+                    result=submit_result,
+                )
+            )
+        return plan_result
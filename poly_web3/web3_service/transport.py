@@ -0,0 +1,89 @@
+# -*- coding = utf-8 -*-
+# @Time: 2026-10-18
+# @Author: PinBar
+# @File: transport.py
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from poly_web3.const import HTTP_REQUEST_TIMEOUT_SECONDS
+
+
+class HttpTransport:
+    """
+    One pooled, keep-alive ``requests.Session`` for every service and client
+    in the process.
+
+    Data API and Gamma GETs are retried with exponential backoff on 429/5xx
+    (honouring ``Retry-After``). RPC POSTs are read-only JSON-RPC calls and
+    are retried the same way. Relayer submits are never retried, because a
+    5xx may still have been accepted. Timeouts are set per endpoint class.
+    """
+
+    DEFAULT_TIMEOUTS = {
+        "data_api": HTTP_REQUEST_TIMEOUT_SECONDS,
+        "gamma": HTTP_REQUEST_TIMEOUT_SECONDS,
+        "relayer": 15,
+        "rpc": HTTP_REQUEST_TIMEOUT_SECONDS,
+    }
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    _default: "HttpTransport | None" = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+            self,
+            pool_connections: int = 10,
+            pool_maxsize: int = 32,
+            max_retries: int = 3,
+            backoff_factor: float = 0.3,
+            timeouts: dict[str, float] | None = None,
+            rpc_urls: list[str] | None = None,
+    ):
+        self.timeouts = {**self.DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.session = requests.Session()
+        self.session.headers["Connection"] = "keep-alive"
+
+        def adapter(allowed_methods: frozenset[str]) -> HTTPAdapter:
+            retry = Retry(
+                total=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=self.RETRY_STATUS_CODES,
+                allowed_methods=allowed_methods,
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            return HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=retry,
+            )
+
+        read_adapter = adapter(frozenset({"GET", "HEAD"}))
+        self.session.mount("https://", read_adapter)
+        self.session.mount("http://", read_adapter)
+        self.rpc_urls: list[str] = []
+        self._rpc_adapter = adapter(frozenset({"GET", "HEAD", "POST"}))
+        for url in rpc_urls or []:
+            self.mount_rpc_url(url)
+
+    def mount_rpc_url(self, url: str) -> None:
+        """Let POSTs to ``url`` be retried; only JSON-RPC reads go there."""
+        if url not in self.rpc_urls:
+            self.rpc_urls.append(url)
+            self.session.mount(url, self._rpc_adapter)
+
+    def timeout(self, endpoint_class: str) -> float:
+        return self.timeouts.get(endpoint_class, HTTP_REQUEST_TIMEOUT_SECONDS)
+
+    @classmethod
+    def default(cls) -> "HttpTransport":
+        """The process-wide transport used when none is passed explicitly."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,228 @@
+import asyncio
+import unittest
+from pathlib import Path
+import sys
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from poly_web3.const import GAMMA_MAX_CONDITION_IDS_PER_REQUEST
+from poly_web3.web3_service.api_client import PolymarketAPIClient
+from poly_web3.web3_service import async_api_client
+from poly_web3.web3_service.async_api_client import AsyncPolymarketAPIClient
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self.payload
+
+
+class FakeGammaSession:
+    def __init__(self, neg_risk_ids=()):
+        self.neg_risk_ids = set(neg_risk_ids)
+        self.requests = []
+
+    def get(self, url, params=None, timeout=None):
+        self.requests.append(params)
+        return FakeResponse(
+            [
+                {"conditionId": condition_id, "negRisk": condition_id in self.neg_risk_ids}
+                for condition_id in params["condition_ids"]
+                if condition_id != "0xmissing"
+            ]
+        )
+
+
+class MarketLookupTest(unittest.TestCase):
+    def test_bulk_lookup_chunks_requests_and_caches_results(self):
+        session = FakeGammaSession(neg_risk_ids={"0xcond1"})
+        client = PolymarketAPIClient(session=session)
+        condition_ids = [f"0xcond{i}" for i in range(GAMMA_MAX_CONDITION_IDS_PER_REQUEST + 1)]
+
+        markets = client.get_markets_by_condition_ids(condition_ids + ["0xmissing"])
+
+        self.assertEqual(len(session.requests), 2)
+        self.assertTrue(markets["0xcond1"]["negRisk"])
+        self.assertIsNone(markets["0xmissing"])
+
+        self.assertFalse(client.get_market_by_condition_id("0xcond2")["negRisk"])
+        self.assertIsNone(client.get_market_by_condition_id("0xmissing"))
+        self.assertEqual(len(session.requests), 2)
+
+
+class FakeRpcSession:
+    def __init__(self):
+        self.payloads = []
+
+    def post(self, url, json=None, timeout=None):
+        self.payloads.append(json)
+        # Answer out of order, with one reverting call.
+        return FakeResponse(
+            [
+                {"jsonrpc": "2.0", "id": item["id"], "error": {"message": "execution reverted"}}
+                if item["params"][0]["data"] == "0xbad"
+                else {"jsonrpc": "2.0", "id": item["id"], "result": hex(21000 + item["id"])}
+                for item in reversed(json)
+            ]
+        )
+
+
+class JsonRpcBatchTest(unittest.TestCase):
+    def test_batch_estimate_gas_correlates_ids_and_maps_item_errors(self):
+        session = FakeRpcSession()
+        client = PolymarketAPIClient(session=session)
+        client.RPC_MAX_BATCH_SIZE = 2
+        txs = [{"to": "0xctf", "data": data} for data in ("0x1", "0xbad", "0x2")]
+
+        results = client.batch_estimate_gas(txs)
+
+        self.assertEqual([len(payload) for payload in session.payloads], [2, 1])
+        self.assertEqual(results[0], "21000")
+        self.assertIn("execution reverted", str(results[1]))
+        self.assertEqual(results[2], "21000")
+
+
+class FakePositionsSession:
+    def __init__(self, total, limit, fail_offset=None):
+        self.total = total
+        self.limit = limit
+        self.fail_offset = fail_offset
+        self.offsets = []
+
+    def get(self, url, params=None, timeout=None):
+        self.offsets.append(params["offset"])
+        if params["offset"] == self.fail_offset:
+            raise Exception("data api unavailable")
+        start = params["offset"]
+        end = min(start + self.limit, self.total)
+        return FakeResponse([{"index": i} for i in range(start, end)])
+
+
+class PositionsPaginationTest(unittest.TestCase):
+    def test_concurrent_page_fetch_keeps_order_and_stops_at_short_page(self):
+        limit = PolymarketAPIClient.POSITIONS_PAGE_LIMIT
+        session = FakePositionsSession(total=limit * 4 + 7, limit=limit)
+        client = PolymarketAPIClient(session=session, page_fetch_workers=3)
+
+        positions = client.fetch_all_positions("0xuser")
+
+        self.assertEqual([item["index"] for item in positions], list(range(limit * 4 + 7)))
+        self.assertTrue({limit * i for i in range(5)} <= set(session.offsets))
+        self.assertTrue(set(session.offsets) <= {limit * i for i in range(7)})
+
+    def test_iter_position_pages_is_lazy(self):
+        limit = PolymarketAPIClient.POSITIONS_PAGE_LIMIT
+        session = FakePositionsSession(total=limit * 3, limit=limit)
+        client = PolymarketAPIClient(session=session)
+
+        pages = client.iter_position_pages("0xuser", mergeable=True)
+        first_page = next(pages)
+
+        self.assertEqual(len(first_page), limit)
+        self.assertEqual(session.offsets, [0])
+        self.assertEqual(sum(1 for _ in client.iter_positions("0xuser")), limit * 3)
+
+    def test_iter_position_pages_raises_on_failed_page(self):
+        limit = PolymarketAPIClient.POSITIONS_PAGE_LIMIT
+        session = FakePositionsSession(total=limit * 3, limit=limit, fail_offset=limit)
+        client = PolymarketAPIClient(session=session)
+
+        pages = client.iter_position_pages("0xuser")
+        self.assertEqual(len(next(pages)), limit)
+        with self.assertRaisesRegex(Exception, "data api unavailable"):
+            next(pages)
+
+    def test_serial_page_fetch_is_default(self):
+        limit = PolymarketAPIClient.POSITIONS_PAGE_LIMIT
+        session = FakePositionsSession(total=limit * 2, limit=limit)
+        client = PolymarketAPIClient(session=session)
+
+        positions = client.fetch_all_positions("0xuser")
+
+        self.assertEqual(len(positions), limit * 2)
+        self.assertEqual(session.offsets, [0, limit, limit * 2])
+
+
+class FakeAsyncResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+    def raise_for_status(self):
+        return None
+
+    async def json(self, content_type=None):
+        return self.payload
+
+
+class FakeAsyncSession:
+    """Serves position pages per user and tracks peak in-flight requests."""
+
+    closed = False
+
+    def __init__(self, page_size):
+        self.page_size = page_size
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = []
+
+    def request(self, method, url, params=None, **kwargs):
+        self.requests.append((method, url, params))
+        return self._respond(dict(params or []))
+
+    def _respond(self, query):
+        session = self
+
+        class _Response(FakeAsyncResponse):
+            async def __aenter__(self):
+                session.in_flight += 1
+                session.max_in_flight = max(session.max_in_flight, session.in_flight)
+                await asyncio.sleep(0)
+                return self
+
+            async def __aexit__(self, exc_type, exc, tb):
+                session.in_flight -= 1
+
+        offset = int(query.get("offset", 0))
+        size = session.page_size if offset == 0 else 1
+        return _Response(
+            [{"conditionId": f"{query['user']}-{offset + i}"} for i in range(size)]
+        )
+
+
+class AsyncPolymarketAPIClientTest(unittest.IsolatedAsyncioTestCase):
+    async def test_fetches_many_wallets_concurrently_within_limit(self):
+        session = FakeAsyncSession(page_size=PolymarketAPIClient.POSITIONS_PAGE_LIMIT)
+        client = AsyncPolymarketAPIClient(session=session, max_concurrency=2)
+
+        result = await client.fetch_all_positions_for_users(
+            ["0xa", "0xb", "0xc"], mergeable=True
+        )
+
+        self.assertEqual(
+            {user: len(positions) for user, positions in result.items()},
+            {"0xa": 501, "0xb": 501, "0xc": 501},
+        )
+        self.assertEqual(session.max_in_flight, 2)
+        self.assertIn(("mergeable", "true"), session.requests[0][2])
+        await client.close()
+
+    async def test_missing_aiohttp_raises_install_hint(self):
+        with mock.patch.object(async_api_client, "aiohttp", None):
+            with self.assertRaisesRegex(ImportError, r"poly-web3\[async\]"):
+                AsyncPolymarketAPIClient()
+
+
+if __name__ == "__main__":
+    unittest.main()
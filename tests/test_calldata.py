@@ -0,0 +1,99 @@
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from web3 import Web3
+
+from poly_web3.const import (
+    CTF_ABI_MERGE,
+    CTF_ABI_PAYOUT,
+    CTF_ABI_REDEEM,
+    CTF_ABI_SPLIT,
+    CTF_ADDRESS,
+    CTF_COLLATERAL_TOKEN,
+    ERC20_ABI_APPROVE,
+    NEG_RISK_ADAPTER_ABI_REDEEM,
+    PUSD_WRAPPER_ABI_WRAP,
+    PUSD_WRAPPER_ADDRESS,
+    ZERO_BYTES32,
+    proxy_wallet_factory_abi,
+)
+from poly_web3.web3_service import calldata
+from poly_web3.web3_service.base import BaseWeb3Service
+
+CONDITION_ID = "0x" + "ab" * 32
+
+
+class CalldataEncoderTest(unittest.TestCase):
+    def setUp(self):
+        self.w3 = Web3()
+
+    def web3_encode(self, abi, fn_name, *args):
+        contract = self.w3.eth.contract(address=CTF_ADDRESS, abi=abi)
+        return getattr(contract.functions, fn_name)(*args)._encode_transaction_data()
+
+    def test_matches_web3_contract_encoding(self):
+        cases = [
+            (
+                calldata.encode_ctf_redeem(CTF_COLLATERAL_TOKEN, ZERO_BYTES32, CONDITION_ID, [1, 2]),
+                self.web3_encode(CTF_ABI_REDEEM, "redeemPositions", CTF_COLLATERAL_TOKEN, ZERO_BYTES32, CONDITION_ID, [1, 2]),
+            ),
+            (
+                calldata.encode_split_position(CTF_COLLATERAL_TOKEN, ZERO_BYTES32, CONDITION_ID, [1, 2], 10**6),
+                self.web3_encode(CTF_ABI_SPLIT, "splitPosition", CTF_COLLATERAL_TOKEN, ZERO_BYTES32, CONDITION_ID, [1, 2], 10**6),
+            ),
+            (
+                calldata.encode_merge_positions(CTF_COLLATERAL_TOKEN, ZERO_BYTES32, CONDITION_ID, [1, 2], 5),
+                self.web3_encode(CTF_ABI_MERGE, "mergePositions", CTF_COLLATERAL_TOKEN, ZERO_BYTES32, CONDITION_ID, [1, 2], 5),
+            ),
+            (
+                calldata.encode_neg_risk_redeem(CONDITION_ID, [3, 0]),
+                self.web3_encode(NEG_RISK_ADAPTER_ABI_REDEEM, "redeemPositions", CONDITION_ID, [3, 0]),
+            ),
+            (
+                calldata.encode_erc20_approve(PUSD_WRAPPER_ADDRESS, 7),
+                self.web3_encode(ERC20_ABI_APPROVE, "approve", PUSD_WRAPPER_ADDRESS, 7),
+            ),
+            (
+                calldata.encode_pusd_wrap(CTF_COLLATERAL_TOKEN, PUSD_WRAPPER_ADDRESS, 7),
+                self.web3_encode(PUSD_WRAPPER_ABI_WRAP, "wrap", CTF_COLLATERAL_TOKEN, PUSD_WRAPPER_ADDRESS, 7),
+            ),
+        ]
+        for fast, expected in cases:
+            self.assertEqual(fast, expected)
+
+    def test_proxy_calls_match_web3_contract_encoding(self):
+        calls = [(1, CTF_ADDRESS, 0, "0x01b7037c"), (1, PUSD_WRAPPER_ADDRESS, 0, "0x")]
+        contract = self.w3.eth.contract(abi=proxy_wallet_factory_abi)
+
+        self.assertEqual(
+            calldata.encode_proxy(calls),
+            contract.functions.proxy(calls)._encode_transaction_data(),
+        )
+
+    def test_approve_still_validates_deprecated_token_address(self):
+        service = BaseWeb3Service.__new__(BaseWeb3Service)
+
+        self.assertEqual(
+            service.build_erc20_approve_tx_data(PUSD_WRAPPER_ADDRESS, 7),
+            calldata.encode_erc20_approve(PUSD_WRAPPER_ADDRESS, 7),
+        )
+        with self.assertRaises(ValueError):
+            service.build_erc20_approve_tx_data(PUSD_WRAPPER_ADDRESS, 7, token_address="0x1234")
+
+
+class ContractRegistryTest(unittest.TestCase):
+    def test_contract_objects_are_built_once_per_service(self):
+        service = BaseWeb3Service.__new__(BaseWeb3Service)
+        service.w3 = Web3()
+
+        first = service._contract(CTF_ABI_PAYOUT, CTF_ADDRESS)
+
+        self.assertIs(service._contract(CTF_ABI_PAYOUT, CTF_ADDRESS), first)
+        self.assertIsNot(service._contract(CTF_ABI_REDEEM, CTF_ADDRESS), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
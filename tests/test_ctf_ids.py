@@ -0,0 +1,91 @@
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from poly_web3.const import CTF_COLLATERAL_TOKEN, ZERO_BYTES32
+from poly_web3.signature.build import keccak256
+from poly_web3.signature.ctf_ids import (
+    ALT_BN128_B,
+    ALT_BN128_P,
+    get_collection_id,
+    get_outcome_position_id,
+    get_position_id,
+)
+
+CONDITION_A = "0x" + "ab" * 32
+CONDITION_B = "0x" + "cd" * 32
+
+# Polymarket "Presidential Election Winner 2024: Donald Trump" (negRisk market):
+# conditionId and its Gamma clobTokenIds [Yes, No]. negRisk outcome tokens are
+# minted by the NegRiskAdapter against its WrappedCollateral, not USDC.e.
+TRUMP_2024_CONDITION_ID = "0xdd22472e552920b8438158ea7238bfadfa4f736aa4cee91a6b86c39ead110917"
+TRUMP_2024_CLOB_TOKEN_IDS = [
+    21742633143463906290569050155826241533067272736897614950488156847949938836455,
+    48331043336612883890938759509493159234755048973500640148014422747788308965732,
+]
+NEG_RISK_WRAPPED_COLLATERAL = "0x3A3BD7bb9528E159577F7C2e685CC81A765002E2"
+
+
+class CtfIdsTest(unittest.TestCase):
+    def test_collection_id_encodes_point_on_alt_bn128(self):
+        collection_id = int(get_collection_id(ZERO_BYTES32, CONDITION_A, 1), 16)
+        x = collection_id & ((1 << 254) - 1)
+        y_squared = (x ** 3 + ALT_BN128_B) % ALT_BN128_P
+        self.assertEqual(
+            pow(y_squared, (ALT_BN128_P + 1) // 4, ALT_BN128_P) ** 2 % ALT_BN128_P,
+            y_squared,
+        )
+        self.assertNotEqual(
+            get_collection_id(ZERO_BYTES32, CONDITION_A, 1),
+            get_collection_id(ZERO_BYTES32, CONDITION_A, 2),
+        )
+
+    def test_nested_collection_ids_are_order_independent(self):
+        a_then_b = get_collection_id(
+            get_collection_id(ZERO_BYTES32, CONDITION_A, 1), CONDITION_B, 2
+        )
+        b_then_a = get_collection_id(
+            get_collection_id(ZERO_BYTES32, CONDITION_B, 2), CONDITION_A, 1
+        )
+        self.assertEqual(a_then_b, b_then_a)
+
+    def test_position_id_hashes_collateral_and_collection(self):
+        collection_id = get_collection_id(ZERO_BYTES32, CONDITION_A, 2)
+        expected = int.from_bytes(
+            keccak256(
+                bytes.fromhex(CTF_COLLATERAL_TOKEN[2:])
+                + bytes.fromhex(collection_id[2:])
+            ),
+            "big",
+        )
+        self.assertEqual(get_position_id(CTF_COLLATERAL_TOKEN, collection_id), expected)
+        self.assertEqual(
+            get_outcome_position_id(
+                CTF_COLLATERAL_TOKEN.lower(), ZERO_BYTES32, CONDITION_A.upper().replace("0X", "0x"), 2
+            ),
+            expected,
+        )
+
+    def test_matches_clob_token_ids_of_a_real_market(self):
+        self.assertEqual(
+            [
+                get_outcome_position_id(
+                    NEG_RISK_WRAPPED_COLLATERAL, ZERO_BYTES32, TRUMP_2024_CONDITION_ID, index_set
+                )
+                for index_set in (1, 2)
+            ],
+            TRUMP_2024_CLOB_TOKEN_IDS,
+        )
+        self.assertEqual(
+            get_position_id(
+                NEG_RISK_WRAPPED_COLLATERAL,
+                get_collection_id(ZERO_BYTES32, TRUMP_2024_CONDITION_ID, 1),
+            ),
+            TRUMP_2024_CLOB_TOKEN_IDS[0],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
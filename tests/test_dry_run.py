@@ -0,0 +1,84 @@
+import unittest
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from poly_web3.schema import DryRunResult
+from poly_web3.web3_service.base import BaseWeb3Service
+from poly_web3.web3_service.gas_batcher import GasModel
+
+
+class DryRunWeb3Service(BaseWeb3Service):
+    def __init__(self, positions: list[dict]):
+        self.batch_gas_limit = None
+        self.gas_model = GasModel()
+        self.estimates: list[list[str]] = []
+        self.api_client = SimpleNamespace(
+            fetch_redeemable_positions=lambda user_address: positions,
+            batch_estimate_gas=self._batch_estimate_gas,
+        )
+
+    def _resolve_user_address(self):
+        return "0xwallet"
+
+    def _build_redeem_tx(self, to: str, data: str):
+        return {"to": to, "data": data}
+
+    def build_ctf_redeem_tx_data(self, condition_id, *args, **kwargs) -> str:
+        return condition_id
+
+    def build_ctf_merge_tx_data(self, condition_id, *args, **kwargs) -> str:
+        return condition_id
+
+    def _batch_estimate_gas(self, txs):
+        self.estimates.append([tx["data"] for tx in txs])
+        return [
+            Exception("execution reverted") if tx["data"] == "0xbad" else "100"
+            for tx in txs
+        ]
+
+    def _submit_transactions(self, txs, metadata: str):
+        raise AssertionError("dry run must not submit")
+
+
+class DryRunTest(unittest.TestCase):
+    def test_redeem_all_dry_run_reports_batches_and_conditions(self):
+        service = DryRunWeb3Service(
+            [{"conditionId": condition_id} for condition_id in ("0x1", "0xbad", "0x2")]
+        )
+
+        result = service.redeem_all(batch_size=2, dry_run=True)
+
+        self.assertIsInstance(result, DryRunResult)
+        self.assertEqual(
+            [(item.condition_ids, item.success, item.gas) for item in result.batch_list],
+            [(["0x1", "0xbad"], False, None), (["0x2"], True, 100)],
+        )
+        self.assertEqual(
+            {item.condition_id: (item.success, item.gas) for item in result.condition_list},
+            {"0x1": (False, 100), "0xbad": (False, None), "0x2": (True, 100)},
+        )
+        self.assertEqual(result.error_condition_ids, ["0x1", "0xbad"])
+        self.assertEqual(result.total_gas, 100)
+
+    def test_merge_batch_dry_run_simulates_every_condition(self):
+        service = DryRunWeb3Service([])
+
+        result = service.merge_batch(
+            [
+                {"condition_id": "0x1", "amount": 1, "negative_risk": False},
+                {"condition_id": "0x2", "amount": 2, "negative_risk": False},
+            ],
+            dry_run=True,
+        )
+
+        self.assertEqual(result.batch_list[0].gas, 200)
+        self.assertTrue(all(item.success for item in result.condition_list))
+        # The batch and both conditions go out in one JSON-RPC batch request.
+        self.assertEqual(service.estimates, [["0x1", "0x2", "0x1", "0x2"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
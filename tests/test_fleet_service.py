@@ -0,0 +1,115 @@
+import threading
+import unittest
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from poly_web3.schema import RedeemErrorItem, RedeemResult
+from poly_web3.web3_service.fleet_service import FleetWeb3Service
+
+
+def _safe_clob_client(funder: str):
+    return SimpleNamespace(builder=SimpleNamespace(signature_type=2, funder=funder))
+
+
+class FleetWeb3ServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.relayer_a = SimpleNamespace(name="a")
+        self.relayer_b = SimpleNamespace(name="b")
+        self.fleet = FleetWeb3Service(
+            [
+                (_safe_clob_client("0xw1"), self.relayer_a),
+                (_safe_clob_client("0xw2"), self.relayer_a),
+                (_safe_clob_client("0xw3"), self.relayer_b),
+            ],
+            max_workers=1,
+        )
+
+    def test_services_share_http_client_web3_and_caches(self):
+        services = list(self.fleet.services.values())
+
+        self.assertEqual(list(self.fleet.services), ["0xw1", "0xw2", "0xw3"])
+        self.assertTrue(all(service.api_client is self.fleet.api_client for service in services))
+        self.assertTrue(all(service.w3 is self.fleet.w3 for service in services))
+        self.assertTrue(
+            all(service.resolution_cache is self.fleet.resolution_cache for service in services)
+        )
+
+    def test_redeem_all_keys_results_by_wallet(self):
+        for wallet, service in self.fleet.services.items():
+            service.redeem_all = (
+                lambda wallet=wallet, **kwargs: RedeemResult(success_list=[{"wallet": wallet}])
+            )
+
+        result = self.fleet.redeem_all(batch_size=5)
+
+        self.assertEqual(list(result.results), ["0xw1", "0xw2", "0xw3"])
+        self.assertEqual(result.results["0xw2"].success_list, [{"wallet": "0xw2"}])
+        self.assertEqual(result.error_wallets, {})
+
+    def test_quota_exceeded_skips_remaining_wallets_on_same_relayer(self):
+        calls = []
+
+        def exhausted(**kwargs):
+            calls.append("0xw1")
+            return RedeemResult(
+                error_list=[
+                    RedeemErrorItem(condition_id="0xc", error="relayer quota exceeded")
+                ]
+            )
+
+        def unexpected(**kwargs):
+            calls.append("0xw2")
+            return RedeemResult()
+
+        def other_relayer(**kwargs):
+            calls.append("0xw3")
+            return RedeemResult(success_list=[{"ok": True}])
+
+        self.fleet.services["0xw1"].redeem_all = exhausted
+        self.fleet.services["0xw2"].redeem_all = unexpected
+        self.fleet.services["0xw3"].redeem_all = other_relayer
+
+        result = self.fleet.redeem_all()
+
+        self.assertEqual(calls, ["0xw1", "0xw3"])
+        self.assertEqual(
+            result.error_wallets, {"0xw2": "skipped: relayer submit quota exceeded"}
+        )
+        self.assertEqual(list(result.results), ["0xw1", "0xw3"])
+
+    def test_busy_relayer_does_not_hold_workers_from_other_relayers(self):
+        fleet = FleetWeb3Service(
+            [
+                (_safe_clob_client("0xa1"), self.relayer_a),
+                (_safe_clob_client("0xa2"), self.relayer_a),
+                (_safe_clob_client("0xa3"), self.relayer_a),
+                (_safe_clob_client("0xb1"), self.relayer_b),
+            ],
+            max_workers=2,
+            max_in_flight_per_relayer=1,
+        )
+        b_ran = threading.Event()
+        waited_for_b: list[bool] = []
+
+        def on_relayer_a(**kwargs):
+            waited_for_b.append(b_ran.wait(timeout=5))
+            return RedeemResult()
+
+        def on_relayer_b(**kwargs):
+            b_ran.set()
+            return RedeemResult()
+
+        for wallet, service in fleet.services.items():
+            service.redeem_all = on_relayer_b if wallet == "0xb1" else on_relayer_a
+
+        result = fleet.redeem_all()
+
+        self.assertEqual(waited_for_b, [True, True, True])
+        self.assertEqual(list(result.results), ["0xa1", "0xa2", "0xa3", "0xb1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
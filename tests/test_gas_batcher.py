@@ -0,0 +1,189 @@
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from poly_web3.web3_service.base import BaseWeb3Service
+from poly_web3.web3_service.gas_batcher import AdaptiveBatcher, GasModel, GasUnit
+
+
+class GasBatchedWeb3Service(BaseWeb3Service):
+    def __init__(self, batch_gas_limit: int):
+        self.batch_gas_limit = batch_gas_limit
+        self.gas_model = GasModel(tx_gas={"redeem": 100, "neg_risk_redeem": 300})
+        self.estimates: list[list[str]] = []
+        self.submitted: list[list[str]] = []
+
+    def _build_redeem_tx(self, to: str, data: str):
+        return {"to": to, "data": data}
+
+    def build_ctf_redeem_tx_data(self, condition_id, *args, **kwargs) -> str:
+        return condition_id
+
+    def build_neg_risk_redeem_tx_data(self, condition_id, *args, **kwargs) -> str:
+        return condition_id
+
+    def estimate_batch_gas(self, txs) -> int:
+        data = [tx["data"] for tx in txs]
+        self.estimates.append(data)
+        if "0xbad" in data:
+            raise Exception("execution reverted")
+        return 100 * len(data)
+
+    def _submit_transactions(self, txs, metadata: str):
+        self.submitted.append([tx["data"] for tx in txs])
+        return {"metadata": metadata}
+
+
+class GasModelTest(unittest.TestCase):
+    def test_observation_moves_estimates_towards_observed_gas(self):
+        model = GasModel(tx_gas={"redeem": 100, "merge": 300}, smoothing=0.5)
+
+        model.observe(["redeem", "merge"], 800)
+
+        # Predicted 400, observed 800: each type moves halfway to double.
+        self.assertEqual(model.predict(["redeem"]), 150)
+        self.assertEqual(model.predict(["merge"]), 450)
+
+
+class AdaptiveBatcherTest(unittest.TestCase):
+    def test_pack_fills_batches_up_to_gas_limit_with_reserve(self):
+        batcher = AdaptiveBatcher(GasModel(tx_gas={"redeem": 100, "neg_risk_redeem": 300}), 500)
+        units = [
+            GasUnit("0x1", ["a"], ["redeem"]),
+            GasUnit("0x2", ["b"], ["neg_risk_redeem"]),
+            GasUnit("0x3", ["c"], ["redeem"]),
+            GasUnit("0x4", ["d"], ["redeem"]),
+        ]
+
+        batches = batcher.pack(units, reserve_gas=100)
+
+        self.assertEqual(
+            [[unit.key for unit in batch] for batch in batches],
+            [["0x1", "0x2"], ["0x3", "0x4"]],
+        )
+
+    def test_isolate_bisects_to_failing_unit(self):
+        calls = []
+
+        def estimate(txs):
+            calls.append(list(txs))
+            if "bad" in txs:
+                raise Exception("execution reverted")
+            return 100 * len(txs)
+
+        batcher = AdaptiveBatcher(GasModel(), 10_000_000, estimate_batch=estimate)
+        units = [GasUnit(key, [key], ["redeem"]) for key in ("a", "b", "bad", "c")]
+
+        ok_units, failed = batcher.isolate(units)
+
+        self.assertEqual([unit.key for unit in ok_units], ["a", "b", "c"])
+        self.assertEqual([unit.key for unit, _ in failed], ["bad"])
+        # 5 bisection simulations plus one for the combined ok set.
+        self.assertEqual(len(calls), 6)
+        self.assertEqual(calls[-1], ["a", "b", "c"])
+
+    def test_isolate_drops_units_that_only_revert_together(self):
+        def estimate(txs):
+            if "wrap1" in txs and "wrap2" in txs:
+                raise Exception("insufficient balance")
+            if "bad" in txs:
+                raise Exception("execution reverted")
+            return 100 * len(txs)
+
+        batcher = AdaptiveBatcher(GasModel(), 10_000_000, estimate_batch=estimate)
+        units = [GasUnit(key, [key], ["wrap"]) for key in ("wrap1", "bad", "wrap2", "a")]
+
+        ok_units, failed = batcher.isolate(units)
+
+        self.assertEqual([unit.key for unit in ok_units], ["wrap1", "a"])
+        self.assertEqual(
+            [(unit.key, str(exc)) for unit, exc in failed],
+            [("bad", "execution reverted"), ("wrap2", "insufficient balance")],
+        )
+
+
+class GasBatchedRedeemTest(unittest.TestCase):
+    def test_redeem_packs_by_gas_and_drops_reverting_condition(self):
+        service = GasBatchedWeb3Service(batch_gas_limit=400)
+        positions = [
+            {"conditionId": condition_id, "negativeRisk": False}
+            for condition_id in ("0x1", "0xbad", "0x2", "0x3", "0x4")
+        ]
+
+        result = service._redeem_from_positions(
+            positions, batch_size=1, wrap_redeemed_collateral=False
+        )
+
+        self.assertEqual(service.submitted, [["0x1", "0x2", "0x3"], ["0x4"]])
+        self.assertEqual(result.error_condition_ids, ["0xbad"])
+        self.assertEqual(len(result.success_list), 2)
+
+
+class FailedBatchIsolationTest(unittest.TestCase):
+    def make_service(self, isolate_failed_batches: bool) -> GasBatchedWeb3Service:
+        service = GasBatchedWeb3Service(batch_gas_limit=None)
+        service.isolate_failed_batches = isolate_failed_batches
+        submit = service._submit_transactions
+
+        def submit_rejecting_bad(txs, metadata):
+            if any(tx["data"] == "0xbad" for tx in txs):
+                raise Exception("relayer transaction failed")
+            return submit(txs, metadata)
+
+        service._submit_transactions = submit_rejecting_bad
+        return service
+
+    def test_failed_redeem_batch_is_bisected_and_rest_resubmitted_once(self):
+        service = self.make_service(isolate_failed_batches=True)
+        positions = [
+            {"conditionId": condition_id} for condition_id in ("0x1", "0xbad", "0x2", "0x3")
+        ]
+
+        result = service._redeem_from_positions(
+            positions, batch_size=4, wrap_redeemed_collateral=False
+        )
+
+        self.assertEqual(service.submitted, [["0x1", "0x2", "0x3"]])
+        self.assertEqual(result.error_condition_ids, ["0xbad"])
+        self.assertEqual(result.error_list[0].error, "execution reverted")
+        self.assertEqual(len(result.success_list), 1)
+
+    def test_retried_neg_risk_redeems_keep_their_tx_type(self):
+        service = self.make_service(isolate_failed_batches=True)
+        positions = [
+            {"conditionId": condition_id, "negativeRisk": True, "outcomeIndex": 0, "size": 1}
+            for condition_id in ("0x1", "0xbad", "0x2")
+        ]
+
+        service._redeem_from_positions(
+            positions, batch_size=3, wrap_redeemed_collateral=False
+        )
+
+        # Isolation observed 200 gas for two txs: only neg_risk_redeem learns from it.
+        self.assertEqual(service.submitted, [["0x1", "0x2"]])
+        self.assertLess(service.gas_model.predict(["neg_risk_redeem"]), 300)
+        self.assertEqual(service.gas_model.predict(["redeem"]), 100)
+
+    def test_failed_binary_batch_isolation_is_opt_in(self):
+        for isolate, expected_errors in ((False, ["0x1", "0xbad"]), (True, ["0xbad"])):
+            service = self.make_service(isolate_failed_batches=isolate)
+            service.build_ctf_merge_tx_data = lambda condition_id, **kwargs: condition_id
+
+            result = service._submit_binary_market_batch(
+                "merge",
+                [
+                    {"condition_id": "0x1", "amount": 1, "negative_risk": False},
+                    {"condition_id": "0xbad", "amount": 1, "negative_risk": False},
+                ],
+            )
+
+            self.assertEqual(
+                [cid for item in result.error_list for cid in item.condition_ids],
+                expected_errors,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
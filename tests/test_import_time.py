@@ -0,0 +1,71 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from eth_utils import to_checksum_address
+
+from poly_web3 import const
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = (
+    "web3",
+    "eth_account",
+    "eth_utils",
+    "pydantic",
+    "requests",
+    "py_builder_relayer_client",
+)
+# Lazy `import poly_web3` takes a few milliseconds; the eager one took >1s.
+IMPORT_TIME_BUDGET_US = 200_000
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+class ImportTimeTest(unittest.TestCase):
+    def test_import_does_not_load_heavy_dependencies(self):
+        result = _run(
+            "import sys, poly_web3\n"
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_import_time_stays_within_budget(self):
+        result = _run("import poly_web3", "-X", "importtime")
+
+        cumulative = min(
+            int(line.split("|")[1])
+            for line in result.stderr.splitlines()
+            if line.rstrip().endswith("| poly_web3")
+        )
+        self.assertLess(cumulative, IMPORT_TIME_BUDGET_US)
+
+    def test_lazy_attributes_resolve(self):
+        result = _run(
+            "import poly_web3\n"
+            "from poly_web3.web3_service import ProxyWeb3Service\n"
+            "print(poly_web3.ProxyWeb3Service is ProxyWeb3Service)"
+        )
+
+        self.assertEqual(result.stdout.strip(), "True")
+
+    def test_address_literals_are_checksummed(self):
+        for name in dir(const):
+            value = getattr(const, name)
+            if isinstance(value, str) and len(value) == 42 and value.startswith("0x"):
+                self.assertEqual(value, to_checksum_address(value), name)
+
+
+if __name__ == "__main__":
+    unittest.main()
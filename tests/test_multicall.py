@@ -0,0 +1,139 @@
+import unittest
+from pathlib import Path
+import sys
+import tempfile
+
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector
+from web3 import Web3
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from poly_web3.const import CTF_COLLATERAL_TOKEN, ZERO_BYTES32
+from poly_web3.signature.ctf_ids import get_outcome_position_id
+from poly_web3.web3_service.base import BaseWeb3Service
+from poly_web3.web3_service.resolution_cache import ResolutionCache
+
+RESOLVED = "0x" + "11" * 32
+UNRESOLVED = "0x" + "22" * 32
+WINNING_POSITION_ID = get_outcome_position_id(
+    CTF_COLLATERAL_TOKEN, ZERO_BYTES32, RESOLVED, 2
+)
+
+
+def _selector(signature: str) -> bytes:
+    return function_signature_to_4byte_selector(signature)
+
+
+class FakeMulticall:
+    """Answers CTF view calls by selector and records each aggregate3 round trip."""
+
+    handlers = {
+        _selector("payoutDenominator(bytes32)"): (
+            ["bytes32"],
+            lambda cid: ("uint256", 1 if cid == bytes.fromhex(RESOLVED[2:]) else 0),
+        ),
+        _selector("getOutcomeSlotCount(bytes32)"): (
+            ["bytes32"],
+            lambda cid: ("uint256", 2),
+        ),
+        _selector("payoutNumerators(bytes32,uint256)"): (
+            ["bytes32", "uint256"],
+            lambda cid, index: ("uint256", 1 if index == 1 else 0),
+        ),
+        _selector("balanceOf(address,uint256)"): (
+            ["address", "uint256"],
+            lambda owner, position_id: (
+                "uint256",
+                2_500_000 if position_id == WINNING_POSITION_ID else 0,
+            ),
+        ),
+    }
+
+    def __init__(self):
+        self.round_trips = 0
+
+    def aggregate3(self, calls, allow_failure=True):
+        self.round_trips += 1
+        results = []
+        for _, data in calls:
+            raw = bytes.fromhex(data[2:])
+            input_types, handler = self.handlers[raw[:4]]
+            output_type, value = handler(*decode(input_types, raw[4:]))
+            results.append((True, encode([output_type], [value])))
+        return results
+
+
+class DummyMulticallService(BaseWeb3Service):
+    def __init__(self):
+        self.w3 = Web3()
+        self.multicall = FakeMulticall()
+        self.resolution_cache = ResolutionCache()
+
+    def _resolve_user_address(self):
+        return "0x" + "33" * 20
+
+
+class ConditionPayoutStateTest(unittest.TestCase):
+    def test_reads_payout_states_for_batch_in_aggregated_round_trips(self):
+        service = DummyMulticallService()
+
+        states = service.get_condition_payout_states([RESOLVED, UNRESOLVED])
+
+        self.assertEqual(service.multicall.round_trips, 2)
+        self.assertTrue(states[RESOLVED].resolved)
+        self.assertEqual(states[RESOLVED].payout_numerators, [0, 1])
+        self.assertEqual(states[RESOLVED].winning_indexes, [1])
+        self.assertEqual(states[RESOLVED].redeemable_index_and_balance, [(1, 2.5)])
+        self.assertEqual(states[RESOLVED].payout_amount, 2_500_000)
+        self.assertFalse(states[UNRESOLVED].resolved)
+        self.assertEqual(states[UNRESOLVED].payout_amount, 0)
+
+    def test_single_condition_helpers_use_batched_reads(self):
+        service = DummyMulticallService()
+
+        self.assertEqual(service.get_redeemable_index_and_balance(RESOLVED), [(1, 2.5)])
+        self.assertEqual(service.get_redeemable_payout_amount(RESOLVED), 2_500_000)
+        self.assertEqual(
+            service.get_redeemable_payout_amounts([RESOLVED, UNRESOLVED]),
+            {RESOLVED: 2_500_000, UNRESOLVED: 0},
+        )
+
+    def test_resolved_payout_vectors_are_served_from_cache(self):
+        service = DummyMulticallService()
+        service.get_condition_payout_states([RESOLVED, UNRESOLVED])
+
+        self.assertEqual(service.get_winning_indexes(RESOLVED), [1])
+        self.assertFalse(service.is_condition_resolved(UNRESOLVED))
+        self.assertEqual(service.multicall.round_trips, 2)
+
+        states = service.get_condition_payout_states([RESOLVED])
+
+        self.assertEqual(service.multicall.round_trips, 3)
+        self.assertEqual(states[RESOLVED].payout_amount, 2_500_000)
+
+
+class ResolutionCacheTest(unittest.TestCase):
+    def test_unresolved_entries_expire_after_ttl(self):
+        cache = ResolutionCache(unresolved_ttl=0)
+        cache.set(UNRESOLVED, 0, [])
+        self.assertIsNone(cache.get(UNRESOLVED))
+
+        cache = ResolutionCache(unresolved_ttl=60)
+        cache.set(UNRESOLVED, 0, [])
+        self.assertEqual(cache.get(UNRESOLVED), (0, []))
+
+    def test_resolved_entries_persist_to_sqlite(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "resolution.sqlite"
+            cache = ResolutionCache(path=path)
+            cache.set(RESOLVED, 10 ** 30, [0, 10 ** 30])
+            cache.close()
+
+            reloaded = ResolutionCache(path=path)
+            self.assertEqual(reloaded.get(RESOLVED.upper().replace("0X", "0x")), (10 ** 30, [0, 10 ** 30]))
+            reloaded.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
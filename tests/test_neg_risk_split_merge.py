@@ -7,7 +7,7 @@ from types import SimpleNamespace
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from poly_web3.web3_service.base import BaseWeb3Service
-from poly_web3.schema import MergePlanItem
+from poly_web3.schema import ConditionPayoutState, MergePlanItem
 from poly_web3.clob_compat import get_clob_signature_type, get_clob_funder
 
 
@@ -55,6 +55,9 @@ class DummyWeb3Service(BaseWeb3Service):
     def get_redeemable_payout_amount(self, *args, **kwargs) -> int:
         return 0
 
+    def get_redeemable_payout_amounts(self, condition_ids, *args, **kwargs) -> dict:
+        return {condition_id: 0 for condition_id in condition_ids}
+
     def _raise_if_insufficient_split_collateral(self, *args, **kwargs) -> None:
         return None
 
@@ -130,6 +133,34 @@ class NegRiskSplitMergeGuardTest(unittest.TestCase):
         self.assertEqual(result.success_list[1].result["metadata"], "split")
         self.assertEqual(len(result.success_list[1].result["txs"]), 2)
 
+    def test_split_batch_prefetches_negative_risk_flags_in_one_lookup(self):
+        lookups = []
+
+        def get_markets_by_condition_ids(condition_ids):
+            lookups.append(list(condition_ids))
+            return {
+                "0xcond1": {"negRisk": False},
+                "0xcond2": {"negRisk": True},
+            }
+
+        self.service.get_markets_by_condition_ids = get_markets_by_condition_ids
+        with patch.object(
+            self.service,
+            "get_market_by_condition_id",
+            side_effect=AssertionError("per-condition lookup should not be called"),
+        ):
+            result = self.service.split_batch(
+                operations=[
+                    {"condition_id": "0xcond1", "amount": 1},
+                    {"condition_id": "0xcond2", "amount": 2},
+                    {"condition_id": "0xcond3", "amount": 3, "negative_risk": False},
+                ]
+            )
+
+        self.assertEqual(lookups, [["0xcond1", "0xcond2"]])
+        self.assertEqual(result.success_list[0].condition_ids, ["0xcond1", "0xcond3"])
+        self.assertEqual(result.success_list[1].condition_ids, ["0xcond2"])
+
     def test_merge_batch_supports_per_item_amounts(self):
         with patch.object(
             self.service,
@@ -237,16 +268,24 @@ class NegRiskSplitMergeGuardTest(unittest.TestCase):
 
     def test_redeem_condition_id_falls_back_to_chain_when_positions_api_is_empty(self):
         self.service.api_client = SimpleNamespace(
-            fetch_positions_by_condition_ids=lambda user_address, condition_ids: []
+            fetch_positions_by_condition_ids=lambda user_address, condition_ids: [],
+            get_markets_by_condition_ids=lambda condition_ids: {},
         )
         self.service._resolve_user_address = lambda: "0xuser"
         self.service.is_negative_risk_condition = lambda condition_id: False
-        self.service.is_condition_resolved = lambda condition_id: True
-        self.service.get_redeemable_index_and_balance = (
-            lambda condition_id, collateral_token: [(0, 10)]
+        self.service.get_condition_payout_states = (
+            lambda condition_ids, collateral_token: {
+                condition_id: ConditionPayoutState(
+                    condition_id=condition_id,
+                    payout_denominator=1,
+                    payout_numerators=[1, 0],
+                    balances={0: 10_000_000},
+                )
+                for condition_id in condition_ids
+            }
         )
 
-        result = self.service.redeem("0xcond1")
+        result = self.service.redeem("0xcond1", wrap_redeemed_collateral=False)
 
         self.assertEqual(result.error_list, [])
         self.assertEqual(len(result.success_list), 1)
@@ -259,16 +298,21 @@ class NegRiskSplitMergeGuardTest(unittest.TestCase):
 
     def test_redeem_chain_fallback_can_wrap_redeemed_collateral_to_pusd(self):
         self.service.api_client = SimpleNamespace(
-            fetch_positions_by_condition_ids=lambda user_address, condition_ids: []
+            fetch_positions_by_condition_ids=lambda user_address, condition_ids: [],
+            get_markets_by_condition_ids=lambda condition_ids: {},
         )
         self.service._resolve_user_address = lambda: "0xuser"
         self.service.is_negative_risk_condition = lambda condition_id: False
-        self.service.is_condition_resolved = lambda condition_id: True
-        self.service.get_redeemable_index_and_balance = (
-            lambda condition_id, collateral_token: [(0, 10)]
-        )
-        self.service.get_redeemable_payout_amount = (
-            lambda condition_id, collateral_token: 10_000_000
+        self.service.get_condition_payout_states = (
+            lambda condition_ids, collateral_token: {
+                condition_id: ConditionPayoutState(
+                    condition_id=condition_id,
+                    payout_denominator=1,
+                    payout_numerators=[1, 0],
+                    balances={0: 10_000_000},
+                )
+                for condition_id in condition_ids
+            }
         )
 
         result = self.service.redeem("0xcond1")
@@ -286,11 +330,17 @@ class NegRiskSplitMergeGuardTest(unittest.TestCase):
 
     def test_redeem_condition_id_reports_unresolved_chain_fallback(self):
         self.service.api_client = SimpleNamespace(
-            fetch_positions_by_condition_ids=lambda user_address, condition_ids: []
+            fetch_positions_by_condition_ids=lambda user_address, condition_ids: [],
+            get_markets_by_condition_ids=lambda condition_ids: {},
         )
         self.service._resolve_user_address = lambda: "0xuser"
         self.service.is_negative_risk_condition = lambda condition_id: False
-        self.service.is_condition_resolved = lambda condition_id: False
+        self.service.get_condition_payout_states = (
+            lambda condition_ids, collateral_token: {
+                condition_id: ConditionPayoutState(condition_id=condition_id)
+                for condition_id in condition_ids
+            }
+        )
 
         result = self.service.redeem("0xcond1")
 
@@ -441,6 +491,32 @@ class NegRiskSplitMergeGuardTest(unittest.TestCase):
         self.assertEqual(result[0].mergeable, 8)
         self.assertIsNone(result[0].reason)
 
+    def test_iter_merge_plan_aggregates_across_streamed_pages(self):
+        pages = [
+            [
+                {"conditionId": "0xcond1", "slug": "market-one", "outcomeIndex": 0, "size": 10},
+                {"conditionId": "0xcond2", "slug": "market-two", "outcomeIndex": 0, "size": 7},
+            ],
+            [
+                {"conditionId": "0xcond1", "slug": "market-one", "outcomeIndex": 1, "size": 6},
+            ],
+        ]
+        self.service.api_client = SimpleNamespace(
+            iter_position_pages=lambda user_address, **filters: iter(pages)
+        )
+        self.service._resolve_user_address = lambda: "0xuser"
+
+        snapshots = list(self.service.iter_merge_plan(min_usdc=5))
+
+        self.assertEqual(len(snapshots), 2)
+        self.assertEqual(
+            [(item.condition_id, item.reason) for item in snapshots[0]],
+            [("0xcond1", "missing_opposite_side"), ("0xcond2", "missing_opposite_side")],
+        )
+        self.assertEqual(snapshots[1][0].condition_id, "0xcond1")
+        self.assertEqual(snapshots[1][0].mergeable, 6)
+        self.assertIsNone(snapshots[1][0].reason)
+
     def test_merge_all_executes_up_to_max_markets(self):
         positions = [
             {
@@ -0,0 +1,187 @@
+import threading
+import unittest
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from py_builder_relayer_client.config import ContractConfig, get_contract_config
+from py_builder_relayer_client.signer import Signer
+
+from poly_web3.web3_service.deposit_wallet_service import DepositWalletWeb3Service
+from poly_web3.web3_service.nonce_manager import NonceManager
+from poly_web3.web3_service.safe_service import SafeWeb3Service
+
+
+class NonceManagerTest(unittest.TestCase):
+    def test_fetches_once_and_increments_locally_across_threads(self):
+        fetches = []
+        manager = NonceManager(lambda: fetches.append(1) or "10")
+        nonces = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(25):
+                nonce = manager.acquire()
+                with lock:
+                    nonces.append(nonce)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(fetches), 1)
+        self.assertEqual(sorted(nonces), list(range(10, 110)))
+
+    def test_failure_refetches_without_reusing_in_flight_nonces(self):
+        relayer_nonces = iter([5, 5, 5])
+        manager = NonceManager(lambda: next(relayer_nonces))
+
+        first = manager.acquire()
+        second = manager.acquire()
+        manager.fail(second)
+        # The relayer still reports 5 while nonce 5 is pending.
+        self.assertEqual(manager.acquire(), 6)
+        manager.confirm(first)
+        manager.fail(6)
+        self.assertEqual(manager.acquire(), 5)
+
+    def test_is_nonce_error_matches_relayer_messages(self):
+        self.assertTrue(NonceManager.is_nonce_error(Exception("invalid nonce: expected 4")))
+        self.assertFalse(NonceManager.is_nonce_error(Exception("quota exceeded")))
+
+
+class FakeDepositRelayer:
+    def __init__(self):
+        self.signer = SimpleNamespace(address=lambda: "0xsigner")
+        self.get_nonce_calls = 0
+        self.relayer_nonce = 3
+        self.submitted_nonces = []
+        self.reject_next_with_nonce_error = False
+
+    def get_nonce(self, address, tx_type):
+        self.get_nonce_calls += 1
+        return {"nonce": str(self.relayer_nonce)}
+
+    def execute_deposit_wallet_batch(self, calls, wallet_address, nonce, deadline):
+        self.submitted_nonces.append(nonce)
+        if self.reject_next_with_nonce_error:
+            self.reject_next_with_nonce_error = False
+            self.relayer_nonce = 9
+            raise Exception("invalid nonce")
+        return SimpleNamespace(wait=lambda: {"nonce": nonce})
+
+
+class DepositWalletNonceTest(unittest.TestCase):
+    def setUp(self):
+        self.relayer = FakeDepositRelayer()
+        self.service = DepositWalletWeb3Service.__new__(DepositWalletWeb3Service)
+        self.service.clob_client = object()
+        self.service.relayer_client = self.relayer
+        self.service.nonce_manager = NonceManager(self.service._fetch_relayer_nonce)
+        self.service._resolve_user_address = lambda: "0xwallet"
+        self.tx = {"to": "0xctf", "data": "0xredeem", "value": 0}
+
+    def test_submits_reuse_local_nonce_counter(self):
+        self.service._submit_transactions([self.tx], "redeem")
+        self.service._submit_transactions([self.tx], "merge")
+
+        self.assertEqual(self.relayer.get_nonce_calls, 1)
+        self.assertEqual(self.relayer.submitted_nonces, ["3", "4"])
+
+    def test_resyncs_and_retries_once_on_nonce_mismatch(self):
+        self.relayer.reject_next_with_nonce_error = True
+
+        result = self.service._submit_transactions([self.tx], "redeem")
+
+        self.assertEqual(result, {"nonce": "9"})
+        self.assertEqual(self.relayer.get_nonce_calls, 2)
+        self.assertEqual(self.relayer.submitted_nonces, ["3", "9"])
+
+
+class FakeSafeRelayer:
+    def __init__(self):
+        self.chain_id = 137
+        self.contract_config = get_contract_config(137)
+        self.signer = Signer("0x" + "4c" * 32, 137)
+        self.get_nonce_calls = 0
+        self.get_deployed_calls = 0
+        self.relayer_nonce = 3
+        self.submitted_nonces = []
+        self.reject_next_with_nonce_error = False
+
+    def assert_signer_needed(self):
+        pass
+
+    def assert_builder_creds_needed(self):
+        pass
+
+    def get_expected_safe(self):
+        return "0xsafe"
+
+    def get_deployed(self, address):
+        self.get_deployed_calls += 1
+        return True
+
+    def get_nonce(self, address, tx_type):
+        self.get_nonce_calls += 1
+        return {"nonce": str(self.relayer_nonce)}
+
+    def _post_request(self, method, path, body):
+        self.submitted_nonces.append(body["nonce"])
+        if self.reject_next_with_nonce_error:
+            self.reject_next_with_nonce_error = False
+            self.relayer_nonce = 9
+            raise Exception("invalid nonce")
+        return {"transactionID": f"txn-{body['nonce']}"}
+
+    def poll_until_state(self, transaction_id, **kwargs):
+        return {"transactionID": transaction_id, "state": "STATE_MINED"}
+
+
+class SafeNonceTest(unittest.TestCase):
+    def setUp(self):
+        self.relayer = FakeSafeRelayer()
+        self.service = SafeWeb3Service.__new__(SafeWeb3Service)
+        self.service.relayer_client = self.relayer
+        self.service.status_tracker = None
+        self.service.nonce_manager = NonceManager(self.service._fetch_relayer_nonce)
+        self.tx = self.service._build_redeem_tx("0x" + "11" * 20, "0xdeadbeef")
+
+    def test_batches_in_flight_get_distinct_nonces(self):
+        first = self.service._send_transactions([self.tx], "redeem")
+        second = self.service._send_transactions([self.tx], "merge")
+
+        self.assertEqual(self.relayer.get_nonce_calls, 1)
+        self.assertEqual(self.relayer.get_deployed_calls, 1)
+        self.assertEqual(self.relayer.submitted_nonces, ["3", "4"])
+        self.assertEqual(self.service._pending_transaction_id(second), "txn-4")
+
+        self.assertEqual(self.service._wait_transactions(first)["transactionID"], "txn-3")
+        self.assertEqual(self.service._wait_transactions(second)["transactionID"], "txn-4")
+        self.assertEqual(self.service.nonce_manager._in_flight, set())
+
+    def test_resyncs_and_retries_once_on_nonce_mismatch(self):
+        self.relayer.reject_next_with_nonce_error = True
+
+        pending = self.service._send_transactions([self.tx], "redeem")
+
+        self.assertEqual(pending[1], 9)
+        self.assertEqual(self.relayer.get_nonce_calls, 2)
+        self.assertEqual(self.relayer.submitted_nonces, ["3", "9"])
+
+    def test_chain_without_safe_contracts_fails_before_signing(self):
+        self.relayer.contract_config = ContractConfig(safe_factory="", safe_multisend="")
+
+        with self.assertRaisesRegex(Exception, "Safe contracts are not configured"):
+            self.service._send_transactions([self.tx], "redeem")
+
+        self.assertEqual(self.relayer.get_nonce_calls, 0)
+        self.assertEqual(self.relayer.submitted_nonces, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import threading
+import time
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from poly_web3.web3_service.base import BaseWeb3Service
+from poly_web3.web3_service.nonce_manager import NonceManager
+from poly_web3.web3_service.pipeline import BuiltBatch, PipelinedExecutor
+
+
+class PipelinedWeb3Service(BaseWeb3Service):
+    """Sends immediately and confirms only when the test releases a batch."""
+
+    def __init__(self, pipeline_depth: int):
+        self.pipeline_depth = pipeline_depth
+        self.nonce_manager = NonceManager(lambda: 7)
+        self.events: list[str] = []
+        self.confirm = {}
+
+    def _build_redeem_tx(self, to: str, data: str):
+        return {"to": to, "data": data}
+
+    def build_ctf_redeem_tx_data(self, condition_id, *args, **kwargs) -> str:
+        self.events.append(f"build:{condition_id}")
+        return condition_id
+
+    def _send_transactions(self, txs, metadata: str):
+        nonce = self.nonce_manager.acquire()
+        condition_id = txs[0]["data"]
+        self.confirm[condition_id] = threading.Event()
+        self.events.append(f"send:{condition_id}:{nonce}")
+        return condition_id, nonce
+
+    def _wait_transactions(self, pending):
+        condition_id, nonce = pending
+        try:
+            if not self.confirm[condition_id].wait(timeout=5):
+                raise Exception("timed out")
+            if condition_id == "0xbad":
+                return None
+            return {"condition_id": condition_id, "nonce": nonce}
+        finally:
+            self.nonce_manager.confirm(nonce)
+
+
+class PipelinedExecutorTest(unittest.TestCase):
+    def test_builds_next_batch_while_previous_batch_confirms(self):
+        service = PipelinedWeb3Service(pipeline_depth=2)
+        positions = [
+            {"conditionId": condition_id, "negativeRisk": False}
+            for condition_id in ("0xa", "0xb", "0xc")
+        ]
+
+        def release_in_order():
+            for condition_id in ("0xa", "0xb", "0xc"):
+                while condition_id not in service.confirm:
+                    time.sleep(0.01)
+                service.confirm[condition_id].set()
+
+        releaser = threading.Thread(target=release_in_order)
+        releaser.start()
+        result = service._redeem_from_positions(
+            positions, batch_size=1, wrap_redeemed_collateral=False
+        )
+        releaser.join()
+
+        self.assertEqual(
+            [item["condition_id"] for item in result.success_list],
+            ["0xa", "0xb", "0xc"],
+        )
+        # Batch 0xb was built and sent before 0xa confirmed, with the next nonce.
+        self.assertEqual(service.events[:4], ["build:0xa", "send:0xa:7", "build:0xb", "send:0xb:8"])
+        self.assertEqual(len({item["nonce"] for item in result.success_list[:2]}), 2)
+
+    def test_failed_batches_are_reported_in_job_order(self):
+        service = PipelinedWeb3Service(pipeline_depth=3)
+        for condition_id in ("0xa", "0xbad"):
+            service.confirm[condition_id] = threading.Event()
+            service.confirm[condition_id].set()
+        service._send_transactions = lambda txs, metadata: (
+            (txs[0]["data"], service.nonce_manager.acquire())
+        )
+
+        result = service._redeem_from_positions(
+            [{"conditionId": "0xa"}, {"conditionId": "0xbad"}],
+            batch_size=1,
+            wrap_redeemed_collateral=False,
+        )
+
+        self.assertEqual(len(result.success_list), 1)
+        self.assertEqual(result.error_condition_ids, ["0xbad"])
+        self.assertEqual(result.error_list[0].error, "redeem execute returned None")
+
+    def test_depth_one_submits_sequentially_without_wait_callback(self):
+        calls = []
+        executor = PipelinedExecutor(
+            lambda txs, metadata: calls.append((txs, metadata)) or len(calls)
+        )
+
+        outcomes = executor.run(
+            [("a", lambda: ["tx1"]), ("empty", lambda: []), ("b", lambda: ["tx2"])],
+            "merge",
+        )
+
+        self.assertEqual(outcomes, [("a", 1, None), ("b", 2, None)])
+        self.assertEqual(calls, [(["tx1"], "merge"), (["tx2"], "merge")])
+
+    def test_built_batch_reports_its_own_context_even_when_empty(self):
+        executor = PipelinedExecutor(lambda txs, metadata: txs)
+
+        outcomes = executor.run(
+            [
+                ("a", lambda: BuiltBatch(["tx1"], ("a", ["dropped"]))),
+                ("b", lambda: BuiltBatch([], ("b", ["all dropped"]))),
+            ],
+            "redeem",
+        )
+
+        self.assertEqual(
+            outcomes,
+            [(("a", ["dropped"]), ["tx1"], None), (("b", ["all dropped"]), None, None)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,270 @@
+import unittest
+from pathlib import Path
+import sys
+import tempfile
+
+from eth_abi import encode
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from poly_web3.const import CTF_COLLATERAL_TOKEN, ZERO_BYTES32
+from poly_web3.signature.ctf_ids import get_outcome_position_id
+from poly_web3.web3_service.api_client import PolymarketAPIClient
+from poly_web3.web3_service.position_index import (
+    CONDITION_RESOLUTION_TOPIC,
+    POSITION_SPLIT_TOPIC,
+    TRANSFER_BATCH_TOPIC,
+    TRANSFER_SINGLE_TOPIC,
+    PositionIndex,
+)
+
+OWNER = "0x" + "ab" * 20
+OTHER = "0x" + "cd" * 20
+SPLIT_CONDITION = "0x" + "11" * 32
+TRADED_CONDITION = "0x" + "22" * 32
+YES, NO = (
+    get_outcome_position_id(CTF_COLLATERAL_TOKEN, ZERO_BYTES32, SPLIT_CONDITION, index_set)
+    for index_set in (1, 2)
+)
+TRADED_TOKEN = 777
+WRAPPED_COLLATERAL = "0x" + "ee" * 20
+
+
+def _topic(address: str) -> str:
+    return "0x" + "0" * 24 + address[2:]
+
+
+class FakeLogsClient:
+    """Serves eth_blockNumber and topic/range-filtered eth_getLogs from a log list."""
+
+    def __init__(self, head: int, logs: list[dict], max_range: int | None = None):
+        self.head = head
+        self.logs = logs
+        self.max_range = max_range
+        self.ranges: list[tuple[int, int]] = []
+
+    def batch_rpc(self, calls):
+        return [self._call(method, params) for method, params in calls]
+
+    def _call(self, method, params):
+        if method == "eth_blockNumber":
+            return hex(self.head)
+        log_filter = params[0]
+        from_block = int(log_filter["fromBlock"], 16)
+        to_block = int(log_filter["toBlock"], 16)
+        if self.max_range and to_block - from_block + 1 > self.max_range:
+            return Exception("block range too large")
+        self.ranges.append((from_block, to_block))
+        return [
+            log
+            for log in self.logs
+            if from_block <= int(log["blockNumber"], 16) <= to_block
+            and self._matches(log["topics"], log_filter["topics"])
+        ]
+
+    @staticmethod
+    def _matches(topics, wanted):
+        for i, expected in enumerate(wanted):
+            if expected is None:
+                continue
+            if i >= len(topics):
+                return False
+            options = expected if isinstance(expected, list) else [expected]
+            if topics[i] not in options:
+                return False
+        return True
+
+
+def _log(block: int, index: int, topics: list[str], types: list[str], values: tuple) -> dict:
+    return {
+        "blockNumber": hex(block),
+        "logIndex": hex(index),
+        "transactionHash": "0x%064x" % block,
+        "topics": topics,
+        "data": "0x" + encode(types, values).hex(),
+    }
+
+
+def _split(block: int, collateral_token: str = CTF_COLLATERAL_TOKEN) -> list[dict]:
+    token_ids = [
+        get_outcome_position_id(collateral_token, ZERO_BYTES32, SPLIT_CONDITION, index_set)
+        for index_set in (1, 2)
+    ]
+    return [
+        _log(
+            block, 0,
+            [POSITION_SPLIT_TOPIC, _topic(OWNER), ZERO_BYTES32, SPLIT_CONDITION],
+            ["address", "uint256[]", "uint256"],
+            (collateral_token, [1, 2], 5_000_000),
+        ),
+        _log(
+            block, 1,
+            [TRANSFER_BATCH_TOPIC, _topic(OTHER), _topic("0x" + "00" * 20), _topic(OWNER)],
+            ["uint256[]", "uint256[]"],
+            (token_ids, [5_000_000, 5_000_000]),
+        ),
+    ]
+
+
+def _transfer(block: int, sender: str, receiver: str, token_id: int, value: int) -> dict:
+    return _log(
+        block, 0,
+        [TRANSFER_SINGLE_TOPIC, _topic(OTHER), _topic(sender), _topic(receiver)],
+        ["uint256", "uint256"],
+        (token_id, value),
+    )
+
+
+def _resolution(block: int, condition_id: str, numerators: list[int]) -> dict:
+    return _log(
+        block, 0,
+        [CONDITION_RESOLUTION_TOPIC, condition_id, _topic(OTHER), ZERO_BYTES32],
+        ["uint256", "uint256[]"],
+        (len(numerators), numerators),
+    )
+
+
+class PositionIndexTest(unittest.TestCase):
+    def _index(self, client, **kwargs):
+        kwargs.setdefault("token_resolver", lambda token_ids: {})
+        return PositionIndex(
+            OWNER, client, start_block=100, block_chunk_size=50, confirmations=0, **kwargs
+        )
+
+    def test_sync_tracks_balances_and_maps_own_splits(self):
+        client = FakeLogsClient(
+            head=300,
+            logs=_split(120) + [_transfer(150, OWNER, OTHER, NO, 2_000_000)],
+        )
+        index = self._index(client)
+
+        self.assertEqual(index.sync(), 300)
+
+        sizes = {pos["outcomeIndex"]: pos["size"] for pos in index.mergeable_positions()}
+        self.assertEqual(sizes, {0: 5.0, 1: 3.0})
+        self.assertEqual(index.redeemable_positions(), [])
+
+    def test_incremental_sync_only_scans_new_blocks_and_sees_resolution(self):
+        client = FakeLogsClient(head=300, logs=_split(120))
+        index = self._index(client)
+        index.sync()
+        client.ranges.clear()
+        client.logs.append(_resolution(320, SPLIT_CONDITION, [0, 1]))
+        client.head = 350
+
+        index.sync()
+
+        self.assertEqual(min(start for start, _ in client.ranges), 301)
+        self.assertEqual(
+            [(pos["conditionId"], pos["outcomeIndex"]) for pos in index.redeemable_positions()],
+            [(SPLIT_CONDITION, 1)],
+        )
+        self.assertEqual(index.mergeable_positions(), [])
+
+    def test_unknown_tokens_are_mapped_and_backfilled(self):
+        client = FakeLogsClient(head=200, logs=[_transfer(130, OTHER, OWNER, TRADED_TOKEN, 7_000_000)])
+        index = self._index(
+            client,
+            token_resolver=lambda token_ids: {
+                TRADED_TOKEN: {
+                    "condition_id": TRADED_CONDITION,
+                    "outcome_index": 0,
+                    "negative_risk": True,
+                    "market_slug": "traded",
+                }
+            },
+            payout_reader=lambda condition_ids: {
+                condition_id: (1, [1, 0]) for condition_id in condition_ids
+            },
+        )
+
+        index.sync()
+
+        self.assertEqual(
+            index.redeemable_positions([TRADED_CONDITION]),
+            [
+                {
+                    "asset": str(TRADED_TOKEN),
+                    "conditionId": TRADED_CONDITION,
+                    "outcomeIndex": 0,
+                    "size": 7.0,
+                    "negativeRisk": True,
+                    "slug": "traded",
+                    "redeemable": True,
+                    "payoutNumerator": 1,
+                }
+            ],
+        )
+
+    def test_wrapped_collateral_split_is_mapped_by_resolver(self):
+        client = FakeLogsClient(head=300, logs=_split(120, WRAPPED_COLLATERAL))
+        resolved: list[int] = []
+
+        def token_resolver(token_ids):
+            resolved.extend(token_ids)
+            return {
+                token_id: {
+                    "condition_id": SPLIT_CONDITION,
+                    "outcome_index": i,
+                    "negative_risk": True,
+                }
+                for i, token_id in enumerate(sorted(token_ids))
+            }
+
+        index = self._index(client, token_resolver=token_resolver)
+        index.sync()
+
+        self.assertEqual(len(resolved), 2)
+        self.assertTrue(all(pos["negativeRisk"] for pos in index.mergeable_positions()))
+
+    def test_gamma_market_without_the_token_skips_only_that_token(self):
+        markets = {
+            str(TRADED_TOKEN): {"conditionId": TRADED_CONDITION, "clobTokenIds": '["0x309", "1"]'},
+            "888": {"conditionId": SPLIT_CONDITION, "clobTokenIds": '["999", "888"]'},
+        }
+        client = FakeLogsClient(
+            head=200,
+            logs=[
+                _transfer(130, OTHER, OWNER, TRADED_TOKEN, 7_000_000),
+                _transfer(140, OTHER, OWNER, 888, 1_000_000),
+            ],
+        )
+        client.get_markets_by_token_ids = lambda token_ids: markets
+        client.parse_clob_token_ids = PolymarketAPIClient.parse_clob_token_ids
+        index = PositionIndex(OWNER, client, start_block=100, confirmations=0)
+
+        self.assertEqual(index.sync(), 200)
+        self.assertEqual(
+            [(pos["conditionId"], pos["outcomeIndex"]) for pos in index.positions()],
+            [(SPLIT_CONDITION, 1)],
+        )
+
+    def test_rejected_range_halves_chunk_size(self):
+        client = FakeLogsClient(head=300, logs=_split(120), max_range=25)
+        index = self._index(client)
+        index.MIN_BLOCK_CHUNK_SIZE = 10
+
+        index.sync()
+
+        self.assertEqual(index.block_chunk_size, 25)
+        self.assertEqual(len(index.mergeable_positions()), 2)
+
+    def test_checkpoint_and_balances_persist(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "positions.sqlite"
+            index = self._index(FakeLogsClient(head=300, logs=_split(120)), path=path)
+            index.sync()
+            index.close()
+
+            client = FakeLogsClient(head=300, logs=[])
+            reopened = self._index(client, path=path)
+            reopened.sync()
+
+            self.assertEqual(reopened.checkpoint, 300)
+            self.assertEqual(client.ranges, [])
+            self.assertEqual(len(reopened.mergeable_positions()), 2)
+            reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
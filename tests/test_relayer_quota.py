@@ -0,0 +1,162 @@
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from poly_web3.schema import WalletType
+from poly_web3.web3_service.base import BaseWeb3Service
+from poly_web3.web3_service.relayer_quota import RelayerQuotaTracker
+from poly_web3.web3_service.submit_scheduler import SubmissionScheduler
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class QuotaWeb3Service(BaseWeb3Service):
+    def __init__(self, quota_tracker: RelayerQuotaTracker):
+        self.quota_tracker = quota_tracker
+        self.wallet_type = WalletType.PROXY
+        self.clob_client = SimpleNamespace(get_address=lambda: "0xSigner")
+        self.api_client = SimpleNamespace(
+            fetch_positions_by_condition_ids=lambda user_address, condition_ids: [
+                {"conditionId": condition_id, "negativeRisk": False}
+                for condition_id in condition_ids
+            ]
+        )
+        self.submit_error: Exception | None = None
+        self.submitted: list[list[str]] = []
+
+    def _submit_transactions(self, txs, metadata: str):
+        if self.submit_error:
+            raise self.submit_error
+        self.submitted.append([tx["data"] for tx in txs])
+        return {"txs": txs}
+
+    def _resolve_user_address(self):
+        return "0xuser"
+
+    def _build_redeem_tx(self, to: str, data: str):
+        return {"to": to, "data": data}
+
+    def build_ctf_redeem_tx_data(self, condition_id, *args, **kwargs) -> str:
+        return f"redeem:{condition_id}"
+
+    def build_ctf_merge_tx_data(self, condition_id, *args, **kwargs) -> str:
+        return f"merge:{condition_id}"
+
+    def build_ctf_split_tx_data(self, condition_id, *args, **kwargs) -> str:
+        return f"split:{condition_id}"
+
+    def prefetch_negative_risk_flags(self, condition_ids):
+        return {condition_id: False for condition_id in condition_ids}
+
+
+class RelayerQuotaTrackerTest(unittest.TestCase):
+    def test_bucket_refills_over_window_and_persists_across_restarts(self):
+        clock = FakeClock()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "quota.sqlite"
+            tracker = RelayerQuotaTracker(path=path, capacity=2, window_sec=100, clock=clock)
+            self.assertTrue(tracker.try_acquire("0xA"))
+            self.assertTrue(tracker.try_acquire("0xa"))
+            self.assertFalse(tracker.try_acquire("0xA"))
+            self.assertEqual(tracker.seconds_until_available("0xA"), 50)
+            tracker.close()
+
+            restarted = RelayerQuotaTracker(path=path, capacity=2, window_sec=100, clock=clock)
+            self.assertEqual(restarted.available("0xA"), 0)
+            clock.now += 50
+            self.assertEqual(restarted.available("0xA"), 1)
+            restarted.close()
+
+    def test_quota_exceeded_blocks_until_reported_reset(self):
+        clock = FakeClock()
+        tracker = RelayerQuotaTracker(capacity=100, clock=clock)
+
+        tracker.record_quota_exceeded("0xA", reset_seconds=30)
+
+        self.assertEqual(tracker.available("0xA"), 0)
+        self.assertEqual(tracker.seconds_until_available("0xA"), 30)
+        clock.now += 30
+        self.assertEqual(tracker.available("0xA"), 100)
+
+    def test_service_guard_fails_fast_and_records_relayer_reset(self):
+        clock = FakeClock()
+        service = QuotaWeb3Service(RelayerQuotaTracker(capacity=5, clock=clock))
+        service.submit_error = Exception(
+            "Polymarket relayer quota exceeded, 原始错误: quota exceeded: resets in 120 seconds"
+        )
+
+        with self.assertRaises(Exception):
+            service._quota_guarded(service._submit_transactions)(["tx"], "redeem")
+        service.submit_error = None
+        with self.assertRaisesRegex(Exception, "about 120 seconds"):
+            service._quota_guarded(service._submit_transactions)(["tx"], "redeem")
+
+
+class SubmissionSchedulerTest(unittest.TestCase):
+    def test_flush_packs_mixed_work_into_full_bundles_within_quota(self):
+        tracker = RelayerQuotaTracker(capacity=2, clock=FakeClock())
+        service = QuotaWeb3Service(tracker)
+        scheduler = SubmissionScheduler(service, max_batch_size=2, wrap_redeemed_collateral=False)
+        scheduler.queue_redeem(["0x1", "0x2", "0x3", "0x1"])
+        scheduler.queue_merge(
+            [{"condition_id": "0xm1", "amount": 1}, {"condition_id": "0xm2", "amount": 1}]
+        )
+        scheduler.queue_split(
+            [{"condition_id": "0xs1", "amount": 1}, {"condition_id": "0xs2", "amount": 1}]
+        )
+
+        result = scheduler.flush()
+
+        # Two tokens buy two full bundles; a redeem and a merge share the second.
+        self.assertEqual(
+            service.submitted,
+            [["redeem:0x1", "redeem:0x2"], ["redeem:0x3", "merge:0xm1"]],
+        )
+        self.assertEqual(result.submitted_count, 2)
+        self.assertEqual(tracker.available("0xSigner"), 0)
+        self.assertEqual(result.success_list[1].actions, ["redeem", "merge"])
+        self.assertEqual(result.deferred_count, 3)
+        self.assertEqual(scheduler.pending(), {"redeem": 0, "merge": 1, "split": 2})
+
+    def test_force_flush_sends_partial_bundle(self):
+        service = QuotaWeb3Service(RelayerQuotaTracker(capacity=10, clock=FakeClock()))
+        scheduler = SubmissionScheduler(service, max_batch_size=5, wrap_redeemed_collateral=False)
+        scheduler.queue_redeem("0x1")
+
+        self.assertEqual(scheduler.flush().submitted_count, 0)
+        self.assertEqual(scheduler.pending()["redeem"], 1)
+        result = scheduler.flush(force=True)
+
+        self.assertEqual(service.submitted, [["redeem:0x1"]])
+        self.assertEqual(result.success_list[0].condition_ids, ["0x1"])
+        self.assertEqual(result.deferred_count, 0)
+
+    def test_flush_sends_last_bundle_once_it_is_full_by_gas(self):
+        service = QuotaWeb3Service(RelayerQuotaTracker(capacity=10, clock=FakeClock()))
+        # Two default-gas redeems fill the budget well before max_batch_size txs.
+        scheduler = SubmissionScheduler(
+            service, max_batch_size=20, gas_budget=250_000, wrap_redeemed_collateral=False
+        )
+        scheduler.queue_redeem(["0x1", "0x2", "0x3", "0x4"])
+
+        result = scheduler.flush()
+
+        self.assertEqual(
+            service.submitted,
+            [["redeem:0x1", "redeem:0x2"], ["redeem:0x3", "redeem:0x4"]],
+        )
+        self.assertEqual(result.deferred_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
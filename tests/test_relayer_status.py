@@ -0,0 +1,161 @@
+import unittest
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from poly_web3.const import STATE_CONFIRMED, STATE_FAILED, STATE_MINED
+from poly_web3.web3_service.relayer_status import RelayerStatusTracker
+
+
+class FakeRelayer:
+    def __init__(self):
+        self.states: dict[str, str] = {}
+        self.listed: set[str] = set()
+        self.bulk_calls = 0
+        self.single_calls: list[str] = []
+
+    def fetch_transactions(self):
+        self.bulk_calls += 1
+        return [
+            {"transactionID": transaction_id, "state": self.states[transaction_id]}
+            for transaction_id in self.listed
+        ]
+
+    def fetch_transaction(self, transaction_id):
+        self.single_calls.append(transaction_id)
+        state = self.states.get(transaction_id)
+        return [{"transactionID": transaction_id, "state": state}] if state else []
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RelayerStatusTrackerTest(unittest.TestCase):
+    def setUp(self):
+        self.relayer = FakeRelayer()
+        self.clock = FakeClock()
+        self.tracker = RelayerStatusTracker(
+            self.relayer.fetch_transactions,
+            self.relayer.fetch_transaction,
+            min_interval=1,
+            max_interval=4,
+            backoff=2,
+            timeout=60,
+            clock=self.clock,
+            background=False,
+        )
+
+    def test_one_request_resolves_every_listed_transaction(self):
+        futures = {
+            transaction_id: self.tracker.track(transaction_id)
+            for transaction_id in ("a", "b", "c")
+        }
+        self.relayer.states = {"a": STATE_MINED, "b": STATE_CONFIRMED, "c": STATE_FAILED}
+        self.relayer.listed = {"a", "b", "c"}
+
+        self.tracker.poll_once()
+
+        self.assertEqual(self.relayer.bulk_calls, 1)
+        self.assertEqual(self.relayer.single_calls, [])
+        self.assertEqual(futures["a"].result(0)["state"], STATE_MINED)
+        self.assertEqual(futures["b"].result(0)["state"], STATE_CONFIRMED)
+        self.assertIsNone(futures["c"].result(0))
+        self.assertEqual(self.tracker.in_flight(), [])
+
+    def test_unlisted_transactions_fall_back_after_repeated_misses(self):
+        future = self.tracker.track("a")
+        self.relayer.states = {"a": STATE_MINED}
+
+        self.tracker.poll_once()
+        self.tracker.poll_once()
+        self.assertEqual(self.relayer.single_calls, [])
+
+        self.tracker.poll_once()
+        self.assertEqual(self.relayer.single_calls, ["a"])
+        self.assertEqual(future.result(0)["state"], STATE_MINED)
+
+    def test_single_lookups_are_capped_and_rate_limited(self):
+        self.tracker.max_lookups_per_poll = 2
+        for transaction_id in ("a", "b", "c"):
+            self.tracker.track(transaction_id)
+
+        for _ in range(3):
+            self.tracker.poll_once()
+        self.assertEqual(len(self.relayer.single_calls), 2)
+
+        self.tracker.poll_once()
+        self.assertEqual(len(self.relayer.single_calls), 3)
+
+        self.tracker.poll_once()
+        self.assertEqual(len(self.relayer.single_calls), 3)
+
+        self.clock.now = 4
+        self.tracker.poll_once()
+        self.assertEqual(len(self.relayer.single_calls), 5)
+
+    def test_futures_resolve_outside_the_lock(self):
+        future = self.tracker.track("a")
+        self.relayer.states = {"a": STATE_MINED, "b": STATE_MINED}
+        self.relayer.listed = {"a"}
+        future.add_done_callback(lambda _: self.tracker.track("b"))
+
+        self.tracker.poll_once()
+
+        self.assertEqual(future.result(0)["state"], STATE_MINED)
+        self.assertEqual(self.tracker.in_flight(), ["b"])
+
+    def test_interval_backs_off_until_a_state_changes(self):
+        future = self.tracker.track("a")
+        self.tracker.poll_once()
+        self.tracker.poll_once()
+        self.tracker.poll_once()
+        self.assertEqual(self.tracker.interval, 4)
+
+        self.relayer.states = {"a": "STATE_EXECUTED"}
+        self.relayer.listed = {"a"}
+        self.tracker.poll_once()
+        self.assertEqual(self.tracker.interval, 1)
+        self.assertFalse(future.done())
+
+        self.clock.now = 61
+        self.tracker.poll_once()
+        self.assertIsNone(future.result(0))
+
+    def test_background_thread_confirms_waiters(self):
+        self.relayer.states = {"a": STATE_MINED}
+        self.relayer.listed = {"a"}
+        tracker = RelayerStatusTracker(
+            self.relayer.fetch_transactions, min_interval=0.01, max_interval=0.05
+        )
+
+        self.assertEqual(tracker.wait("a")["state"], STATE_MINED)
+
+    def test_from_clients_polls_the_relayer_clients_url(self):
+        urls = []
+        api_client = SimpleNamespace(
+            relayer_url="https://default-relayer",
+            get_relayer_transactions=lambda headers, relayer_url: urls.append(relayer_url) or [],
+            get_relayer_transaction=lambda transaction_id, relayer_url: urls.append(relayer_url) or [],
+        )
+        relayer_client = SimpleNamespace(
+            relayer_url="https://custom-relayer",
+            _generate_builder_headers=lambda method, path: {},
+        )
+        tracker = RelayerStatusTracker.from_clients(api_client, relayer_client, background=False)
+
+        tracker.track("a")
+        for _ in range(RelayerStatusTracker.DEFAULT_MISSES_BEFORE_LOOKUP):
+            tracker.poll_once()
+
+        self.assertEqual(urls, ["https://custom-relayer"] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
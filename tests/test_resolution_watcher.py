@@ -0,0 +1,180 @@
+import unittest
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+from eth_abi import encode
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from poly_web3.schema import RedeemErrorItem, RedeemResult
+from poly_web3.web3_service.base import BaseWeb3Service
+from poly_web3.web3_service.position_index import CONDITION_RESOLUTION_TOPIC
+from poly_web3.web3_service.resolution_cache import ResolutionCache
+from poly_web3.web3_service.resolution_watcher import ResolutionWatcher
+
+RESOLVED = "0x" + "11" * 32
+OPEN_A = "0x" + "22" * 32
+OPEN_B = "0x" + "33" * 32
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class WatcherWeb3Service(BaseWeb3Service):
+    def __init__(self):
+        self.head = 1000
+        self.logs: list[dict] = []
+        self.log_requests: list[dict] = []
+        self.redeemed: list[tuple[str, list[str]]] = []
+        self.redeem_error: Exception | None = None
+        self.failing: set[str] = set()
+        self.resolution_cache = ResolutionCache()
+        self.api_client = SimpleNamespace(batch_rpc=self._batch_rpc)
+
+    def _batch_rpc(self, calls):
+        results = []
+        for method, params in calls:
+            if method == "eth_blockNumber":
+                results.append(hex(self.head))
+                continue
+            self.log_requests.append(params[0])
+            wanted = params[0]["topics"][1]
+            results.append([log for log in self.logs if log["topics"][1] in wanted])
+        return results
+
+    def get_payout_vectors(self, condition_ids):
+        return {
+            condition_id: (1, [1, 0]) if condition_id == RESOLVED else (0, [])
+            for condition_id in condition_ids
+        }
+
+    def _fetch_positions_by_condition_ids(self, condition_ids, user_address=None):
+        return [
+            {"conditionId": condition_id}
+            for condition_id in condition_ids
+            if condition_id != OPEN_B
+        ]
+
+    def _redeem_from_positions(self, positions, batch_size, wrap_redeemed_collateral=True):
+        if self.redeem_error is not None:
+            raise self.redeem_error
+        condition_ids = [pos["conditionId"] for pos in positions]
+        self.redeemed.append(("positions", condition_ids))
+        return RedeemResult(
+            error_list=[
+                RedeemErrorItem(condition_id=condition_id, error="reverted")
+                for condition_id in condition_ids
+                if condition_id in self.failing
+            ]
+        )
+
+    def _redeem_conditions_from_chain(self, condition_ids, batch_size, **kwargs):
+        self.redeemed.append(("chain", list(condition_ids)))
+        return RedeemResult()
+
+
+def _resolution_log(condition_id: str) -> dict:
+    return {
+        "topics": [CONDITION_RESOLUTION_TOPIC, condition_id],
+        "data": "0x" + encode(["uint256", "uint256[]"], (2, [0, 1])).hex(),
+    }
+
+
+class ResolutionWatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.service = WatcherWeb3Service()
+        self.clock = FakeClock()
+        self.watcher = ResolutionWatcher(
+            self.service,
+            debounce_sec=30,
+            max_batch_size=10,
+            confirmations=0,
+            clock=self.clock,
+        )
+
+    def test_watch_queues_conditions_that_already_resolved(self):
+        self.watcher.watch([RESOLVED, OPEN_A])
+
+        self.assertEqual(self.watcher.pending(), [RESOLVED])
+        self.assertEqual(self.watcher.watched(), [OPEN_A])
+
+    def test_poll_queues_new_resolutions_and_flush_is_debounced(self):
+        self.watcher.watch([OPEN_A, OPEN_B])
+        self.watcher.poll()
+        self.service.head = 1010
+        self.service.logs = [_resolution_log(OPEN_A), _resolution_log(OPEN_B)]
+
+        self.assertEqual(self.watcher.poll(), [OPEN_A, OPEN_B])
+        self.assertEqual(self.service.log_requests[-1]["fromBlock"], hex(1001))
+        self.assertEqual(self.service.resolution_cache.get(OPEN_A), (1, [0, 1]))
+        self.assertIsNone(self.watcher.flush())
+
+        self.clock.now = 30
+        self.assertIsNotNone(self.watcher.flush())
+
+        self.assertEqual(
+            self.service.redeemed,
+            [("positions", [OPEN_A]), ("chain", [OPEN_B])],
+        )
+        self.assertEqual(self.watcher.pending(), [])
+        self.assertEqual(self.watcher.watched(), [])
+
+    def test_position_index_poll_drops_conditions_lost_on_every_outcome(self):
+        self.watcher.watch([OPEN_A, OPEN_B])
+        self.service.position_index = SimpleNamespace(
+            sync=lambda: 1010,
+            positions=lambda: [
+                {"conditionId": OPEN_A, "redeemable": True, "payoutNumerator": 1},
+                {"conditionId": OPEN_B, "redeemable": True, "payoutNumerator": 0},
+            ],
+        )
+
+        self.assertEqual(self.watcher.poll(), [OPEN_A])
+        self.assertEqual(self.watcher.pending(), [OPEN_A])
+        self.assertEqual(self.watcher.watched(), [])
+
+    def test_full_queue_flushes_without_waiting(self):
+        self.watcher.max_batch_size = 1
+        self.watcher.watch(RESOLVED)
+
+        self.assertIsNotNone(self.watcher.flush())
+        self.assertEqual(self.service.redeemed, [("positions", [RESOLVED])])
+
+    def test_failed_redeems_are_retried_with_backoff(self):
+        self.watcher.retry_backoff_sec = 40
+        self.service.failing = {RESOLVED}
+        self.watcher.watch([RESOLVED])
+
+        self.assertIsNotNone(self.watcher.flush(force=True))
+        self.assertEqual(self.watcher.pending(), [RESOLVED])
+        self.clock.now = 35
+        self.assertIsNone(self.watcher.flush())
+
+        self.clock.now = 41
+        self.service.failing = set()
+        self.assertIsNotNone(self.watcher.flush())
+        self.assertEqual(self.service.redeemed[-1], ("positions", [RESOLVED]))
+        self.assertEqual(self.watcher.pending(), [])
+
+    def test_raising_redeem_requeues_until_retries_run_out(self):
+        self.watcher.max_retries = 1
+        self.watcher.retry_backoff_sec = 0
+        self.service.redeem_error = Exception("relayer down")
+        self.watcher.watch([RESOLVED])
+
+        with self.assertRaisesRegex(Exception, "relayer down"):
+            self.watcher.flush(force=True)
+        self.assertEqual(self.watcher.pending(), [RESOLVED])
+        with self.assertRaisesRegex(Exception, "relayer down"):
+            self.watcher.flush(force=True)
+        self.assertEqual(self.watcher.pending(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import json
+import threading
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from web3 import Web3
+
+from poly_web3.web3_service.api_client import PolymarketAPIClient
+from poly_web3.web3_service.rpc_pool import PooledHTTPProvider, RpcEndpointPool
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, payload=None):
+        self.status_code = status_code
+        self.payload = payload if payload is not None else {"jsonrpc": "2.0", "id": 1, "result": "0x5208"}
+
+    @property
+    def content(self):
+        return json.dumps(self.payload).encode()
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise Exception(f"HTTP {self.status_code}")
+
+    def json(self):
+        return self.payload
+
+
+class FakeRpcSession:
+    def __init__(self, statuses=None, blockers=None):
+        self.statuses = statuses or {}
+        self.blockers = blockers or {}
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def post(self, url, timeout=None, **kwargs):
+        with self.lock:
+            self.calls.append(url)
+        if url in self.blockers:
+            self.blockers[url].wait(5)
+        return FakeResponse(self.statuses.get(url, 200))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RpcEndpointPoolTest(unittest.TestCase):
+    def test_fails_over_on_429_and_cools_the_endpoint_down(self):
+        session = FakeRpcSession(statuses={"https://a": 429})
+        clock = FakeClock()
+        pool = RpcEndpointPool(["https://a", "https://b"], session=session, clock=clock)
+
+        response = pool.request({"method": "eth_blockNumber"}, hedge=False)
+
+        self.assertEqual(response.json()["result"], "0x5208")
+        self.assertEqual(session.calls, ["https://a", "https://b"])
+        self.assertEqual(pool.ranked(), ["https://b", "https://a"])
+        clock.now += pool.cooldown_sec + 1
+        self.assertEqual(pool.ranked()[0], "https://b")  # measured beats unmeasured
+
+    def test_ranks_healthy_endpoints_by_ewma_latency(self):
+        pool = RpcEndpointPool(["https://a", "https://b"], session=FakeRpcSession())
+        pool.record_success("https://a", 0.5)
+        pool.record_success("https://b", 0.1)
+        self.assertEqual(pool.ranked(), ["https://b", "https://a"])
+
+        pool.record_success("https://a", 0.0)
+        pool.record_success("https://a", 0.0)
+        self.assertAlmostEqual(pool.latency("https://a"), 0.245)
+
+    def test_hedged_read_returns_backup_when_leader_is_slow(self):
+        release = threading.Event()
+        session = FakeRpcSession(blockers={"https://slow": release})
+        pool = RpcEndpointPool(["https://slow", "https://fast"], session=session, hedge_delay=0.01)
+
+        try:
+            pool.request({"method": "eth_call"})
+            self.assertEqual(session.calls, ["https://slow", "https://fast"])
+            self.assertIsNone(pool.latency("https://slow"))
+            self.assertIsNotNone(pool.latency("https://fast"))
+        finally:
+            release.set()
+
+    def test_web3_and_api_client_share_the_pool(self):
+        session = FakeRpcSession(statuses={"https://a": 503})
+        client = PolymarketAPIClient(rpc_url=["https://a", "https://b"], session=session)
+        w3 = Web3(PooledHTTPProvider(client.rpc_pool))
+
+        self.assertEqual(client.estimate_gas({"to": "0xctf", "data": "0x"}), "21000")
+        self.assertEqual(w3.eth.estimate_gas({"to": "0x" + "11" * 20, "data": "0x"}), 21000)
+        self.assertEqual(session.calls.count("https://a"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+from eth_keys import keys
+from eth_utils import to_bytes
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from poly_web3.signature import secp256k1
+from poly_web3.signature.build import create_struct_hash
+from poly_web3.signature.hash_message import hash_message
+from poly_web3.web3_service.proxy_service import ProxyWeb3Service
+
+PRIVATE_KEY = "0x" + "4c" * 32
+STRUCT_ARGS = (
+    "0x" + "11" * 20,
+    "0x" + "22" * 20,
+    "0xdeadbeef",
+    "0",
+    "30000000000",
+    "250000",
+    "7",
+    "0x" + "33" * 20,
+    "0x" + "44" * 20,
+)
+
+
+def legacy_signature(tx_hash: str) -> str:
+    message = {"raw": list(to_bytes(hexstr=tx_hash))}
+    r, s, recovery = secp256k1.sign(hash_message(message)[2:], PRIVATE_KEY)
+    return secp256k1.serialize_signature(
+        r=secp256k1.int_to_hex(r, 32),
+        s=secp256k1.int_to_hex(s, 32),
+        v=28 if recovery else 27,
+        yParity=recovery,
+    )
+
+
+class StubProxyWeb3Service(ProxyWeb3Service):
+    def __init__(self):
+        self.clob_client = SimpleNamespace(signer=SimpleNamespace(private_key=PRIVATE_KEY))
+        self.wallet_type = SimpleNamespace(value="PROXY")
+
+    def get_contract_config(self) -> dict:
+        return {"ProxyContracts": {"ProxyFactory": STRUCT_ARGS[1], "RelayHub": STRUCT_ARGS[7]}}
+
+    def estimate_gas(self, tx: dict) -> str:
+        return STRUCT_ARGS[5]
+
+
+class SignerTest(unittest.TestCase):
+    def test_struct_hash_bytes_match_hex(self):
+        self.assertEqual(
+            "0x" + create_struct_hash(*STRUCT_ARGS, output="bytes").hex(),
+            create_struct_hash(*STRUCT_ARGS),
+        )
+
+    def test_eth_keys_backend_matches_legacy_path(self):
+        signer = secp256k1.Signer(PRIVATE_KEY, backend="eth_keys")
+        for nonce in range(5):
+            tx_hash = create_struct_hash(*STRUCT_ARGS[:6], str(nonce), *STRUCT_ARGS[7:])
+            self.assertEqual(
+                signer.sign_message(bytes.fromhex(tx_hash[2:])), legacy_signature(tx_hash)
+            )
+
+    @unittest.skipIf(secp256k1.coincurve is None, "coincurve is not installed")
+    def test_coincurve_backend_matches_eth_keys(self):
+        fast = secp256k1.Signer(PRIVATE_KEY, backend="coincurve")
+        slow = secp256k1.Signer(PRIVATE_KEY, backend="eth_keys")
+        message = create_struct_hash(*STRUCT_ARGS, output="bytes")
+        self.assertEqual(fast.sign_message(message), slow.sign_message(message))
+
+    def test_signature_recovers_signer_address(self):
+        message = create_struct_hash(*STRUCT_ARGS, output="bytes")
+        signature = secp256k1.Signer(PRIVATE_KEY).sign_message(message, to="bytes")
+        recovered = keys.Signature(signature[:64] + bytes([signature[64] - 27]))
+        self.assertEqual(
+            recovered.recover_public_key_from_msg_hash(
+                hash_message({"raw": message}, to="bytes")
+            ).to_checksum_address(),
+            keys.PrivateKey(bytes.fromhex(PRIVATE_KEY[2:])).public_key.to_checksum_address(),
+        )
+
+    def test_proxy_request_reuses_cached_signer(self):
+        service = StubProxyWeb3Service()
+        args = {"from": STRUCT_ARGS[0], "data": STRUCT_ARGS[2], "nonce": STRUCT_ARGS[6],
+                "gasPrice": STRUCT_ARGS[4], "relay": STRUCT_ARGS[8]}
+
+        first = service.build_proxy_transaction_request(args)
+        signer = service._signer
+        second = service.build_proxy_transaction_request(args)
+
+        self.assertIs(service._signer, signer)
+        self.assertEqual(first["signature"], second["signature"])
+        self.assertEqual(first["signature"], legacy_signature(create_struct_hash(*STRUCT_ARGS)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import threading
+import unittest
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from poly_web3.schema import RedeemResult
+from poly_web3.web3_service.base import BaseWeb3Service
+from poly_web3.web3_service.submission import (
+    STATE_COMPLETED,
+    STATE_FAILED,
+    STATE_SUBMITTED,
+)
+
+
+class SubmittingWeb3Service(BaseWeb3Service):
+    """Relayer accepts at once and confirms only when the test releases it."""
+
+    def __init__(self, positions: list[dict]):
+        self.pipeline_depth = 1
+        self.batch_gas_limit = None
+        self.isolate_failed_batches = False
+        self.release = threading.Event()
+        self.api_client = SimpleNamespace(
+            fetch_redeemable_positions=lambda user_address: positions
+        )
+
+    def _resolve_user_address(self):
+        return "0xwallet"
+
+    def _build_redeem_tx(self, to: str, data: str):
+        return {"to": to, "data": data}
+
+    def build_ctf_redeem_tx_data(self, condition_id, *args, **kwargs) -> str:
+        return condition_id
+
+    def _send_transactions(self, txs, metadata: str):
+        return SimpleNamespace(transaction_id=f"tx-{txs[0]['data']}")
+
+    def _wait_transactions(self, pending):
+        if not self.release.wait(timeout=5):
+            raise Exception("timed out")
+        return {"transactionID": pending.transaction_id}
+
+
+class SubmissionHandleTest(unittest.TestCase):
+    def test_submit_returns_after_relayer_accepts_and_completes_later(self):
+        service = SubmittingWeb3Service([{"conditionId": "0x1", "negativeRisk": False}])
+        done = []
+
+        handle = service.submit_redeem_all(wrap_redeemed_collateral=False)
+        handle.add_done_callback(done.append)
+
+        self.assertEqual(handle.state, STATE_SUBMITTED)
+        self.assertEqual(handle.transaction_ids, ["tx-0x1"])
+        self.assertFalse(handle.done())
+
+        service.release.set()
+        result = handle.wait(timeout=5)
+
+        self.assertIsInstance(result, RedeemResult)
+        self.assertEqual(result.success_list, [{"transactionID": "tx-0x1"}])
+        self.assertEqual(handle.state, STATE_COMPLETED)
+        self.assertEqual(done, [handle])
+
+    def test_action_without_submission_completes_immediately(self):
+        service = SubmittingWeb3Service([])
+
+        handle = service.submit_redeem_all()
+
+        self.assertEqual(handle.wait(timeout=5).success_list, [])
+        self.assertEqual(handle.transaction_ids, [])
+
+    def test_failed_action_raises_from_wait(self):
+        service = SubmittingWeb3Service([])
+        service.api_client = SimpleNamespace()
+
+        handle = service.submit_redeem_all()
+
+        with self.assertRaises(AttributeError):
+            handle.wait(timeout=5)
+        self.assertEqual(handle.state, STATE_FAILED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from poly_web3.schema import WalletType
+from poly_web3.web3_service.base import BaseWeb3Service
+from poly_web3.web3_service.gas_batcher import GasModel
+from poly_web3.web3_service.transaction_plan import TransactionPlan
+
+
+class PlanWeb3Service(BaseWeb3Service):
+    def __init__(self):
+        self.wallet_type = WalletType.PROXY
+        self.submitted: list[tuple[list, str]] = []
+        self.fail_submit_calls: set[int] = set()
+        self.api_client = SimpleNamespace(
+            fetch_positions_by_condition_ids=lambda user_address, condition_ids: [
+                {"conditionId": cid, "negativeRisk": cid == "0xneg", "outcomeIndex": 0, "size": 1.0}
+                for cid in condition_ids
+                if cid != "0xmissing"
+            ]
+        )
+
+    def _resolve_user_address(self):
+        return "0xuser"
+
+    def _build_redeem_tx(self, to: str, data: str):
+        return {"to": to, "data": data}
+
+    def build_ctf_redeem_tx_data(self, condition_id, *args, **kwargs) -> str:
+        return f"redeem:{condition_id}"
+
+    def build_neg_risk_redeem_tx_data(self, condition_id, *args, **kwargs) -> str:
+        return f"negredeem:{condition_id}"
+
+    def build_ctf_merge_tx_data(self, condition_id, *args, **kwargs) -> str:
+        return f"merge:{condition_id}"
+
+    def build_erc20_approve_tx_data(self, *args, **kwargs) -> str:
+        return "approve"
+
+    def build_pusd_wrap_tx_data(self, *args, **kwargs) -> str:
+        return "wrap"
+
+    def get_redeemable_payout_amounts(self, condition_ids, *args, **kwargs) -> dict:
+        return {condition_id: 1_000_000 for condition_id in condition_ids}
+
+    def prefetch_negative_risk_flags(self, condition_ids):
+        return {condition_id: False for condition_id in condition_ids}
+
+    def _submit_transactions(self, txs, metadata: str):
+        self.submitted.append(([tx["data"] for tx in txs], metadata))
+        if len(self.submitted) in self.fail_submit_calls:
+            raise Exception("relayer rejected bundle")
+        return {"state": "STATE_MINED"}
+
+
+class TransactionPlanTest(unittest.TestCase):
+    def test_mixed_actions_share_one_submission_with_wrap_last(self):
+        service = PlanWeb3Service()
+        plan = service.transaction_plan()
+        plan.add_redeem(["0xa", "0xneg", "0xmissing"])
+        plan.add_merge_batch([{"condition_id": "0xm", "amount": 1}])
+
+        result = plan.submit()
+
+        self.assertEqual(
+            service.submitted,
+            [(["redeem:0xa", "negredeem:0xneg", "merge:0xm", "approve", "wrap"], "bundle")],
+        )
+        self.assertEqual(result.success_list[0].actions, ["redeem", "merge", "wrap"])
+        self.assertEqual(result.success_list[0].condition_ids, ["0xa", "0xneg", "0xm"])
+        self.assertEqual(result.error_condition_ids, ["0xmissing"])
+
+    def test_bundle_respects_gas_budget_and_maps_errors_to_conditions(self):
+        service = PlanWeb3Service()
+        service.fail_submit_calls = {2}
+        plan = TransactionPlan(service)
+        for condition_id in ("0x1", "0x2", "0x3"):
+            plan.add("redeem", [{"data": condition_id}], [condition_id], gas=400_000)
+
+        bundles = plan.bundle(gas_budget=800_000)
+        result = plan.submit(gas_budget=800_000)
+
+        self.assertEqual([bundle.condition_ids for bundle in bundles], [["0x1", "0x2"], ["0x3"]])
+        self.assertEqual(result.success_list[0].condition_ids, ["0x1", "0x2"])
+        self.assertEqual(result.error_condition_ids, ["0x3"])
+
+    def test_each_bundle_wraps_only_its_own_redeems(self):
+        service = PlanWeb3Service()
+        service.fail_submit_calls = {2}
+        plan = TransactionPlan(service)
+        plan.add_redeem(["0x1", "0x2", "0x3"])
+        gas_budget = 2 * plan.units[0].gas + plan.gas_model.predict(plan.WRAP_TX_TYPES)
+
+        result = plan.submit(gas_budget=gas_budget)
+
+        self.assertEqual(
+            [txs for txs, _ in service.submitted],
+            [["redeem:0x1", "redeem:0x2", "approve", "wrap"], ["redeem:0x3", "approve", "wrap"]],
+        )
+        self.assertEqual(result.success_list[0].condition_ids, ["0x1", "0x2"])
+        self.assertEqual(result.error_condition_ids, ["0x3"])
+
+    def test_unit_gas_comes_from_service_gas_model(self):
+        service = PlanWeb3Service()
+        service.gas_model = GasModel({"redeem": 111, "neg_risk_redeem": 333, "merge": 555})
+        plan = TransactionPlan(service)
+        plan.add_redeem(["0xa", "0xneg"])
+        plan.add_merge_batch([{"condition_id": "0xm", "amount": 1}])
+
+        self.assertEqual([unit.gas for unit in plan.units], [111, 333, 555])
+
+    def test_eoa_wallet_is_rejected(self):
+        with self.assertRaises(ImportError):
+            TransactionPlan(SimpleNamespace(wallet_type=WalletType.EOA))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from poly_web3.const import DATA_API_POSITIONS_URL, RELAYER_URL
+from poly_web3.web3_service.api_client import PolymarketAPIClient
+from poly_web3.web3_service.transport import HttpTransport
+
+
+class HttpTransportTest(unittest.TestCase):
+    def test_clients_share_the_default_transport_session(self):
+        first = PolymarketAPIClient()
+        second = PolymarketAPIClient(rpc_url="https://rpc.example")
+
+        self.assertIs(first.session, HttpTransport.default().session)
+        self.assertIs(first.session, second.session)
+
+    def test_only_rpc_posts_are_retried(self):
+        transport = HttpTransport(rpc_urls=["https://rpc.example"])
+
+        rpc_retry = transport.session.get_adapter("https://rpc.example").max_retries
+        relayer_retry = transport.session.get_adapter(f"{RELAYER_URL}/submit").max_retries
+        data_api_retry = transport.session.get_adapter(DATA_API_POSITIONS_URL).max_retries
+
+        self.assertIn("POST", rpc_retry.allowed_methods)
+        self.assertNotIn("POST", relayer_retry.allowed_methods)
+        self.assertIn("GET", data_api_retry.allowed_methods)
+        self.assertIn(429, data_api_retry.status_forcelist)
+
+    def test_timeouts_per_endpoint_class_unless_overridden(self):
+        transport = HttpTransport(timeouts={"relayer": 30, "gamma": 4})
+
+        client = PolymarketAPIClient(transport=transport)
+        self.assertEqual(client._timeout("relayer"), 30)
+        self.assertEqual(client._timeout("gamma"), 4)
+
+        client = PolymarketAPIClient(transport=transport, timeout=7)
+        self.assertEqual(client._timeout("relayer"), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()